@@ -0,0 +1,258 @@
+#
+# NumPy batch simulator: N independent games advanced together.
+# Ball, paddle and block state for every game live in arrays and each step is
+# a handful of vectorised operations. The rules mirror the discrete path of
+# `Simulation.step`: `collisionManager.check_ball_walls`, `check_ball_bottom`,
+# `check_ball_paddle` (with `Ball.bounce_from_paddle`) and `check_ball_blocks`.
+# Requires numpy, which the interactive game does not need.
+#
+from typing import List, Sequence, Union
+import numpy as np
+from Core import config
+from Objects.level import Level
+
+#
+# Per-game state codes
+#
+PLAYING = 0
+LEVEL_COMPLETE = 1
+GAME_OVER = 2
+
+
+class BatchSimulation:
+    #
+    # `levels` is one Level shared by every game or a sequence with one Level
+    # per game. `ball_speed` and `paddle_width` may be scalars or per-game arrays.
+    #
+    def __init__(self, levels: Union[Level, Sequence[Level]], n_games: int = None,
+                 ball_speed=None, paddle_width=None, lives: int = 3):
+        if isinstance(levels, Level):
+            layouts: List[Level] = [levels]
+            n = int(n_games or 1)
+        else:
+            layouts = list(levels)
+            n = len(layouts)
+            if n_games is not None and n_games != n:
+                raise ValueError(f"n_games={n_games} does not match {n} levels")
+        self.n = n
+        self.start_lives = lives
+
+        #
+        # Block layout: (1, B) when shared so it broadcasts against (N, B),
+        # otherwise (N, B) padded with dead blocks
+        #
+        b = max((len(level.field) for level in layouts), default=0)
+        rows = len(layouts)
+        self.block_x = np.zeros((rows, b))
+        self.block_y = np.zeros((rows, b))
+        self.block_w = np.zeros((rows, b))
+        self.block_h = np.zeros((rows, b))
+        self.block_score = np.zeros((rows, b), dtype=np.int64)
+        self.block_hp0 = np.zeros((rows, b), dtype=np.int32)
+        for row, level in enumerate(layouts):
+            field = level.field
+            count = len(field)
+            alive = np.frombuffer(field.alive, dtype=np.uint8).astype(bool)
+            self.block_x[row, :count] = np.frombuffer(field.x, dtype=np.intc)
+            self.block_y[row, :count] = np.frombuffer(field.y, dtype=np.intc)
+            self.block_w[row, :count] = np.frombuffer(field.width, dtype=np.intc)
+            self.block_h[row, :count] = np.frombuffer(field.height, dtype=np.intc)
+            self.block_score[row, :count] = np.frombuffer(field.score, dtype=np.intc)
+            self.block_hp0[row, :count] = np.where(alive, np.frombuffer(field.hp, dtype=np.intc), 0)
+        self.block_bottom = (self.block_y + self.block_h).max(axis=1) if b else np.zeros(rows)
+
+        #
+        # Paddle and ball
+        #
+        self.radius = config.BALL_RADIUS
+        self.paddle_y = float(config.SCREEN_HEIGHT - 40)
+        self.paddle_height = config.PADDLE_HEIGHT
+        self.paddle_speed = float(config.PADDLE_SPEED)
+        self.paddle_width = np.broadcast_to(
+            np.asarray(paddle_width if paddle_width is not None else config.PADDLE_WIDTH, dtype=np.float64), (n,)
+        ).copy()
+        self.ball_speed = np.broadcast_to(
+            np.asarray(ball_speed if ball_speed is not None else config.BALL_SPEED, dtype=np.float64), (n,)
+        ).copy()
+
+        self.paddle_x = np.empty(n)
+        self.ball_x = np.empty(n)
+        self.ball_y = np.empty(n)
+        self.ball_vx = np.empty(n)
+        self.ball_vy = np.empty(n)
+        self.launched = np.empty(n, dtype=bool)
+        self.lives = np.empty(n, dtype=np.int32)
+        self.score = np.empty(n, dtype=np.int64)
+        self.state = np.empty(n, dtype=np.int8)
+        self.frames = np.empty(n, dtype=np.int64)
+        self.hp = np.empty((n, b), dtype=np.int32)
+        self.reset()
+
+    def reset(self) -> None:
+        self.paddle_x[:] = config.SCREEN_WIDTH / 2
+        self.launched[:] = False
+        self.place_balls_on_paddle(np.ones(self.n, dtype=bool))
+        self.lives[:] = self.start_lives
+        self.score[:] = 0
+        self.state[:] = PLAYING
+        self.frames[:] = 0
+        self.hp[:] = self.block_hp0
+
+    def place_balls_on_paddle(self, mask: np.ndarray) -> None:
+        self.ball_x[mask] = self.paddle_x[mask]
+        self.ball_y[mask] = self.paddle_y - self.paddle_height / 2 - self.radius - 2
+        self.ball_vx[mask] = 0.0
+        self.ball_vy[mask] = -1.0
+
+    #
+    # Vectorised `autoplay_action`: paddle direction per game so the ball
+    # meets the paddle `aim` half-widths off centre
+    #
+    def autoplay_directions(self, aim=0.25) -> np.ndarray:
+        offset = self.ball_x - aim * self.paddle_width / 2 - self.paddle_x
+        return np.where(np.abs(offset) < 2, 0.0, np.sign(offset))
+
+    #
+    # Advance every game still playing by `dt`. `direction` and `launch` are
+    # scalars or per-game arrays. Returns the per-game state codes.
+    #
+    def step(self, direction, launch, dt: float) -> np.ndarray:
+        active = self.state == PLAYING
+        if not active.any():
+            return self.state
+        self.frames[active] += 1
+        r = self.radius
+
+        #
+        # Paddle movement and clamp
+        #
+        half = self.paddle_width / 2
+        moved = self.paddle_x + np.asarray(direction, dtype=np.float64) * self.paddle_speed * dt
+        self.paddle_x = np.where(active, np.clip(moved, half, config.SCREEN_WIDTH - half), self.paddle_x)
+
+        #
+        # Balls waiting on the paddle: launch and stay put this step
+        #
+        waiting = active & ~self.launched
+        if waiting.any():
+            self.launched |= waiting & np.broadcast_to(np.asarray(launch, dtype=bool), (self.n,))
+            self.ball_x[waiting] = self.paddle_x[waiting]
+            self.ball_y[waiting] = self.paddle_y - self.paddle_height / 2 - r - 2
+            self.ball_vx[waiting] = 0.0
+            self.ball_vy[waiting] = -1.0
+        m = active & ~waiting
+
+        #
+        # Ball movement and walls
+        #
+        step = self.ball_speed * dt
+        x = np.where(m, self.ball_x + self.ball_vx * step, self.ball_x)
+        y = np.where(m, self.ball_y + self.ball_vy * step, self.ball_y)
+        vx = self.ball_vx
+        vy = self.ball_vy
+
+        left = m & (x - r <= 0)
+        x[left] = r
+        vx[left] = np.abs(vx[left])
+        right = m & (x + r >= config.SCREEN_WIDTH)
+        x[right] = config.SCREEN_WIDTH - r
+        vx[right] = -np.abs(vx[right])
+        top = m & (y - r <= 0)
+        y[top] = r
+        vy[top] = np.abs(vy[top])
+        self.ball_x = x
+        self.ball_y = y
+
+        #
+        # Bottom: life loss, ball back on the paddle or game over
+        #
+        lost = m & (y - r > config.SCREEN_HEIGHT)
+        if lost.any():
+            self.lives[lost] -= 1
+            over = lost & (self.lives <= 0)
+            self.state[over] = GAME_OVER
+            again = lost & ~over
+            self.launched[again] = False
+            self.place_balls_on_paddle(again)
+            m = m & ~lost
+
+        #
+        # Paddle: rect overlap (integer rects as in Ball.rect / Paddle.rect)
+        #
+        px = np.trunc(self.paddle_x - half)
+        py = np.trunc(self.paddle_y - self.paddle_height / 2)
+        pw = np.trunc(self.paddle_width)
+        bx = np.trunc(x - r)
+        by = np.trunc(y - r)
+        bw = r * 2
+        on_paddle = m & (vy > 0) & (bx < px + pw) & (bx + bw > px) & (by < py + self.paddle_height) & (by + bw > py)
+        if on_paddle.any():
+            rel = np.clip((x[on_paddle] - self.paddle_x[on_paddle]) / half[on_paddle], -1, 1)
+            angle = rel * 0.8
+            speed = np.hypot(vx[on_paddle], vy[on_paddle])
+            nvx = np.sin(angle) * speed
+            nvy = -np.abs(np.cos(angle)) * speed
+            mag = np.hypot(nvx, nvy)
+            mag[mag == 0] = 1.0
+            vx[on_paddle] = nvx / mag
+            vy[on_paddle] = nvy / mag
+            y[on_paddle] = py - r - 1
+
+        #
+        # Blocks: closest-point test against every live block of games whose
+        # ball is within reach of the block area
+        #
+        near = m & (y - r <= self.block_bottom)
+        if near.any() and self.hp.shape[1]:
+            idx = np.nonzero(near)[0]
+            shared = self.block_x.shape[0] == 1
+            rows = slice(None) if shared else idx
+            gx = self.block_x[rows]
+            gy = self.block_y[rows]
+            cx = np.clip(x[idx, None], gx, gx + self.block_w[rows])
+            cy = np.clip(y[idx, None], gy, gy + self.block_h[rows])
+            dx = x[idx, None] - cx
+            dy = y[idx, None] - cy
+            hp = self.hp[idx]
+            hit = (dx * dx + dy * dy <= r * r) & (hp > 0)
+            if hit.any():
+                hp -= hit
+                self.hp[idx] = hp
+                destroyed = hit & (hp <= 0)
+                self.score[idx] += (destroyed * self.block_score[rows]).sum(axis=1)
+                #
+                # Each hit flips one axis, so only the parity of the count matters
+                #
+                horizontal = (hit & (np.abs(dx) > np.abs(dy))).sum(axis=1)
+                vertical = hit.sum(axis=1) - horizontal
+                vx[idx] *= np.where(horizontal % 2, -1.0, 1.0)
+                vy[idx] *= np.where(vertical % 2, -1.0, 1.0)
+
+        #
+        # Level completion
+        #
+        cleared = (self.state == PLAYING) & ((self.hp > 0).sum(axis=1) == 0)
+        self.state[cleared] = LEVEL_COMPLETE
+        return self.state
+
+    @property
+    def completed(self) -> np.ndarray:
+        return self.state == LEVEL_COMPLETE
+
+    @property
+    def game_over(self) -> np.ndarray:
+        return self.state == GAME_OVER
+
+    @property
+    def blocks_left(self) -> np.ndarray:
+        return (self.hp > 0).sum(axis=1)
+
+    def results(self) -> dict:
+        return {
+            "score": self.score.copy(),
+            "lives": self.lives.copy(),
+            "completed": self.completed,
+            "game_over": self.game_over,
+            "frames": self.frames.copy(),
+            "blocks_left": self.blocks_left,
+        }
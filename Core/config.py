@@ -1,9 +1,35 @@
 #
 # Core configuration constants for Breakout
 #
+import os
+
 SCREEN_WIDTH = 800
 SCREEN_HEIGHT = 600
-FPS = 60
+FPS = 60  # render rate cap
+
+#
+# Fixed-step simulation: physics always advances in 1 / PHYSICS_HZ steps,
+# with at most MAX_PHYSICS_STEPS per rendered frame before the backlog is dropped
+#
+PHYSICS_HZ = 120
+MAX_PHYSICS_STEPS = 8
+
+#
+# Presentation: "flip" presents the whole screen every frame, "dirty" only
+# the regions that changed (for software display drivers)
+#
+PRESENT_MODE = "flip"
+
+#
+# Frame timing (F3 toggles the profiler overlay, F4 dumps the recorded frames)
+#
+FRAME_TIMER_FRAMES = 600  # frames kept in the ring buffer
+
+#
+# Rendered-text cache limits (UI.textCache)
+#
+TEXT_CACHE_BYTES = 4 * 1024 * 1024
+TEXT_CACHE_ENTRIES = 256
 
 #
 # Default tile size used by level files when not specified
@@ -24,9 +50,46 @@ BALL_RADIUS = 6
 BALL_SPEED = 300.0
 
 #
-# Assets / levels directory (relative to project root)
+# Collision mode: "swept" resolves contacts in time-of-impact order inside a
+# step, "discrete" moves the ball a full step and then tests for overlap.
+#
+COLLISION_MODE = "swept"
+SWEEP_MAX_CONTACTS = 8  # contacts resolved per step before the rest is dropped
+
+#
+# Multi-ball: balls served on the paddle per life, and the launch fan in
+# radians either side of straight up
+#
+BALLS = 1
+LAUNCH_SPREAD = 0.6
+
+#
+# Block-destruction particles (need numpy, skipped without it): pool size,
+# particles per burst at full quality, lifetime in seconds and gravity
+#
+PARTICLES = True
+PARTICLE_CAPACITY = 4096
+PARTICLE_BURST = 24
+PARTICLE_LIFE = 0.6
+PARTICLE_GRAVITY = 600.0
+
+#
+# Assets / levels directory and level pack (relative to project root). When
+# the pack file exists the game reads its levels from it instead of the
+# directory (build it with "python -m Tools.buildLevelPack").
+#
+LEVELS_DIR = os.path.join("Assets", "levels")
+LEVEL_PACK = os.path.join("Assets", "levels.pack")
+
+#
+# Compiled level cache, a folder inside each levels directory ("" disables it)
+#
+LEVEL_CACHE_DIR = ".cache"
+
+#
+# Parsed levels kept in memory by scoreManager (least recently used evicted)
 #
-LEVELS_DIR = "Assets\\levels\\"
+LEVEL_MEMORY_CACHE = 4
 
 # Game states
 GAME_STATES = {
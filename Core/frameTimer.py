@@ -0,0 +1,110 @@
+#
+# Per-phase frame timing.
+# Each frame, `Game.run` marks the end of every phase (events, input,
+# update, render, HUD, present) and the time since the previous mark is
+# stored in a fixed-size ring buffer, one row per frame. Nothing is
+# allocated while recording. When the timer is disabled the game loop skips
+# the marks entirely.
+#
+import json
+import math
+import time
+from array import array
+from typing import Dict, List, Sequence
+from Core import config
+
+PHASES = ("events", "input", "update", "render", "hud", "present")
+
+
+def percentile(values: Sequence[float], pct: float) -> float:
+    ordered = sorted(values)
+    if not ordered:
+        return 0.0
+    rank = max(1, math.ceil(pct / 100.0 * len(ordered)))
+    return ordered[rank - 1]
+
+
+class FrameTimer:
+    def __init__(self, capacity: int = None, phases: Sequence[str] = PHASES, enabled: bool = False):
+        self.capacity = int(capacity or config.FRAME_TIMER_FRAMES)
+        self.phases = tuple(phases)
+        self.index = {name: i for i, name in enumerate(self.phases)}
+        self.width = len(self.phases) + 1  # phases, then the whole frame
+        self.samples = array("d", bytes(8 * self.capacity * self.width))
+        self.enabled = enabled
+        self.frames = 0  # frames recorded in total
+        self.row = 0
+        self.frame_start = 0.0
+        self.last = 0.0
+
+    def begin_frame(self) -> None:
+        self.row = (self.frames % self.capacity) * self.width
+        for i in range(self.width):
+            self.samples[self.row + i] = 0.0
+        self.frame_start = self.last = time.perf_counter()
+
+    #
+    # End a phase: the time since the previous mark is added to it
+    #
+    def mark(self, phase: str) -> None:
+        now = time.perf_counter()
+        self.samples[self.row + self.index[phase]] += now - self.last
+        self.last = now
+
+    def end_frame(self) -> None:
+        self.samples[self.row + self.width - 1] = time.perf_counter() - self.frame_start
+        self.frames += 1
+
+    def clear(self) -> None:
+        self.frames = 0
+
+    def __len__(self) -> int:
+        return min(self.frames, self.capacity)
+
+    #
+    # Recorded rows, oldest first, in seconds: phases then the frame total
+    #
+    def rows(self) -> List[List[float]]:
+        count = len(self)
+        first = self.frames - count
+        rows = []
+        for f in range(first, self.frames):
+            start = (f % self.capacity) * self.width
+            rows.append(list(self.samples[start:start + self.width]))
+        return rows
+
+    #
+    # Whole-frame times, oldest first, of at most the `last` frames
+    #
+    def frame_times(self, last: int = None) -> List[float]:
+        count = len(self) if last is None else min(last, len(self))
+        total = self.width - 1
+        return [self.samples[(f % self.capacity) * self.width + total]
+                for f in range(self.frames - count, self.frames)]
+
+    #
+    # Frame-time percentiles and mean phase times, in milliseconds
+    #
+    def summary(self) -> Dict[str, float]:
+        rows = self.rows()
+        if not rows:
+            return {}
+        frames = [row[-1] for row in rows]
+        stats = {f"p{p}": percentile(frames, p) * 1e3 for p in (50, 95, 99)}
+        stats["max"] = max(frames) * 1e3
+        for i, name in enumerate(self.phases):
+            stats[name] = sum(row[i] for row in rows) / len(rows) * 1e3
+        return stats
+
+    def dump(self) -> dict:
+        return {
+            "phases": list(self.phases) + ["frame"],
+            "unit": "s",
+            "frames_recorded": self.frames,
+            "rows": self.rows(),
+            "summary_ms": self.summary(),
+        }
+
+    def dump_json(self, path: str) -> None:
+        with open(path, "w", encoding="utf-8") as fh:
+            json.dump(self.dump(), fh)
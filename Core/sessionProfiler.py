@@ -0,0 +1,110 @@
+#
+# Session profiling for --profile.
+# Keeps one cProfile.Profile per (game state, level) and switches between
+# them at frame boundaries, so the menu render paths and the PLAYING loop are
+# profiled separately. With memory tracing on, tracemalloc snapshots are
+# taken whenever the state or level changes and each segment's allocation
+# diff is added to that state's totals. close() writes one .pstats file and
+# one allocation report per state and level.
+#
+import cProfile
+import os
+import pstats
+import tracemalloc
+from typing import Dict, Optional, Tuple
+
+#
+# States that do not depend on a level are profiled without one
+#
+LEVEL_FREE_STATES = ("MENU", "LEVEL_SELECT")
+
+
+class SessionProfiler:
+    def __init__(self, out_dir: str, memory: bool = False, frames_per_trace: int = 25):
+        self.out_dir = out_dir
+        self.memory = memory
+        self.frames_per_trace = frames_per_trace
+        self.profiles: Dict[Tuple[str, Optional[int]], cProfile.Profile] = {}
+        self.frames: Dict[Tuple[str, Optional[int]], int] = {}
+        self.allocations: Dict[Tuple[str, Optional[int]], Dict[str, list]] = {}
+        self.key: Optional[Tuple[str, Optional[int]]] = None
+        self.current: Optional[cProfile.Profile] = None
+        self.snapshot = None
+        if memory and not tracemalloc.is_tracing():
+            tracemalloc.start(frames_per_trace)
+
+    #
+    # Called at the start of every frame with the active state and level
+    #
+    def switch(self, state, level: int) -> None:
+        name = state.name
+        key = (name, None if name in LEVEL_FREE_STATES else level)
+        self.frames[key] = self.frames.get(key, 0) + 1
+        if key == self.key:
+            return
+
+        if self.current is not None:
+            self.current.disable()
+        if self.memory:
+            self.record_allocations()
+        self.key = key
+        self.current = self.profiles.get(key)
+        if self.current is None:
+            self.current = self.profiles[key] = cProfile.Profile()
+        self.current.enable()
+
+    #
+    # Add the allocation diff since the last switch to the state being left
+    #
+    def record_allocations(self) -> None:
+        snapshot = tracemalloc.take_snapshot().filter_traces((
+            tracemalloc.Filter(False, tracemalloc.__file__),
+            tracemalloc.Filter(False, __file__),
+        ))
+        if self.snapshot is not None and self.key is not None:
+            totals = self.allocations.setdefault(self.key, {})
+            for stat in snapshot.compare_to(self.snapshot, "lineno"):
+                if stat.size_diff or stat.count_diff:
+                    where = str(stat.traceback)
+                    total = totals.setdefault(where, [0, 0])
+                    total[0] += stat.size_diff
+                    total[1] += stat.count_diff
+        self.snapshot = snapshot
+
+    @staticmethod
+    def label(key: Tuple[str, Optional[int]]) -> str:
+        state, level = key
+        return state if level is None else f"{state}_level{level}"
+
+    #
+    # Stop profiling and write the files. Returns the paths written.
+    #
+    def close(self, top: int = 40) -> list:
+        if self.current is not None:
+            self.current.disable()
+        if self.memory:
+            self.record_allocations()
+            tracemalloc.stop()
+        self.current = None
+
+        os.makedirs(self.out_dir, exist_ok=True)
+        written = []
+        print("Profile by game state:")
+        for key, profile in self.profiles.items():
+            label = self.label(key)
+            path = os.path.join(self.out_dir, f"{label}.pstats")
+            profile.dump_stats(path)
+            written.append(path)
+            stats = pstats.Stats(profile)
+            print(f"  {label:<28}{self.frames[key]:>8} frames {stats.total_tt:>9.3f} s")
+
+        for key, totals in self.allocations.items():
+            path = os.path.join(self.out_dir, f"{self.label(key)}.alloc.txt")
+            ranked = sorted(totals.items(), key=lambda item: abs(item[1][0]), reverse=True)
+            with open(path, "w", encoding="utf-8") as fh:
+                fh.write(f"Allocation diff while in {self.label(key)} (bytes, blocks)\n")
+                for where, (size, count) in ranked[:top]:
+                    fh.write(f"{size:>+12} {count:>+8}  {where}\n")
+            written.append(path)
+        print(f"Wrote {len(written)} files to {self.out_dir}")
+        return written
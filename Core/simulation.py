@@ -0,0 +1,233 @@
+#
+# Pygame-free simulation core.
+# Holds the level blocks (through a scoreManager), paddle, balls, score and
+# lives, and advances them with explicit input actions. `Game` drives it from
+# the keyboard; headless tools drive it directly with reset() / step().
+#
+# Each life serves `balls` balls held on the paddle, launched together in a
+# fan. A ball that falls out is dropped; a life is lost with the last one.
+#
+import math
+from operator import attrgetter
+from typing import List, NamedTuple, Sequence, Union
+from Core import config
+from Managers.game_state import GameState
+from Managers.collisionManager import HitEvent, NO_HITS, collisionManager
+from Managers.scoreManager import scoreManager
+from Objects.ball import Ball
+from Objects.level import Level
+from Objects.levelCompiler import load_level
+from Objects.paddle import Paddle
+
+
+#
+# Input for one step: paddle direction -1 (left) .. 1 (right) and launch
+#
+class Action(NamedTuple):
+    direction: float = 0.0
+    launch: bool = False
+
+
+NOOP = Action()
+
+
+class Simulation:
+    def __init__(self, level_manager: scoreManager = None, lives: int = 3, balls: int = None):
+        self.level_manager = level_manager or scoreManager()
+        self.start_lives = lives
+        self.ball_count = max(1, int(balls or config.BALLS))
+        self.balls: List[Ball] = []
+        self.state = GameState.PLAYING
+        self.score = 0
+        self.lives = lives
+        self.frames = 0
+        self.events: Sequence[HitEvent] = NO_HITS  # block hits from the last step
+        self.reset_paddle_and_ball()
+
+    #
+    # Start a fresh game on `level`: a level number, a parsed Level or a path
+    # to a level file. Returns False if the level could not be loaded.
+    #
+    def reset(self, level: Union[int, Level, str] = 1) -> bool:
+        if isinstance(level, Level):
+            self.level_manager.set_level(level)
+        elif isinstance(level, str):
+            self.level_manager.set_level(load_level(level))
+        elif not self.level_manager.load_level(level):
+            return False
+
+        self.frames = 0
+        self.reset_game_state()
+        return True
+
+    #
+    # The first ball in play (the only one outside multi-ball)
+    #
+    @property
+    def ball(self) -> Ball:
+        return self.balls[0]
+
+    #
+    # True once no ball is held on the paddle
+    #
+    @property
+    def ball_launched(self) -> bool:
+        return all(ball.launched for ball in self.balls)
+
+    @ball_launched.setter
+    def ball_launched(self, value: bool) -> None:
+        for ball in self.balls:
+            ball.launched = value
+
+    def reset_paddle_and_ball(self) -> None:
+        # Paddle positioned near bottom center
+        paddle_y = config.SCREEN_HEIGHT - 40
+        self.paddle = Paddle(config.SCREEN_WIDTH / 2, paddle_y)
+
+        # Balls start on top of paddle
+        self.serve_balls()
+        self.state = GameState.PLAYING
+
+    def serve_balls(self) -> None:
+        self.balls = [Ball(0.0, 0.0) for _ in range(self.ball_count)]
+        self.place_ball_on_paddle()
+        for ball in self.balls:
+            ball.snapshot()
+
+    def reset_level_state(self) -> None:
+        self.level_manager.reset_level_blocks()
+        self.reset_paddle_and_ball()
+
+    def reset_game_state(self) -> None:
+        self.level_manager.reset_level_blocks()
+        self.lives = self.start_lives
+        self.score = 0
+        self.reset_paddle_and_ball()
+
+    #
+    # Held balls sit side by side, centred on the paddle
+    #
+    def place_ball_on_paddle(self) -> None:
+        held = [ball for ball in self.balls if not ball.launched]
+        if not held:
+            return
+        spacing = min(2 * held[0].radius + 2, self.paddle.width / len(held))
+        middle = (len(held) - 1) / 2
+        for k, ball in enumerate(held):
+            ball.x = self.paddle.x + (k - middle) * spacing
+            ball.y = self.paddle.y - self.paddle.height / 2 - ball.radius - 2
+
+    #
+    # Launch every held ball, fanned out over LAUNCH_SPREAD either side of
+    # straight up (a single ball goes straight up)
+    #
+    def launch_balls(self) -> None:
+        held = [ball for ball in self.balls if not ball.launched]
+        last = len(held) - 1
+        for k, ball in enumerate(held):
+            angle = config.LAUNCH_SPREAD * (2 * k / last - 1) if last else 0.0
+            ball.vx = math.sin(angle)
+            ball.vy = -math.cos(angle)
+            ball.launched = True
+
+    #
+    # Advance one step of `dt` seconds. Returns the resulting state: PLAYING,
+    # LEVEL_COMPLETE or GAME_OVER.
+    #
+    def step(self, action: Action, dt: float) -> GameState:
+        if self.state != GameState.PLAYING:
+            return self.state
+
+        self.frames += 1
+        self.events = NO_HITS
+        balls = self.balls
+        paddle = self.paddle
+        for ball in balls:
+            ball.snapshot()
+        paddle.snapshot()
+        paddle.move(action.direction, dt)
+
+        if not self.ball_launched:
+            # Keep held balls on paddle
+            self.place_ball_on_paddle()
+            if action.launch:
+                self.launch_balls()
+            return self.state
+
+        field = self.level_manager.blocks
+        grid = self.level_manager.grid
+        events = None
+        lost = None
+        if config.COLLISION_MODE == "swept":
+            # Walls, paddle and blocks resolved in time-of-impact order, with
+            # the paddle and block candidates for every ball found in one pass
+            for ball, blocks, near in collisionManager.broad_phase(balls, paddle, field, grid, dt):
+                hits = collisionManager.sweep_ball(ball, near, field, grid, dt, blocks)
+                if hits:
+                    events = hits if events is None else [*events, *hits]
+                if collisionManager.check_ball_bottom(ball):
+                    lost = [ball] if lost is None else lost + [ball]
+        else:
+            for ball in balls:
+                ball.update(dt)
+
+                # Check collisions
+                collisionManager.check_ball_walls(ball)
+
+                # Check bottom collision (ball lost)
+                if collisionManager.check_ball_bottom(ball):
+                    lost = [ball] if lost is None else lost + [ball]
+                    continue
+
+                # Check paddle collision
+                collisionManager.check_ball_paddle(ball, paddle)
+
+                # Check block collisions
+                hits = collisionManager.check_ball_blocks(ball, field, grid)
+                if hits:
+                    events = hits if events is None else [*events, *hits]
+
+        if events:
+            self.events = events
+            self.score += collisionManager.score_events(field, events)
+
+        # A life is lost with the last ball in play
+        if lost:
+            if len(lost) == len(balls):
+                self.handle_life_loss()
+                return self.state
+            self.balls = [ball for ball in balls if ball not in lost]
+
+        # Check level completion
+        if field.live == 0:
+            self.state = GameState.LEVEL_COMPLETE
+        return self.state
+
+    #
+    # Bottom (life loss): a fresh set of balls is served on the paddle
+    #
+    def handle_life_loss(self) -> None:
+        self.lives -= 1
+        if self.lives <= 0:
+            self.state = GameState.GAME_OVER
+            return
+
+        self.serve_balls()
+
+
+#
+# Simple autopilot: launch at once and keep the paddle under the ball, with
+# the ball meeting the paddle `aim` half-widths off centre (-1 .. 1) so it
+# does not settle into a vertical bounce. With several balls it follows the
+# lowest one that is falling.
+#
+def autoplay_action(sim: Simulation, aim: float = 0.25) -> Action:
+    ball = sim.ball
+    if len(sim.balls) > 1:
+        falling = [b for b in sim.balls if b.vy > 0]
+        ball = max(falling or sim.balls, key=attrgetter("y"))
+    target = ball.x - aim * sim.paddle.width / 2
+    offset = target - sim.paddle.x
+    if abs(offset) < 2:
+        return Action(0.0, True)
+    return Action(1.0 if offset > 0 else -1.0, True)
@@ -0,0 +1,49 @@
+#
+# Startup timing for --startup-profile.
+# Records how long each import and initialisation phase takes, in order, and
+# prints the breakdown up to the first presented frame. A disabled profile
+# records nothing, so call sites can time phases unconditionally.
+#
+import time
+from contextlib import contextmanager
+from typing import List, Tuple
+
+
+class StartupProfile:
+    def __init__(self, enabled: bool = True, start: float = None):
+        self.enabled = enabled
+        self.start = time.perf_counter() if start is None else start
+        self.phases: List[Tuple[str, str, float]] = []  # (kind, name, seconds)
+        self.first_frame: float = None
+
+    #
+    # Time a block as one phase: kind is "import" or "init"
+    #
+    @contextmanager
+    def phase(self, kind: str, name: str):
+        if not self.enabled:
+            yield
+            return
+        t0 = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.phases.append((kind, name, time.perf_counter() - t0))
+
+    def frame_presented(self) -> None:
+        if self.enabled and self.first_frame is None:
+            self.first_frame = time.perf_counter() - self.start
+
+    def total(self, kind: str) -> float:
+        return sum(seconds for k, _, seconds in self.phases if k == kind)
+
+    def report(self) -> str:
+        lines = ["Startup profile (ms):"]
+        for kind in ("import", "init"):
+            lines.append(f"  {kind}: {self.total(kind) * 1000:8.1f}")
+            for k, name, seconds in self.phases:
+                if k == kind:
+                    lines.append(f"    {name:<28}{seconds * 1000:8.1f}")
+        if self.first_frame is not None:
+            lines.append(f"  first frame at {self.first_frame * 1000:8.1f}")
+        return "\n".join(lines)
@@ -1,6 +1,16 @@
 from .game_state import GameState
 from .collisionManager import collisionManager
-from .inputManager import inputManager
 from .scoreManager import scoreManager
 
-__all__ = ['GameState', 'collisionManager', 'inputManager', 'scoreManager']
\ No newline at end of file
+__all__ = ['GameState', 'collisionManager', 'inputManager', 'scoreManager']
+
+#
+# inputManager imports pygame, so it is only loaded on first use. This keeps
+# the simulation core (Core.simulation) importable without pygame.
+#
+def __getattr__(name):
+    if name == "inputManager":
+        from .inputManager import inputManager
+        globals()["inputManager"] = inputManager
+        return inputManager
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -1,9 +1,36 @@
 import math
-from typing import List, Tuple, Optional
+from operator import itemgetter
+from typing import Dict, List, NamedTuple, Optional, Sequence, Tuple
 from Core import config
-from Objects.block import Block
 from Objects.ball import Ball
 from Objects.paddle import Paddle
+from Objects.blockField import BlockField
+from Objects.spatialGrid import SpatialGrid
+
+#
+# One block hit: block id, damage dealt, whether it was destroyed and the
+# contact normal pointing from the block towards the ball
+#
+class HitEvent(NamedTuple):
+    index: int
+    damage: int
+    destroyed: bool
+    nx: float
+    ny: float
+
+
+NO_HITS: Tuple[HitEvent, ...] = ()
+
+
+#
+# Broad-phase result for one ball: the block ids it may touch this step and
+# the paddle, or None when the paddle is out of its reach
+#
+class BallPair(NamedTuple):
+    ball: Ball
+    blocks: Sequence[int]
+    paddle: Optional[Paddle]
+
 
 class collisionManager:
     @staticmethod
@@ -39,44 +66,336 @@ class collisionManager:
                 return True
         return False
     
+    #
+    # Narrow phase against one rectangle. Returns None when the ball does not
+    # touch it, otherwise bounces the ball off the side it hit and returns the
+    # contact normal (nx, ny).
+    #
     @staticmethod
-    def check_ball_blocks(ball: Ball, blocks: List[Block]) -> Tuple[List[Block], int]:
-        remaining = []
-        score_increase = 0
+    def bounce_off_rect(ball: Ball, bx: int, by: int, bw: int, bh: int) -> Optional[Tuple[float, float]]:
+        # Find closest point on block to ball
+        closest_x = max(bx, min(ball.x, bx + bw))
+        closest_y = max(by, min(ball.y, by + bh))
+        
+        # Calculate distance from closest point
+        distance_x = ball.x - closest_x
+        distance_y = ball.y - closest_y
+        distance_squared = distance_x**2 + distance_y**2
         
-        for block in blocks:
-            bx, by, bw, bh = block.rect()
-            
-            # Find closest point on block to ball
-            closest_x = max(bx, min(ball.x, bx + bw))
-            closest_y = max(by, min(ball.y, by + bh))
-            
-            # Calculate distance from closest point
-            distance_x = ball.x - closest_x
-            distance_y = ball.y - closest_y
-            distance_squared = distance_x**2 + distance_y**2
-            
-            # Check collision
-            if distance_squared <= ball.radius**2:
-                destroyed = block.hit()
-                
-                # Determine bounce direction based on hit location
-                if abs(distance_x) > abs(distance_y):
-                    # Hit from left/right
-                    ball.vx *= -1
-                else:
-                    # Hit from top/bottom
-                    ball.vy *= -1
-                
-                if destroyed:
-                    score_increase += block.score
-                else:
-                    remaining.append(block)
+        # Check collision
+        if distance_squared > ball.radius**2:
+            return None
+        
+        # Determine bounce direction based on hit location
+        if abs(distance_x) > abs(distance_y):
+            # Hit from left/right
+            normal = (1.0 if distance_x > 0 else -1.0, 0.0)
+            ball.vx *= -1
+        else:
+            # Hit from top/bottom (centre inside: against the direction of travel)
+            if distance_y != 0:
+                normal = (0.0, 1.0 if distance_y > 0 else -1.0)
             else:
-                remaining.append(block)
+                normal = (0.0, -1.0 if ball.vy > 0 else 1.0)
+            ball.vy *= -1
         
-        return remaining, score_increase
+        return normal
+    
+    #
+    # Block collisions against a BlockField, updated in place: hit blocks lose
+    # hp and destroyed ones are marked dead and dropped from the grid. Returns
+    # the hit events, or the shared empty NO_HITS when nothing was touched, so
+    # frames without a collision build no lists.
+    #
+    # With a SpatialGrid only the cells under the ball are visited. A block
+    # spanning several of them is only tested in the first visited cell it
+    # covers, which avoids building a de-duplicated candidate list.
+    #
+    @staticmethod
+    def check_ball_blocks(ball: Ball, field: BlockField, grid: Optional[SpatialGrid] = None) -> Sequence[HitEvent]:
+        events = None
+        bounce = collisionManager.bounce_off_rect
+        xs, ys, ws, hs = field.x, field.y, field.width, field.height
+
+        if grid is not None:
+            r = ball.radius
+            cs = grid.cell_size
+            cells = grid.cells
+            cx0 = int((ball.x - r) // cs)
+            cy0 = int((ball.y - r) // cs)
+            cx1 = int((ball.x + r) // cs)
+            cy1 = int((ball.y + r) // cs)
+            for cy in range(cy0, cy1 + 1):
+                for cx in range(cx0, cx1 + 1):
+                    cell = cells.get((cx, cy))
+                    if not cell:
+                        continue
+                    for i in cell:
+                        # Skip if an earlier visited cell already holds this block
+                        if (cx > cx0 and xs[i] // cs < cx) or (cy > cy0 and ys[i] // cs < cy):
+                            continue
+                        normal = bounce(ball, xs[i], ys[i], ws[i], hs[i])
+                        if normal is not None:
+                            if events is None:
+                                events = []
+                            events.append(HitEvent(i, 1, field.hit(i), normal[0], normal[1]))
+            if events is None:
+                return NO_HITS
+            #
+            # Unlink destroyed blocks once the cells are no longer being walked
+            #
+            for event in events:
+                if event.destroyed:
+                    grid.remove(event.index, xs[event.index], ys[event.index], ws[event.index], hs[event.index])
+            return events
+
+        alive = field.alive
+        for i in range(len(alive)):
+            if alive[i]:
+                normal = bounce(ball, xs[i], ys[i], ws[i], hs[i])
+                if normal is not None:
+                    if events is None:
+                        events = []
+                    events.append(HitEvent(i, 1, field.hit(i), normal[0], normal[1]))
+        return NO_HITS if events is None else events
+    
+    #
+    # Score awarded for the destroyed blocks in a list of hit events
+    #
+    @staticmethod
+    def score_events(field: BlockField, events: Sequence[HitEvent]) -> int:
+        score = 0
+        for event in events:
+            if event.destroyed:
+                score += field.score[event.index]
+        return score
     
     @staticmethod
     def check_ball_bottom(ball: Ball) -> bool:
-        return ball.y - ball.radius > config.SCREEN_HEIGHT
\ No newline at end of file
+        return ball.y - ball.radius > config.SCREEN_HEIGHT
+
+    #
+    # Swept collision
+    #
+    # Time of impact of a circle of radius r at (x, y) moving by (dx, dy) against
+    # the rectangle (rx, ry, rw, rh). The rectangle is grown by r, the circle
+    # becomes a ray, and corners are rounded by a ray/circle test. Returns
+    # (t, nx, ny) with t in [0, 1] and the unit contact normal, or None.
+    #
+    @staticmethod
+    def sweep_circle_rect(x: float, y: float, r: float, dx: float, dy: float,
+                          rx: float, ry: float, rw: float, rh: float) -> Optional[Tuple[float, float, float]]:
+        x0, y0, x1, y1 = rx, ry, rx + rw, ry + rh
+
+        #
+        # Already touching: report a t=0 contact only if moving inwards
+        #
+        closest_x = max(x0, min(x, x1))
+        closest_y = max(y0, min(y, y1))
+        ox = x - closest_x
+        oy = y - closest_y
+        if ox * ox + oy * oy <= r * r:
+            if ox == 0 and oy == 0:
+                # Centre inside the rectangle: push out along the shallowest face
+                faces = ((x - x0, -1.0, 0.0), (x1 - x, 1.0, 0.0), (y - y0, 0.0, -1.0), (y1 - y, 0.0, 1.0))
+                _, nx, ny = min(faces)
+            else:
+                d = math.hypot(ox, oy)
+                nx, ny = ox / d, oy / d
+            if dx * nx + dy * ny < 0:
+                return (0.0, nx, ny)
+            return None
+
+        #
+        # Slab test against the expanded rectangle
+        #
+        t_enter, t_exit = 0.0, 1.0
+        nx = ny = 0.0
+        for p, d, lo, hi, axis in ((x, dx, x0 - r, x1 + r, 0), (y, dy, y0 - r, y1 + r, 1)):
+            if d == 0:
+                if p < lo or p > hi:
+                    return None
+                continue
+            t0 = (lo - p) / d
+            t1 = (hi - p) / d
+            sign = -1.0
+            if t0 > t1:
+                t0, t1 = t1, t0
+                sign = 1.0
+            if t0 > t_enter:
+                t_enter = t0
+                nx, ny = (sign, 0.0) if axis == 0 else (0.0, sign)
+            t_exit = min(t_exit, t1)
+            if t_enter > t_exit:
+                return None
+
+        #
+        # Entry point beyond both edges means the corner region: use the
+        # rounded corner instead of the square one. No entry face means the
+        # ball starts inside the expanded rectangle without touching, which
+        # only happens in a corner region.
+        #
+        hx = x + dx * t_enter
+        hy = y + dy * t_enter
+        if (hx < x0 or hx > x1) and (hy < y0 or hy > y1):
+            cx = x0 if hx < x0 else x1
+            cy = y0 if hy < y0 else y1
+            mx, my = x - cx, y - cy
+            a = dx * dx + dy * dy
+            b = 2 * (mx * dx + my * dy)
+            c = mx * mx + my * my - r * r
+            disc = b * b - 4 * a * c
+            if disc < 0:
+                return None
+            t = (-b - math.sqrt(disc)) / (2 * a)
+            if t < 0 or t > 1:
+                return None
+            nx = (x + dx * t - cx) / r
+            ny = (y + dy * t - cy) / r
+            return (t, nx, ny)
+
+        if nx == 0 and ny == 0:
+            return None
+        return (t_enter, nx, ny)
+
+    #
+    # Sort-and-sweep broad phase for a set of balls, run once per step.
+    # Each ball's reach box covers everything it can touch within dt, however
+    # it bounces. The boxes are sorted on x and swept once against the
+    # paddle's x interval, and block candidates come from the grid cells a box
+    # covers; balls whose boxes cover the same cells share one lookup. Without
+    # a grid every ball shares a single list of the live blocks.
+    #
+    # Returns one BallPair per ball in sweep (x) order. Candidate lists may be
+    # shared and go stale as blocks are destroyed, so users skip dead ids.
+    #
+    @staticmethod
+    def broad_phase(balls: Sequence[Ball], paddle: Paddle, field: BlockField, grid: Optional[SpatialGrid],
+                    dt: float) -> List[BallPair]:
+        boxes = []
+        for ball in balls:
+            reach = ball.speed * dt + ball.radius
+            boxes.append((ball.x - reach, ball.x + reach, ball.y - reach, ball.y + reach, ball))
+        boxes.sort(key=itemgetter(0))
+
+        px, py, pw, ph = paddle.rect()
+        px1, py1 = px + pw, py + ph
+        past_paddle = False
+        shared = None if grid is not None else field.alive_indices()
+        lookups: Dict[Tuple[int, int, int, int], Sequence[int]] = {}
+        pairs = []
+        for x0, x1, y0, y1, ball in boxes:
+            #
+            # Paddle: sorted on x0, so once a box starts right of the paddle
+            # no later box can reach it
+            #
+            near = None
+            if not past_paddle:
+                if x0 > px1:
+                    past_paddle = True
+                elif x1 >= px and y0 <= py1 and y1 >= py:
+                    near = paddle
+            if shared is None:
+                cells = grid.cell_range(x0, y0, x1 - x0, y1 - y0)
+                blocks = lookups.get(cells)
+                if blocks is None:
+                    blocks = lookups[cells] = grid.query(x0, y0, x1 - x0, y1 - y0)
+            else:
+                blocks = shared
+            pairs.append(BallPair(ball, blocks, near))
+        return pairs
+
+    #
+    # Advance the ball by dt, resolving walls, paddle and blocks in order of
+    # time of impact. Each pass resolves only the earliest contact and then
+    # continues with the remainder of the step. Returns the block hit events
+    # (NO_HITS if no block was touched).
+    #
+    # `candidates` are block ids from broad_phase to test instead of querying
+    # the grid along the path; a None paddle is not tested.
+    #
+    @staticmethod
+    def sweep_ball(ball: Ball, paddle: Optional[Paddle], field: BlockField, grid: Optional[SpatialGrid], dt: float,
+                   candidates: Sequence[int] = None) -> Sequence[HitEvent]:
+        events = None
+        remaining = dt
+        r = ball.radius
+        alive = field.alive
+
+        for _ in range(config.SWEEP_MAX_CONTACTS):
+            dx = ball.vx * ball.speed * remaining
+            dy = ball.vy * ball.speed * remaining
+            if dx == 0 and dy == 0:
+                break
+
+            best_t = 1.0
+            hit = None  # (kind, target, nx, ny)
+
+            #
+            # Walls
+            #
+            if dx < 0:
+                t = max(0.0, (r - ball.x) / dx)
+                if t <= best_t:
+                    best_t, hit = t, ("wall", None, 1.0, 0.0)
+            elif dx > 0:
+                t = max(0.0, (config.SCREEN_WIDTH - r - ball.x) / dx)
+                if t <= best_t:
+                    best_t, hit = t, ("wall", None, -1.0, 0.0)
+            if dy < 0:
+                t = max(0.0, (r - ball.y) / dy)
+                if t <= best_t:
+                    best_t, hit = t, ("wall", None, 0.0, 1.0)
+
+            #
+            # Paddle, only while moving downward
+            #
+            if dy > 0 and paddle is not None:
+                contact = collisionManager.sweep_circle_rect(ball.x, ball.y, r, dx, dy, *paddle.rect())
+                if contact is not None and contact[0] < best_t:
+                    best_t, hit = contact[0], ("paddle", paddle, contact[1], contact[2])
+
+            #
+            # Blocks along the swept path
+            #
+            if candidates is not None:
+                blocks = candidates
+            elif grid is not None:
+                blocks = grid.query(min(ball.x, ball.x + dx) - r, min(ball.y, ball.y + dy) - r,
+                                    abs(dx) + r * 2, abs(dy) + r * 2)
+            else:
+                blocks = field.alive_indices()
+            for i in blocks:
+                if not alive[i]:
+                    continue
+                contact = collisionManager.sweep_circle_rect(ball.x, ball.y, r, dx, dy,
+                                                             field.x[i], field.y[i], field.width[i], field.height[i])
+                if contact is not None and contact[0] < best_t:
+                    best_t, hit = contact[0], ("block", i, contact[1], contact[2])
+
+            #
+            # Move to the contact (or the end of the step)
+            #
+            ball.x += dx * best_t
+            ball.y += dy * best_t
+            if hit is None:
+                break
+
+            kind, target, nx, ny = hit
+            if kind == "paddle":
+                ball.bounce_from_paddle(paddle.x, paddle.width)
+            else:
+                dot = ball.vx * nx + ball.vy * ny
+                ball.vx -= 2 * dot * nx
+                ball.vy -= 2 * dot * ny
+                if kind == "block":
+                    destroyed = field.hit(target)
+                    if destroyed and grid is not None:
+                        grid.remove(target, *field.rect(target))
+                    if events is None:
+                        events = []
+                    events.append(HitEvent(target, 1, destroyed, nx, ny))
+
+            remaining -= remaining * best_t
+
+        return NO_HITS if events is None else events
@@ -1,11 +1,38 @@
-from typing import Tuple
+from typing import Dict, List, Optional, Tuple
 import pygame
 from Managers.game_state import GameState
+from Core.simulation import Action
+
+#
+# State machine table: (state, key) -> (next state, action), keys by their
+# pygame constant name. A None state matches every state and is checked
+# first; a None next state keeps the current one.
+#
+TRANSITIONS: Dict[Tuple[Optional[GameState], str], Tuple[Optional[GameState], str]] = {
+    (None, "K_ESCAPE"): (None, "quit"),
+    (None, "K_F3"): (None, "toggle_profiler"),  # frame profiler, in any state
+    (None, "K_F4"): (None, "dump_profiler"),
+    (GameState.MENU, "K_SPACE"): (GameState.LEVEL_SELECT, "open_level_select"),
+    (GameState.LEVEL_SELECT, "K_UP"): (None, "select_prev_level"),
+    (GameState.LEVEL_SELECT, "K_DOWN"): (None, "select_next_level"),
+    (GameState.LEVEL_SELECT, "K_RETURN"): (GameState.PLAYING, "start_selected_level"),
+    (GameState.LEVEL_SELECT, "K_SPACE"): (GameState.PLAYING, "start_selected_level"),
+    (GameState.PLAYING, "K_p"): (GameState.PAUSED, "pause"),
+    (GameState.PAUSED, "K_p"): (GameState.PLAYING, "resume"),
+    (GameState.LEVEL_COMPLETE, "K_SPACE"): (None, "next_level"),
+    (GameState.LEVEL_COMPLETE, "K_r"): (None, "restart_level"),
+    (GameState.GAME_OVER, "K_r"): (None, "restart_game"),
+}
+
+#
+# Key code -> constant name for the keys in TRANSITIONS
+#
+KEY_NAMES: Dict[int, str] = {getattr(pygame, name): name for _, name in TRANSITIONS}
+
 
 class inputManager:
     @staticmethod
-    def handle_game_input(events, game_state: GameState, paddle, dt: float) -> None:
-        keys = pygame.key.get_pressed()
+    def get_paddle_direction(keys, game_state: GameState) -> float:
         dir = 0.0
         
         if game_state == GameState.PLAYING:
@@ -14,57 +41,68 @@ class inputManager:
             if keys[pygame.K_RIGHT] or keys[pygame.K_d]:
                 dir += 1.0
         
+        return dir
+    
+    @staticmethod
+    def handle_game_input(events, game_state: GameState, paddle, dt: float) -> None:
+        keys = pygame.key.get_pressed()
+        dir = inputManager.get_paddle_direction(keys, game_state)
+        
         # Only move paddle if we're playing
         if game_state == GameState.PLAYING:
             paddle.move(dir, dt)
     
+    #
+    # Keyboard state as a simulation Action (paddle direction and launch)
+    #
+    @staticmethod
+    def read_action(game_state: GameState) -> Action:
+        keys = pygame.key.get_pressed()
+        return Action(inputManager.get_paddle_direction(keys, game_state), bool(keys[pygame.K_SPACE]))
+    
     @staticmethod
     def check_launch_ball(keys, ball_launched: bool) -> bool:
         if not ball_launched and keys[pygame.K_SPACE]:
             return True
         return False
     
+    #
+    # One event through the state machine. Returns the new state, running
+    # flag and action ("" when the event matches no transition).
+    #
     @staticmethod
-    def handle_state_transitions(events, game_state: GameState, running: bool) -> Tuple[GameState, bool, str]:
-        action = ""
-        
+    def transition(event, game_state: GameState, running: bool) -> Tuple[GameState, bool, str]:
+        if event.type == pygame.QUIT:
+            return game_state, False, "quit"
+        if event.type != pygame.KEYDOWN:
+            return game_state, running, ""
+
+        name = KEY_NAMES.get(event.key)
+        entry = TRANSITIONS.get((None, name)) or TRANSITIONS.get((game_state, name))
+        if entry is None:
+            return game_state, running, ""
+        next_state, action = entry
+        return next_state or game_state, running and action != "quit", action
+
+    #
+    # Events that can trigger a transition
+    #
+    @staticmethod
+    def is_state_event(event) -> bool:
+        return event.type == pygame.QUIT or (event.type == pygame.KEYDOWN and event.key in KEY_NAMES)
+
+    #
+    # The state events of a frame with their time in ms from the frame start.
+    # Events without a timestamp are placed at the start of the frame.
+    #
+    @staticmethod
+    def state_events(events, frame_start: int, frame_ms: int) -> List[Tuple[object, int]]:
+        timed = []
+        last = 0
         for event in events:
-            if event.type == pygame.QUIT:
-                return game_state, False, "quit"
-            
-            if event.type == pygame.KEYDOWN:
-                if event.key == pygame.K_ESCAPE:
-                    return game_state, False, "quit"
-                
-                # Game state transitions
-                if game_state == GameState.MENU:
-                    if event.key == pygame.K_SPACE:
-                        return GameState.LEVEL_SELECT, running, "open_level_select"
-                
-                elif game_state == GameState.LEVEL_SELECT:
-                    if event.key == pygame.K_UP:
-                        return game_state, running, "select_prev_level"
-                    elif event.key == pygame.K_DOWN:
-                        return game_state, running, "select_next_level"
-                    elif event.key == pygame.K_RETURN or event.key == pygame.K_SPACE:
-                        return GameState.PLAYING, running, "start_selected_level"
-                
-                elif game_state == GameState.PLAYING:
-                    if event.key == pygame.K_p:
-                        return GameState.PAUSED, running, "pause"
-                
-                elif game_state == GameState.PAUSED:
-                    if event.key == pygame.K_p:
-                        return GameState.PLAYING, running, "resume"
-                
-                elif game_state == GameState.LEVEL_COMPLETE:
-                    if event.key == pygame.K_SPACE:
-                        return game_state, running, "next_level"
-                    elif event.key == pygame.K_r:
-                        return game_state, running, "restart_level"
-                
-                elif game_state == GameState.GAME_OVER:
-                    if event.key == pygame.K_r:
-                        return game_state, running, "restart_game"
-        
-        return game_state, running, action
\ No newline at end of file
+            if inputManager.is_state_event(event):
+                stamp = getattr(event, "timestamp", None)
+                if stamp is not None:
+                    last = min(max(stamp - frame_start, last), frame_ms)
+                timed.append((event, last))
+        return timed
@@ -0,0 +1,104 @@
+#
+# Input recording and playback.
+# A recording holds, for every frame of an interactive session (or every
+# part of a frame between two state events), its time, the paddle direction
+# and launch key, the state action applied at its start and the game state
+# and level it led to. Feeding the frames
+# back through `Game.replay` reproduces the session exactly, headless and
+# without the frame limiter.
+#
+# File layout (little-endian): HEADER, then one FRAME record per frame.
+#
+import struct
+from typing import Iterator, List, NamedTuple, Tuple
+from Managers.game_state import GameState
+
+MAGIC = b"BKIR"
+VERSION = 3
+
+#
+# magic, version, initial level, physics rate, balls per serve, reserved
+#
+HEADER = struct.Struct("<4sHHIHH")
+
+#
+# frame time in ms (32-bit: a stall from a window drag, suspend or debugger
+# can last longer than a 16-bit field holds), direction (-1, 0, 1), flags,
+# state action, game state, level number
+#
+FRAME = struct.Struct("<IbBBBH")
+
+#
+# The file is flushed after every state action and at least this often, so
+# a crash loses at most a few seconds of the session
+#
+FLUSH_EVERY = 600
+
+LAUNCH = 0x01
+RUNNING = 0x02
+
+#
+# State actions from inputManager.transition, by code
+#
+ACTIONS: Tuple[str, ...] = (
+    "", "quit", "open_level_select", "select_prev_level", "select_next_level",
+    "start_selected_level", "pause", "resume", "next_level", "restart_level",
+    "restart_game", "retry_level", "toggle_profiler", "dump_profiler",
+)
+ACTION_CODES = {name: code for code, name in enumerate(ACTIONS)}
+
+
+class FrameInput(NamedTuple):
+    dt_ms: int
+    direction: int
+    launch: bool
+    running: bool
+    action: str
+    state: GameState
+    level: int
+
+    def pack(self) -> bytes:
+        flags = (LAUNCH if self.launch else 0) | (RUNNING if self.running else 0)
+        return FRAME.pack(self.dt_ms, int(self.direction), flags, ACTION_CODES[self.action],
+                          self.state.value, self.level)
+
+
+class inputRecorder:
+    def __init__(self, path: str, level: int, physics_hz: int, balls: int = 1):
+        self.path = path
+        self.file = open(path, "wb")
+        self.file.write(HEADER.pack(MAGIC, VERSION, level, physics_hz, balls, 0))
+        self.frames = 0
+
+    def record(self, frame: FrameInput) -> None:
+        self.file.write(frame.pack())
+        self.frames += 1
+        if frame.action or self.frames % FLUSH_EVERY == 0:
+            self.file.flush()
+
+    def close(self) -> None:
+        self.file.close()
+
+
+#
+# Read a recording: returns (initial level, physics rate, balls, frames)
+#
+def read_recording(path: str) -> Tuple[int, int, int, List[FrameInput]]:
+    with open(path, "rb") as fh:
+        data = fh.read()
+    if len(data) < HEADER.size:
+        raise ValueError(f"{path} is not an input recording")
+    magic, version, level, physics_hz, balls, _ = HEADER.unpack_from(data, 0)
+    if magic != MAGIC or version != VERSION:
+        raise ValueError(f"{path} is not a version {VERSION} input recording")
+    body = memoryview(data)[HEADER.size:]
+    if len(body) % FRAME.size:
+        raise ValueError(f"{path} is truncated")
+    return level, physics_hz, balls, list(iter_frames(body))
+
+
+def iter_frames(body) -> Iterator[FrameInput]:
+    for fields in FRAME.iter_unpack(body):
+        dt_ms, direction, flags, action, state, level = fields
+        yield FrameInput(dt_ms, direction, bool(flags & LAUNCH), bool(flags & RUNNING),
+                         ACTIONS[action], GameState(state), level)
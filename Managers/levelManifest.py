@@ -0,0 +1,113 @@
+#
+# Level discovery.
+# One os.scandir pass over the levels directory finds every levelN.json,
+# gaps in the numbering included, and records its size, mtime, block count
+# and title. Scans happen at explicit points only, when the manifest is
+# built and on refresh() (the game refreshes when the level select screen
+# opens), so queries never touch the filesystem. Each entry is keyed on its
+# file's size and mtime: files whose key is unchanged keep their metadata,
+# and only new or edited files are opened and parsed. The manifest is also
+# saved in the level cache folder so a restart does not reopen every file.
+#
+# Scans are serialised by a lock, since scoreManager's prefetch thread
+# queries the manifest while the game does.
+#
+import json
+import os
+import threading
+from typing import Dict, List, Optional
+from Core import config
+from Objects.level import LEVEL_FILE, Level, LevelEntry, read_level_entry
+from Objects.levelCompiler import load_level
+
+MANIFEST_FILE = "manifest.json"
+
+
+class levelManifest:
+    def __init__(self, levels_dir: str, cache_dir: str = None):
+        self.levels_dir = levels_dir
+        cache_dir = config.LEVEL_CACHE_DIR if cache_dir is None else cache_dir
+        self.manifest_path = os.path.join(levels_dir, cache_dir, MANIFEST_FILE) if cache_dir else None
+        self.entries: Dict[int, LevelEntry] = {}
+        self.scans = 0
+        self.lock = threading.RLock()
+        self.load_saved()
+        self.refresh()
+
+    #
+    # Rescan the directory. Returns True if any level was added, removed or
+    # changed.
+    #
+    def refresh(self) -> bool:
+        with self.lock:
+            self.scans += 1
+            previous = self.entries
+            entries: Dict[int, LevelEntry] = {}
+            try:
+                with os.scandir(self.levels_dir) as it:
+                    for item in it:
+                        match = LEVEL_FILE.fullmatch(item.name)
+                        if not match or not item.is_file():
+                            continue
+                        number = int(match.group(1))
+                        st = item.stat()
+                        old = previous.get(number)
+                        if old is not None and (old.size, old.mtime_ns) == (st.st_size, st.st_mtime_ns):
+                            entries[number] = old._replace(path=item.path)
+                        else:
+                            entries[number] = self.read_entry(number, item.path, st.st_size, st.st_mtime_ns)
+            except OSError:
+                pass
+            self.entries = dict(sorted(entries.items()))
+            if self.entries == previous:
+                return False
+            self.save()
+            return True
+
+    read_entry = staticmethod(read_level_entry)
+
+    #
+    # Saved manifest, used as the previous scan so unchanged files are not
+    # reopened after a restart
+    #
+    def load_saved(self) -> None:
+        if not self.manifest_path:
+            return
+        try:
+            with open(self.manifest_path, "r", encoding="utf-8") as fh:
+                saved = json.load(fh)
+            self.entries = {int(e["number"]): LevelEntry(**e) for e in saved.get("levels", [])}
+        except (OSError, ValueError, TypeError, KeyError):
+            self.entries = {}
+
+    def save(self) -> None:
+        if not self.manifest_path:
+            return
+        try:
+            os.makedirs(os.path.dirname(self.manifest_path), exist_ok=True)
+            tmp = f"{self.manifest_path}.{os.getpid()}.{threading.get_ident()}.tmp"
+            with open(tmp, "w", encoding="utf-8") as fh:
+                json.dump({"levels": [e._asdict() for e in self.entries.values()]}, fh, indent=1)
+            os.replace(tmp, self.manifest_path)
+        except OSError:
+            pass
+
+    #
+    # Queries, answered from the last scan
+    #
+    def numbers(self) -> List[int]:
+        return list(self.entries)
+
+    def get(self, number: int) -> Optional[LevelEntry]:
+        return self.entries.get(number)
+
+    def next_number(self, number: int) -> Optional[int]:
+        return next((n for n in self.numbers() if n > number), None)
+
+    def load(self, number: int) -> Level:
+        entry = self.get(number)
+        path = entry.path if entry else os.path.join(self.levels_dir, f"level{number}.json")
+        return load_level(path)
+
+    def __len__(self) -> int:
+        return len(self.entries)
@@ -1,60 +1,184 @@
 import os
-import json
-from typing import List, Optional, Tuple
+import threading
+from collections import OrderedDict
+from typing import Dict, List, Optional, Tuple
 from Core import config
+from Managers.levelManifest import LevelEntry, levelManifest
 from Objects.level import Level
-from Objects.block import Block
+from Objects.levelPack import LevelPack
+from Objects.blockField import BlockField
 
 class scoreManager:
-    def __init__(self, levels_dir: str = None):
+    def __init__(self, levels_dir: str = None, cache_size: int = None, pack_path: str = None):
         self.levels_dir = levels_dir or self.get_default_levels_dir()
+        #
+        # Level index: the level pack when one is given (or, with no levels
+        # directory given, when the default pack exists), else the directory
+        #
+        if pack_path is None and levels_dir is None:
+            default_pack = self.get_default_pack_path()
+            pack_path = default_pack if os.path.isfile(default_pack) else None
+        self.manifest = self.open_level_index(pack_path)
+        #
+        # Parsed levels by number (LRU), each with the (path, mtime) it was
+        # read from, and the background threads loading the next level
+        #
+        self.cache: "OrderedDict[int, Tuple[Tuple[str, int], Level]]" = OrderedDict()
+        self.cache_size = cache_size or config.LEVEL_MEMORY_CACHE
+        self.prefetches: Dict[int, threading.Thread] = {}
+        self.lock = threading.Lock()
         self.current_level = 1
-        self.total_levels = self.count_available_levels()
         self.level = None
-        self.blocks = []
+        self.blocks = BlockField()  # live copy of the current level's blocks
+        self.grid = None
         
+    #
+    # A pack that cannot be read (corrupt, or from another version) falls
+    # back to the levels directory with a warning instead of stopping the game
+    #
+    def open_level_index(self, pack_path: Optional[str]):
+        if pack_path:
+            try:
+                return LevelPack(pack_path)
+            except (OSError, ValueError) as e:
+                print(f"Warning: ignoring level pack {pack_path} ({e}); using {self.levels_dir}")
+        return levelManifest(self.levels_dir)
+    
     def get_default_levels_dir(self) -> str:
         base_dir = os.path.dirname(os.path.abspath(__file__))
         return os.path.join(base_dir, "..", config.LEVELS_DIR)
     
+    def get_default_pack_path(self) -> str:
+        base_dir = os.path.dirname(os.path.abspath(__file__))
+        return os.path.join(base_dir, "..", config.LEVEL_PACK)
+    
+    #
+    # Rescan the levels for added, removed or edited files. Queries use the
+    # last scan, so this is called at explicit points (the level select).
+    #
+    def refresh_levels(self) -> bool:
+        return self.manifest.refresh()
+    
     def count_available_levels(self) -> int:
-        count = 0
-        level_num = 1
-        
-        while True:
-            level_path = self.get_level_path(level_num)
-            if os.path.exists(level_path):
-                count += 1
-                level_num += 1
-            else:
-                break
-        
-        return count
+        return len(self.manifest)
+    
+    @property
+    def total_levels(self) -> int:
+        return len(self.manifest)
     
     def get_level_path(self, level_num: int) -> str:
+        entry = self.manifest.get(level_num)
+        if entry is not None:
+            return entry.path
         return os.path.join(self.levels_dir, f"level{level_num}.json")
     
     def level_exists(self, level_num: int) -> bool:
-        return os.path.exists(self.get_level_path(level_num))
+        return self.manifest.get(level_num) is not None
+    
+    def get_level_entry(self, level_num: int) -> Optional[LevelEntry]:
+        """Manifest metadata (path, size, block count, title) for a level."""
+        return self.manifest.get(level_num)
+    
+    def next_level_number(self, level_num: int) -> Optional[int]:
+        """The next existing level after `level_num`, skipping numbering gaps."""
+        return self.manifest.next_number(level_num)
+    
+    #
+    # The file a level is read from and its current mtime. A cached level
+    # is only used while this matches, so an edited level is read again.
+    #
+    def level_stamp(self, level_num: int) -> Tuple[str, int]:
+        path = self.get_level_path(level_num)
+        try:
+            return path, os.stat(path).st_mtime_ns
+        except OSError:
+            return path, 0
+    
+    def cached_level(self, level_num: int, stamp: Tuple[str, int]) -> Optional[Level]:
+        with self.lock:
+            cached = self.cache.get(level_num)
+            if cached is None or cached[0] != stamp:
+                return None
+            self.cache.move_to_end(level_num)
+            return cached[1]
+    
+    #
+    # Parsed Level for a level number, from the cache when possible. Waits
+    # for a prefetch of the same level instead of parsing it twice.
+    #
+    def get_level(self, level_num: int) -> Level:
+        thread = self.prefetches.get(level_num)
+        if thread is not None:
+            thread.join()
+        
+        stamp = self.level_stamp(level_num)
+        level = self.cached_level(level_num, stamp)
+        if level is not None:
+            return level
+        
+        level = self.manifest.load(level_num)
+        self.cache_level(level_num, level, stamp)
+        return level
+    
+    def cache_level(self, level_num: int, level: Level, stamp: Tuple[str, int]) -> None:
+        with self.lock:
+            self.cache[level_num] = (stamp, level)
+            self.cache.move_to_end(level_num)
+            while len(self.cache) > self.cache_size:
+                self.cache.popitem(last=False)
+    
+    #
+    # Start loading a level on a background thread, so that moving on to it
+    # later does not have to parse it. Errors are left for the real load.
+    #
+    def prefetch(self, level_num: int) -> None:
+        if not self.level_exists(level_num):
+            return
+        stamp = self.level_stamp(level_num)
+        if self.cached_level(level_num, stamp) is not None:
+            return
+        thread = self.prefetches.get(level_num)
+        if thread is not None and thread.is_alive():
+            return
+        
+        def run():
+            try:
+                self.cache_level(level_num, self.manifest.load(level_num), stamp)
+            except Exception:
+                pass
+            finally:
+                self.prefetches.pop(level_num, None)
+        
+        thread = threading.Thread(target=run, name=f"prefetch-level{level_num}", daemon=True)
+        self.prefetches[level_num] = thread
+        thread.start()
     
     def load_level(self, level_num: int) -> bool:
         if not self.level_exists(level_num):
             return False
             
         try:
-            level_path = self.get_level_path(level_num)
-            self.level = Level.from_file(level_path)
-            self.blocks = list(self.level.blocks)
-            self.current_level = level_num
-            return True
+            self.set_level(self.get_level(level_num), level_num)
         except Exception as e:
             print(f"Error loading level {level_num}: {e}")
             return False
+        
+        next_num = self.next_level_number(level_num)
+        if next_num is not None:
+            self.prefetch(next_num)
+        return True
+    
+    def set_level(self, level: Level, level_num: int = 0) -> None:
+        """Make an already parsed Level the current one."""
+        self.level = level
+        self.blocks = self.level.field.copy()
+        self.grid = self.level.grid.copy()
+        self.current_level = level_num
     
     def next_level(self) -> Tuple[bool, Optional[str]]:
-        next_level_num = self.current_level + 1
+        next_level_num = self.next_level_number(self.current_level)
         
-        if self.level_exists(next_level_num):
+        if next_level_num is not None:
             success = self.load_level(next_level_num)
             if success:
                 return True, f"Level {next_level_num} loaded"
@@ -68,7 +192,8 @@ class scoreManager:
     
     def reset_level_blocks(self) -> None:
         if self.level:
-            self.blocks = list(self.level.blocks)
+            self.blocks = self.level.field.copy()
+            self.grid = self.level.grid.copy()
     
     def get_level_info(self) -> dict:
         if not self.level:
@@ -76,8 +201,8 @@ class scoreManager:
             
         return {
             "number": self.current_level,
-            "blocks_count": len(self.blocks),
-            "total_blocks": len(self.level.blocks) if self.level else 0,
+            "blocks_count": self.blocks.live,
+            "total_blocks": len(self.level.field) if self.level else 0,
             "width": self.level.width if self.level else 0,
             "height": self.level.height if self.level else 0,
             "tile_size": self.level.tile_size if self.level else 0
@@ -88,8 +213,9 @@ class scoreManager:
         if not self.level:
             return summary
             
-        for block in self.level.blocks:
-            block_type = block.type
+        field = self.level.field
+        for type_id in field.type_id:
+            block_type = field.types[type_id]
             summary[block_type] = summary.get(block_type, 0) + 1
         
         return summary
@@ -98,22 +224,18 @@ class scoreManager:
         return self.total_levels > 0
     
     def is_last_level(self) -> bool:
-        return self.current_level >= self.total_levels
+        return self.next_level_number(self.current_level) is None
     
     def get_level_completion_percentage(self) -> float:
-        if not self.level or len(self.level.blocks) == 0:
+        if not self.level or len(self.level.field) == 0:
             return 0.0
         
-        remaining = len(self.blocks)
-        total = len(self.level.blocks)
+        remaining = self.blocks.live
+        total = len(self.level.field)
         destroyed = total - remaining
         
         return (destroyed / total) * 100.0 if total > 0 else 0.0
     
     def get_available_levels(self) -> List[int]:
         """Return a list of available level numbers."""
-        levels = []
-        for level_num in range(1, self.total_levels + 1):
-            if self.level_exists(level_num):
-                levels.append(level_num)
-        return levels
+        return self.manifest.numbers()
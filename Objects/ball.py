@@ -11,6 +11,9 @@ class Ball:
         self.x = float(x)
         self.y = float(y)
         self.speed = float(speed or config.BALL_SPEED)
+        self.prev_x = self.x
+        self.prev_y = self.y
+        self.launched = False  # False while held on the paddle
 
         #
         # Normalize initial velocity
@@ -26,6 +29,19 @@ class Ball:
         self.x += self.vx * self.speed * dt
         self.y += self.vy * self.speed * dt  # update position
 
+    #
+    # Remember the current position as the start of the next physics step
+    #
+    def snapshot(self) -> None:
+        self.prev_x = self.x
+        self.prev_y = self.y
+
+    #
+    # Position interpolated between the last two physics steps (alpha 0..1)
+    #
+    def render_pos(self, alpha: float = 1.0):
+        return (self.prev_x + (self.x - self.prev_x) * alpha, self.prev_y + (self.y - self.prev_y) * alpha)
+
     def rect(self):
         return (int(self.x - self.radius), int(self.y - self.radius), int(self.radius * 2), int(self.radius * 2))  # return rect tuple
 
@@ -0,0 +1,198 @@
+#
+# Struct-of-arrays block storage.
+# Every block attribute lives in its own typed array, indexed by block id, with
+# an alive mask and a live counter. Colours are resolved once into a palette of
+# packed 0xRRGGBB values and each block stores its palette index. Block
+# objects are only created on demand as views (BlockView) onto one slot. The
+# arrays support the buffer protocol, so numpy can wrap them without copying
+# (np.frombuffer(field.x, np.intc)).
+#
+from array import array
+from itertools import compress
+from typing import Dict, Iterable, List, Optional, Tuple
+from Objects.block import Block
+
+
+#
+# "#RRGGBB" -> 0xRRGGBB, white for anything malformed (as UI.menu.hex_to_rgb)
+#
+def pack_color(hexstr: str) -> int:
+    s = hexstr.lstrip("#")
+    if len(s) != 6:
+        return 0xFFFFFF
+    try:
+        return int(s, 16)
+    except ValueError:
+        return 0xFFFFFF
+
+
+def unpack_color(packed: int) -> Tuple[int, int, int]:
+    return ((packed >> 16) & 0xFF, (packed >> 8) & 0xFF, packed & 0xFF)
+
+
+#
+# type_id and color are uint16 columns, so a field holds at most this many
+# block types and palette colours
+#
+MAX_IDS = 1 << 16
+
+
+class BlockField:
+    def __init__(self):
+        self.x = array("i")
+        self.y = array("i")
+        self.width = array("i")
+        self.height = array("i")
+        self.hp = array("i")
+        self.score = array("i")
+        self.type_id = array("H")
+        self.color = array("H")  # palette index
+        self.palette = array("I")  # packed 0xRRGGBB
+        self.palette_ids: Dict[int, int] = {}
+        self.alive = bytearray()
+        self.types: List[str] = []
+        self.type_ids: Dict[str, int] = {}
+        self.live = 0
+
+    @staticmethod
+    def from_blocks(blocks: Iterable[Block]) -> "BlockField":
+        field = BlockField()
+        for block in blocks:
+            field.append(block.x, block.y, block.width, block.height, block.type, block.hp, block.score, block.color)
+        return field
+
+    def type_index(self, name: str) -> int:
+        tid = self.type_ids.get(name)
+        if tid is None:
+            if len(self.types) >= MAX_IDS:
+                raise ValueError(f"Too many block types: at most {MAX_IDS} are supported")
+            tid = self.type_ids[name] = len(self.types)
+            self.types.append(name)
+        return tid
+
+    #
+    # Palette index of a packed colour, added to the palette if new
+    #
+    def palette_index(self, packed: int) -> int:
+        pid = self.palette_ids.get(packed)
+        if pid is None:
+            if len(self.palette) >= MAX_IDS:
+                raise ValueError(f"Too many colours: at most {MAX_IDS} palette entries are supported")
+            pid = self.palette_ids[packed] = len(self.palette)
+            self.palette.append(packed)
+        return pid
+
+    def color_of(self, index: int) -> int:
+        return self.palette[self.color[index]]
+
+    #
+    # Add a block and return its id. `color_id` (a palette index) takes
+    # precedence over the hex `color`.
+    #
+    def append(self, x: int, y: int, width: int, height: int, type: str = "normal",
+               hp: int = 1, score: int = 100, color: str = "#BE0A0A", color_id: Optional[int] = None) -> int:
+        type_id = self.type_index(type)  # ids first: they can raise, and no column is half-written
+        if color_id is None:
+            color_id = self.palette_index(pack_color(color))
+        self.x.append(int(x))
+        self.y.append(int(y))
+        self.width.append(int(width))
+        self.height.append(int(height))
+        self.hp.append(int(hp))
+        self.score.append(int(score))
+        self.type_id.append(type_id)
+        self.color.append(color_id)
+        self.alive.append(1)
+        self.live += 1
+        return len(self.alive) - 1
+
+    def copy(self) -> "BlockField":
+        field = BlockField()
+        field.x = array("i", self.x)
+        field.y = array("i", self.y)
+        field.width = array("i", self.width)
+        field.height = array("i", self.height)
+        field.hp = array("i", self.hp)
+        field.score = array("i", self.score)
+        field.type_id = array("H", self.type_id)
+        field.color = array("H", self.color)
+        field.palette = array("I", self.palette)
+        field.palette_ids = dict(self.palette_ids)
+        field.alive = bytearray(self.alive)
+        field.types = list(self.types)
+        field.type_ids = dict(self.type_ids)
+        field.live = self.live
+        return field
+
+    def rect(self, index: int) -> Tuple[int, int, int, int]:
+        return (self.x[index], self.y[index], self.width[index], self.height[index])
+
+    #
+    # Apply damage to a block. Returns True if the block is destroyed.
+    #
+    def hit(self, index: int) -> bool:
+        self.hp[index] -= 1
+        if self.hp[index] <= 0:
+            self.kill(index)
+            return True
+        return False
+
+    def kill(self, index: int) -> None:
+        if self.alive[index]:
+            self.alive[index] = 0
+            self.live -= 1
+
+    def alive_indices(self) -> List[int]:
+        return list(compress(range(len(self.alive)), self.alive))
+
+    #
+    # Block views
+    #
+    def block(self, index: int) -> "BlockView":
+        return BlockView(self, index)
+
+    def blocks(self) -> List["BlockView"]:
+        return [BlockView(self, i) for i in range(len(self.alive))]
+
+    def live_blocks(self) -> List["BlockView"]:
+        return [BlockView(self, i) for i in self.alive_indices()]
+
+    def __len__(self) -> int:
+        return len(self.alive)
+
+    def __repr__(self) -> str:
+        return f"BlockField(blocks={len(self.alive)},live={self.live})"  # return string repr
+
+
+#
+# A Block backed by one slot of a BlockField. Reads and writes go straight
+# to the field's arrays, so hit() on a view damages the stored block.
+#
+class BlockView(Block):
+    def __init__(self, field: BlockField, index: int):
+        self.field = field
+        self.index = index
+
+    def hit(self) -> bool:
+        return self.field.hit(self.index)
+
+    x = property(lambda self: self.field.x[self.index],
+                 lambda self, v: self.field.x.__setitem__(self.index, int(v)))
+    y = property(lambda self: self.field.y[self.index],
+                 lambda self, v: self.field.y.__setitem__(self.index, int(v)))
+    width = property(lambda self: self.field.width[self.index],
+                     lambda self, v: self.field.width.__setitem__(self.index, int(v)))
+    height = property(lambda self: self.field.height[self.index],
+                      lambda self, v: self.field.height.__setitem__(self.index, int(v)))
+    hp = property(lambda self: self.field.hp[self.index],
+                  lambda self, v: self.field.hp.__setitem__(self.index, int(v)))
+    score = property(lambda self: self.field.score[self.index],
+                     lambda self, v: self.field.score.__setitem__(self.index, int(v)))
+    type = property(lambda self: self.field.types[self.field.type_id[self.index]],
+                    lambda self, v: self.field.type_id.__setitem__(self.index, self.field.type_index(v)))
+    color = property(lambda self: f"#{self.field.color_of(self.index):06X}",
+                     lambda self, v: self.field.color.__setitem__(self.index, self.field.palette_index(pack_color(v))))
+
+    @property
+    def alive(self) -> bool:
+        return bool(self.field.alive[self.index])
@@ -1,18 +1,71 @@
 #
-# Level loader that parses JSON level files and constructs Block objects.
+# Level loader that parses JSON level files into a BlockField.
 #
 import json
-from typing import List
+import re
+from typing import List, NamedTuple, Union
 from Core import config
 from Objects.block import Block
+from Objects.blockField import BlockField, pack_color
+from Objects.spatialGrid import SpatialGrid
+
+#
+# Level files are named levelN.json, N being the level number
+#
+LEVEL_FILE = re.compile(r"level(\d+)\.json$", re.IGNORECASE)
+
+
+#
+# Level metadata, as listed by a level manifest or pack index
+#
+class LevelEntry(NamedTuple):
+    number: int
+    path: str
+    size: int
+    mtime_ns: int
+    blocks: int
+    title: str
+
+
+#
+# Read a level file's block count and title (an optional "title" key,
+# "Level N" by default). Unreadable files are listed with no blocks.
+# Manifests only call this for files whose size or mtime changed.
+#
+def read_level_entry(number: int, path: str, size: int = 0, mtime_ns: int = 0) -> LevelEntry:
+    try:
+        with open(path, "r", encoding="utf-8") as fh:
+            data = json.load(fh)
+        blocks = len(data.get("blocks", []))
+        title = str(data.get("title") or f"Level {number}")
+    except (OSError, ValueError, AttributeError, TypeError):
+        blocks, title = 0, f"Level {number}"
+    return LevelEntry(number, path, size, mtime_ns, blocks, title)
 
 
 class Level:
-    def __init__(self, width: int, height: int, tile_size: int, blocks: List[Block]):
+    #
+    # `blocks` is either a list of Block objects or a ready BlockField.
+    # `grid` is a prebuilt index over them (from a compiled level), built from
+    # the blocks when not given.
+    #
+    def __init__(self, width: int, height: int, tile_size: int, blocks: Union[List[Block], BlockField],
+                 grid: SpatialGrid = None):
         self.width = width
         self.height = height
         self.tile_size = tile_size
-        self.blocks = blocks
+        self.field = blocks if isinstance(blocks, BlockField) else BlockField.from_blocks(blocks)
+        #
+        # Broad-phase index over the level's blocks, one cell per tile
+        #
+        self.grid = grid if grid is not None else SpatialGrid.from_field(self.field, tile_size)
+
+    #
+    # Block views onto the level's field, built on demand
+    #
+    @property
+    def blocks(self) -> List[Block]:
+        return self.field.blocks()
 
     #
     # Load a level from a JSON file.
@@ -21,8 +74,11 @@ class Level:
     #   "width": 800,
     #   "height": 600,
     #   "tile_size": 40,
+    #   "palette": ["#FF0000", "#00FF00", ...],                   (optional)
     #   "blocks": [ {"x":0,"y":0,"type":"normal","hp":1,...}, ... ]
     # }
+    # A block "color" is either a "#RRGGBB" string or an index into the
+    # level's palette.
     #
     @staticmethod
     def from_file(path: str) -> "Level":
@@ -34,7 +90,12 @@ class Level:
         tile_size = int(data.get("tile_size", config.TILE_SIZE))
 
         raw_blocks = data.get("blocks", [])
-        blocks: List[Block] = []
+        field = BlockField()
+        try:
+            palette = [field.palette_index(pack_color(c)) for c in data.get("palette", [])]
+        except ValueError as e:
+            raise ValueError(f"Invalid palette in {path}: {e}")
+        colors = {}  # hex string -> palette index
 
         for idx, entry in enumerate(raw_blocks):
             try:
@@ -51,6 +112,17 @@ class Level:
             hp = int(entry.get("hp", 1))
             score = int(entry.get("score", 100))
             color = entry.get("color", "#FFFFFF")
+            if isinstance(color, int):
+                if not 0 <= color < len(palette):
+                    raise ValueError(f"Block at index {idx} has unknown palette colour {color} in {path}")
+                color_id = palette[color]
+            else:
+                color_id = colors.get(color)
+                if color_id is None:
+                    try:
+                        color_id = colors[color] = field.palette_index(pack_color(color))
+                    except ValueError as e:
+                        raise ValueError(f"Block at index {idx} in {path}: {e}")
 
             #
             # Basic bounds check (grid-based)
@@ -59,7 +131,10 @@ class Level:
                 raise ValueError(f"Block at index {idx} has negative grid coordinates: {gx},{gy}")
             # if gx < 0 or gy < 0:
 
-            blocks.append(Block(px, py, w, h, btype, hp, score, color))
+            try:
+                field.append(px, py, w, h, btype, hp, score, color_id=color_id)
+            except ValueError as e:
+                raise ValueError(f"Block at index {idx} in {path}: {e}")
         # for idx, entry in enumerate(raw_blocks):
 
-        return Level(width, height, tile_size, blocks)
+        return Level(width, height, tile_size, field)
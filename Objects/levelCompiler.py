@@ -0,0 +1,190 @@
+#
+# Compiled binary levels.
+# JSON stays the authoring format. On load each level is compiled once into a
+# cache file next to it (config.LEVEL_CACHE_DIR), keyed on the source file's
+# mtime and size, and later loads memory-map that file and copy its columns
+# straight into the BlockField arrays with no per-field Python conversion.
+#
+# File layout (little-endian):
+#   header   HEADER, see below
+#   palette  n_palette x uint32 (packed 0xRRGGBB)
+#   types    types_len bytes, block type names joined by "\n", padded to 4
+#   columns  x, y, width, height, hp, score as n_blocks x int32 each,
+#            then type_id and color (palette index) as n_blocks x uint16 each
+#   grid     the SpatialGrid cells: cell x, cell y and id count as
+#            n_cells x int32 each, then every cell's block ids in order as
+#            n_cell_ids x int32, so loading does not rebuild the index
+#
+import mmap
+import os
+import struct
+import sys
+import threading
+from array import array
+from itertools import accumulate
+from typing import Optional, Tuple
+from Core import config
+from Objects.blockField import BlockField
+from Objects.level import Level
+from Objects.spatialGrid import SpatialGrid
+
+MAGIC = b"BKLV"
+VERSION = 2
+
+#
+# magic, version, reserved, source mtime_ns, source size, width, height,
+# tile_size, n_palette, types_len, n_blocks, n_cells, n_cell_ids
+#
+HEADER = struct.Struct("<4sHHqqiiiIIIII")
+
+INT_COLUMNS = ("x", "y", "width", "height", "hp", "score")
+SHORT_COLUMNS = ("type_id", "color")
+
+
+def _little_endian(values: array) -> array:
+    if sys.byteorder == "big":
+        values = array(values.typecode, values)
+        values.byteswap()
+    return values
+
+
+def _pad4(n: int) -> int:
+    return (n + 3) & ~3
+
+
+#
+# Cache file path for a JSON level, or None when caching is disabled
+#
+def cache_path(source: str, cache_dir: str = None) -> Optional[str]:
+    cache_dir = config.LEVEL_CACHE_DIR if cache_dir is None else cache_dir
+    if not cache_dir:
+        return None
+    folder, name = os.path.split(os.path.abspath(source))
+    stem = os.path.splitext(name)[0]
+    return os.path.join(folder, cache_dir, stem + ".lvl")
+
+
+#
+# `level` in compiled form. `key` is the source (mtime_ns, size).
+#
+def compile_level(level: Level, key: Tuple[int, int] = (0, 0)) -> bytes:
+    field = level.field
+    cells = level.grid.cells
+    types = "\n".join(field.types).encode("utf-8")
+    cell_x = array("i", [cx for cx, _ in cells])
+    cell_y = array("i", [cy for _, cy in cells])
+    counts = array("i", map(len, cells.values()))
+    cell_ids = array("i", [i for cell in cells.values() for i in cell])
+    header = HEADER.pack(MAGIC, VERSION, 0, key[0], key[1], level.width, level.height,
+                         level.tile_size, len(field.palette), len(types), len(field),
+                         len(cells), len(cell_ids))
+
+    parts = [header, _little_endian(field.palette).tobytes(), types.ljust(_pad4(len(types)), b"\0")]
+    for name in INT_COLUMNS + SHORT_COLUMNS:
+        parts.append(_little_endian(getattr(field, name)).tobytes())
+    for column in (cell_x, cell_y, counts, cell_ids):
+        parts.append(_little_endian(column).tobytes())
+    return b"".join(parts)
+
+
+#
+# Write a file under a temporary name and rename it into place, so a
+# concurrent reader never sees a partial file
+#
+def write_atomic(path: str, data: bytes) -> None:
+    os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+    tmp = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+    with open(tmp, "wb") as fh:
+        fh.write(data)
+    os.replace(tmp, path)
+
+
+def write_compiled(level: Level, path: str, key: Tuple[int, int] = (0, 0)) -> None:
+    write_atomic(path, compile_level(level, key))
+
+
+#
+# Build a Level from compiled bytes (any buffer: bytes, mmap, memoryview
+# slice). Raises ValueError if the data is not a compiled level of this
+# version, or was compiled from a different source `key`.
+#
+def parse_compiled(buffer, key: Tuple[int, int] = None, name: str = "level") -> Level:
+    with memoryview(buffer) as view:
+        if len(view) < HEADER.size:
+            raise ValueError(f"{name} is not a compiled level")
+        (magic, version, _, mtime_ns, size, width, height, tile_size,
+         n_palette, types_len, n_blocks, n_cells, n_cell_ids) = HEADER.unpack_from(view, 0)
+        if magic != MAGIC or version != VERSION:
+            raise ValueError(f"{name} is not a version {VERSION} compiled level")
+        if key is not None and (mtime_ns, size) != tuple(key):
+            raise ValueError(f"{name} is out of date")
+
+        expected = HEADER.size + 4 * n_palette + _pad4(types_len) + n_blocks * (
+            4 * len(INT_COLUMNS) + 2 * len(SHORT_COLUMNS)) + 4 * (3 * n_cells + n_cell_ids)
+        if len(view) != expected:
+            raise ValueError(f"{name} is truncated")
+
+        field = BlockField()
+        offset = HEADER.size
+        field.palette.frombytes(view[offset:offset + 4 * n_palette])
+        offset += 4 * n_palette
+        types = bytes(view[offset:offset + types_len]).decode("utf-8")
+        offset += _pad4(types_len)
+        for column_name, width_bytes in [(n, 4) for n in INT_COLUMNS] + [(n, 2) for n in SHORT_COLUMNS]:
+            column = getattr(field, column_name)
+            column.frombytes(view[offset:offset + width_bytes * n_blocks])
+            offset += width_bytes * n_blocks
+        grid_columns = []
+        for count in (n_cells, n_cells, n_cells, n_cell_ids):
+            column = array("i")
+            column.frombytes(view[offset:offset + 4 * count])
+            grid_columns.append(column)
+            offset += 4 * count
+
+    if sys.byteorder == "big":
+        for name in ("palette",) + INT_COLUMNS + SHORT_COLUMNS:
+            getattr(field, name).byteswap()
+        for column in grid_columns:
+            column.byteswap()
+    field.types = types.split("\n") if types_len else []
+    field.type_ids = {name: i for i, name in enumerate(field.types)}
+    field.palette_ids = {packed: i for i, packed in enumerate(field.palette)}
+    field.alive = bytearray(b"\1") * n_blocks
+    field.live = n_blocks
+
+    cell_x, cell_y, counts, cell_ids = (column.tolist() for column in grid_columns)
+    ends = list(accumulate(counts))
+    grid = SpatialGrid(tile_size)
+    grid.cells = {key: cell_ids[end - n:end] for key, n, end in zip(zip(cell_x, cell_y), counts, ends)}
+    return Level(width, height, tile_size, field, grid)
+
+
+def read_compiled(path: str, key: Tuple[int, int] = None) -> Level:
+    with open(path, "rb") as fh:
+        with mmap.mmap(fh.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            return parse_compiled(mm, key, path)
+
+
+#
+# Load a JSON level through the compiled cache: read the cache file if it
+# matches the source, otherwise parse the JSON and (re)compile it. If the
+# cache cannot be written the parsed level is still returned.
+#
+def load_level(source: str, cache_dir: str = None) -> Level:
+    path = cache_path(source, cache_dir)
+    if path is None:
+        return Level.from_file(source)
+
+    st = os.stat(source)
+    key = (st.st_mtime_ns, st.st_size)
+    try:
+        return read_compiled(path, key)
+    except (OSError, ValueError):
+        pass
+
+    level = Level.from_file(source)
+    try:
+        write_compiled(level, path, key)
+    except OSError as e:
+        print(f"Could not cache compiled level {path}: {e}")
+    return level
@@ -0,0 +1,173 @@
+#
+# Procedural stress levels.
+# Writes seeded, reproducible levels in the JSON level schema for benchmarks
+# and soak tests, from a handful of blocks up to millions. Blocks are
+# generated and written one line at a time, so memory use does not grow with
+# the block count.
+#
+# Placement:
+#   grid     blocks sit in distinct tiles, chosen uniformly from a region of
+#            blocks / density tiles, and are never larger than a tile
+#   overlap  blocks land on random tiles of that region, several may share a
+#            tile, and sizes can reach a few tiles so neighbours overlap
+#
+# The tile size shrinks so the region fits the top two thirds of the level;
+# once a tile is a single pixel the region grows downwards instead and the
+# level's "height" is raised to cover it.
+#
+import json
+import math
+import os
+import random
+from typing import Dict, Iterator, List, NamedTuple, Sequence, Tuple
+from Core import config
+
+PLACEMENTS = ("grid", "overlap")
+PALETTE = ["#FF0000", "#FF7F00", "#FFFF00", "#00FF00", "#0000FF", "#9400D3"]
+MAX_BLOCKS = 1_000_000
+MAX_OVERLAP_SIZE = 3.0  # largest block side in overlap placement, in tiles
+
+BLOCK_LINE = '    {"x": %d, "y": %d, "hp": %d, "score": %d, "color": %d, "width": %d, "height": %d}'
+
+
+class LevelLayout(NamedTuple):
+    tile_size: int
+    columns: int
+    rows: int
+    cells: int
+    width: int
+    height: int
+
+
+#
+# Parse an hp distribution such as "1:6,2:3,3:1" (hp:weight pairs)
+#
+def parse_hp_weights(text: str) -> Dict[int, float]:
+    weights = {}
+    for part in text.split(","):
+        hp, _, weight = part.partition(":")
+        weights[int(hp)] = float(weight or 1)
+    if not weights or min(weights) < 1 or min(weights.values()) < 0 or not sum(weights.values()):
+        raise ValueError(f"Invalid hp distribution {text!r}")
+    return weights
+
+
+#
+# Raise ValueError for parameters no level can be generated from. Called
+# before anything is written, so a bad argument never leaves a partial file.
+#
+def check_parameters(blocks: int, density: float, placement: str = "grid",
+                     min_size: float = 1.0, max_size: float = 1.0, width: int = None, height: int = None) -> None:
+    if placement not in PLACEMENTS:
+        raise ValueError(f"Unknown placement {placement!r}, expected one of {PLACEMENTS}")
+    if not 0 <= blocks <= MAX_BLOCKS:
+        raise ValueError(f"Block count must be between 0 and {MAX_BLOCKS}")
+    if not density > 0 or (placement == "grid" and density > 1):
+        raise ValueError("Density must be above 0, and at most 1 for grid placement")
+    if not 0 < min_size <= max_size:
+        raise ValueError("Block sizes must be above 0, with min_size at most max_size")
+    if (width is not None and width < 1) or (height is not None and height < 1):
+        raise ValueError("Level width and height must be at least 1")
+
+
+def layout(blocks: int, density: float, width: int = None, height: int = None) -> LevelLayout:
+    check_parameters(blocks, density, "overlap", width=width, height=height)
+    width = int(width or config.SCREEN_WIDTH)
+    height = int(height or config.SCREEN_HEIGHT)
+    cells = max(1, math.ceil(blocks / density))
+    area = width * height * 2 // 3
+    tile = max(1, min(config.TILE_SIZE, int((area / cells) ** 0.5)))
+    columns = max(1, width // tile)
+    rows = math.ceil(cells / columns)
+    return LevelLayout(tile, columns, rows, cells, width, max(height, rows * tile))
+
+
+#
+# Yield (x, y, w, h, hp) for every block, x and y in tiles, w and h in pixels
+#
+def iter_blocks(blocks: int, seed: int = 0, density: float = 0.8, hp_weights: Dict[int, float] = None,
+                min_size: float = 1.0, max_size: float = 1.0, placement: str = "grid",
+                grid: LevelLayout = None) -> Iterator[Tuple[int, int, int, int, int]]:
+    check_parameters(blocks, density, placement, min_size, max_size)
+    rng = random.Random(seed)
+    grid = grid or layout(blocks, density)
+    tile, columns, cells = grid.tile_size, grid.columns, grid.cells
+    hp_values = sorted((hp_weights or {1: 1}).items())
+    hps = [hp for hp, _ in hp_values]
+    cum_weights = []
+    total = 0.0
+    for _, weight in hp_values:
+        total += weight
+        cum_weights.append(total)
+
+    top = MAX_OVERLAP_SIZE if placement == "overlap" else 1.0
+    low = max(1.0 / tile, min(min_size, top))
+    high = max(low, min(max_size, top))
+
+    def block(cell):
+        w = max(1, int(tile * rng.uniform(low, high)))
+        h = max(1, int(tile * rng.uniform(low, high)))
+        hp = rng.choices(hps, cum_weights=cum_weights)[0]
+        return cell % columns, cell // columns, w, h, hp
+
+    if placement == "grid":
+        #
+        # Selection sampling: each tile in order is taken with probability
+        # (blocks still needed) / (tiles left), giving exactly `blocks`
+        # distinct tiles in one pass
+        #
+        needed = blocks
+        for cell in range(cells):
+            if needed == 0:
+                break
+            if rng.random() * (cells - cell) < needed:
+                needed -= 1
+                yield block(cell)
+    else:
+        for _ in range(blocks):
+            yield block(rng.randrange(cells))
+
+
+#
+# Write a generated level to `path`. Returns the layout used.
+#
+def write_level(path: str, blocks: int, seed: int = 0, density: float = 0.8,
+                hp_weights: Dict[int, float] = None, min_size: float = 1.0, max_size: float = 1.0,
+                placement: str = "grid", width: int = None, height: int = None,
+                palette: Sequence[str] = PALETTE) -> LevelLayout:
+    check_parameters(blocks, density, placement, min_size, max_size, width, height)
+    if not palette:
+        raise ValueError("Palette must have at least one colour")
+    grid = layout(blocks, density, width, height)
+    header = {
+        "title": f"Stress {blocks} {placement} (seed {seed})",
+        "width": grid.width,
+        "height": grid.height,
+        "tile_size": grid.tile_size,
+        "palette": list(palette),
+    }
+    colors = len(palette)
+
+    os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+    tmp = f"{path}.{os.getpid()}.tmp"
+    try:
+        with open(tmp, "w", encoding="utf-8", buffering=1 << 20) as fh:
+            fh.write(json.dumps(header)[:-1] + ', "blocks": [\n')
+            lines: List[str] = []
+            separator = ""
+            for x, y, w, h, hp in iter_blocks(blocks, seed, density, hp_weights, min_size, max_size,
+                                              placement, grid):
+                lines.append(BLOCK_LINE % (x, y, hp, 100 * hp, (x + y) % colors, w, h))
+                if len(lines) == 4096:
+                    fh.write(separator + ",\n".join(lines))
+                    separator = ",\n"
+                    lines.clear()
+            if lines:
+                fh.write(separator + ",\n".join(lines))
+            fh.write("\n  ]\n}\n")
+        os.replace(tmp, path)
+    except BaseException:
+        if os.path.exists(tmp):
+            os.remove(tmp)
+        raise
+    return grid
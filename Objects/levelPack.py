@@ -0,0 +1,148 @@
+#
+# Level pack: every level of a game in one file.
+# The file starts with a header and an index giving, for each level number,
+# its block count, title and the offset and length of the level's compiled
+# data (see Objects.levelCompiler). A pack is opened and memory-mapped once;
+# loading a level reads only its own slice, so cold start costs one open no
+# matter how many levels ship.
+#
+# File layout (little-endian):
+#   header   PACK_HEADER: magic, version, reserved, level count
+#   index    count x INDEX_ENTRY, sorted by level number
+#   titles   utf-8 titles, addressed by the index
+#   levels   compiled levels, each aligned to 8 bytes
+#
+import glob
+import mmap
+import os
+import struct
+from typing import Dict, List, Optional, Tuple
+from Objects.level import LEVEL_FILE, Level, LevelEntry, read_level_entry
+from Objects.levelCompiler import compile_level, parse_compiled, write_atomic
+
+PACK_MAGIC = b"BKPK"
+PACK_VERSION = 2  # follows the compiled level version
+PACK_HEADER = struct.Struct("<4sHHI")
+
+#
+# number, blocks, level offset, level length, title offset, title length
+#
+INDEX_ENTRY = struct.Struct("<IIQQQI")
+
+
+def _align8(n: int) -> int:
+    return (n + 7) & ~7
+
+
+class LevelPack:
+    def __init__(self, path: str):
+        self.path = path
+        self.file = open(path, "rb")
+        try:
+            self.map = mmap.mmap(self.file.fileno(), 0, access=mmap.ACCESS_READ)
+            self.entries, self.spans = self.read_index()
+        except Exception:
+            self.close()
+            raise
+
+    def read_index(self) -> Tuple[Dict[int, LevelEntry], Dict[int, Tuple[int, int]]]:
+        mm = self.map
+        if len(mm) < PACK_HEADER.size:
+            raise ValueError(f"{self.path} is not a level pack")
+        magic, version, _, count = PACK_HEADER.unpack_from(mm, 0)
+        if magic != PACK_MAGIC or version != PACK_VERSION:
+            raise ValueError(f"{self.path} is not a version {PACK_VERSION} level pack")
+
+        mtime_ns = os.fstat(self.file.fileno()).st_mtime_ns
+        entries: Dict[int, LevelEntry] = {}
+        spans: Dict[int, Tuple[int, int]] = {}
+        for i in range(count):
+            number, blocks, offset, length, title_offset, title_len = INDEX_ENTRY.unpack_from(
+                mm, PACK_HEADER.size + i * INDEX_ENTRY.size)
+            if offset + length > len(mm) or title_offset + title_len > len(mm):
+                raise ValueError(f"{self.path} is truncated")
+            title = mm[title_offset:title_offset + title_len].decode("utf-8")
+            entries[number] = LevelEntry(number, self.path, length, mtime_ns, blocks, title)
+            spans[number] = (offset, length)
+        return entries, spans
+
+    #
+    # Same queries as levelManifest, so scoreManager can use either
+    #
+    def refresh(self) -> bool:
+        return False
+
+    def numbers(self) -> List[int]:
+        return list(self.entries)
+
+    def get(self, number: int) -> Optional[LevelEntry]:
+        return self.entries.get(number)
+
+    def next_number(self, number: int) -> Optional[int]:
+        return next((n for n in self.entries if n > number), None)
+
+    def load(self, number: int) -> Level:
+        span = self.spans.get(number)
+        if span is None:
+            raise KeyError(f"Level {number} is not in {self.path}")
+        offset, length = span
+        with memoryview(self.map) as view:
+            return parse_compiled(view[offset:offset + length], name=f"{self.path} level {number}")
+
+    def close(self) -> None:
+        if getattr(self, "map", None) is not None:
+            self.map.close()
+            self.map = None
+        self.file.close()
+
+    def __len__(self) -> int:
+        return len(self.entries)
+
+    def __repr__(self) -> str:
+        return f"LevelPack(path={self.path!r},levels={len(self.entries)})"  # return string repr
+
+
+#
+# Write a pack from (number, title, Level) triples
+#
+def write_pack(path: str, levels: List[Tuple[int, str, Level]]) -> None:
+    levels = sorted(levels, key=lambda item: item[0])
+    titles = [title.encode("utf-8") for _, title, _ in levels]
+    blobs = [compile_level(level) for _, _, level in levels]
+
+    title_start = PACK_HEADER.size + len(levels) * INDEX_ENTRY.size
+    offset = _align8(title_start + sum(len(t) for t in titles))
+    parts = [PACK_HEADER.pack(PACK_MAGIC, PACK_VERSION, 0, len(levels))]
+    title_offset = title_start
+    layout = []
+    for (number, _, level), title, blob in zip(levels, titles, blobs):
+        parts.append(INDEX_ENTRY.pack(number, len(level.field), offset, len(blob), title_offset, len(title)))
+        layout.append(offset)
+        title_offset += len(title)
+        offset = _align8(offset + len(blob))
+    parts.extend(titles)
+
+    data = bytearray(b"".join(parts))
+    for start, blob in zip(layout, blobs):
+        data.extend(b"\0" * (start - len(data)))
+        data.extend(blob)
+    write_atomic(path, bytes(data))
+
+
+#
+# Build a pack from every levelN.json in a directory. Returns the level
+# numbers packed; with none found, nothing is written.
+#
+def build_pack(levels_dir: str, path: str) -> List[int]:
+    levels = []
+    for source in glob.glob(os.path.join(levels_dir, "*.json")):
+        match = LEVEL_FILE.fullmatch(os.path.basename(source))
+        if not match:
+            continue
+        number = int(match.group(1))
+        title = read_level_entry(number, source).title
+        levels.append((number, title, Level.from_file(source)))
+    if not levels:
+        return []  # an empty pack would hide the levels directory from the game
+    write_pack(path, levels)
+    return sorted(number for number, _, _ in levels)
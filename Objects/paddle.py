@@ -11,6 +11,7 @@ class Paddle:
         self.x = float(x)  # center x
         self.y = float(y)  # center y
         self.speed = float(speed or config.PADDLE_SPEED)
+        self.prev_x = self.x
 
     #
     # Move paddle horizontally. Direction is -1 (left) .. 1 (right).
@@ -23,6 +24,19 @@ class Paddle:
         #
         self.x = max(half, min(config.SCREEN_WIDTH - half, self.x))  # clamp x position
 
+    #
+    # Remember the current position as the start of the next physics step
+    #
+    def snapshot(self) -> None:
+        self.prev_x = self.x
+
+    #
+    # Rect interpolated between the last two physics steps (alpha 0..1)
+    #
+    def render_rect(self, alpha: float = 1.0):
+        x = self.prev_x + (self.x - self.prev_x) * alpha
+        return (int(x - self.width / 2), int(self.y - self.height / 2), int(self.width), int(self.height))
+
     def rect(self):
         return (int(self.x - self.width / 2), int(self.y - self.height / 2), int(self.width), int(self.height))  # return rect tuple
 
@@ -0,0 +1,103 @@
+#
+# Uniform grid spatial index over level blocks.
+# Cells are square and keyed on the level's tile_size. Each cell holds the ids
+# of the BlockField blocks whose rectangle touches it, so lookups only visit
+# the cells that a query rectangle covers.
+#
+# copy() is copy-on-write: the copy shares the cell lists and a list is only
+# duplicated, by whichever grid changes it first, when a block is inserted or
+# removed in that cell. Resetting a level copies the dict, not every cell.
+#
+from typing import Dict, List, Optional, Sequence, Set, Tuple
+from Core import config
+from Objects.blockField import BlockField
+
+
+class SpatialGrid:
+    def __init__(self, cell_size: int = None):
+        self.cell_size = int(cell_size or config.TILE_SIZE)
+        self.cells: Dict[Tuple[int, int], List[int]] = {}
+        self.owned: Optional[Set[Tuple[int, int]]] = None  # cells not shared with a copy; None for all
+
+    @staticmethod
+    def from_field(field: BlockField, cell_size: int = None) -> "SpatialGrid":
+        grid = SpatialGrid(cell_size)
+        for index in field.alive_indices():
+            grid.insert(index, *field.rect(index))
+        return grid
+
+    #
+    # Inclusive cell range (cx0, cy0, cx1, cy1) covered by a rectangle.
+    #
+    def cell_range(self, x: float, y: float, w: float, h: float) -> Tuple[int, int, int, int]:
+        cs = self.cell_size
+        return (int(x // cs), int(y // cs), int((x + w) // cs), int((y + h) // cs))
+
+    #
+    # A cell's list, made private to this grid first if it is shared
+    #
+    def writable(self, key: Tuple[int, int]) -> List[int]:
+        cell = self.cells[key]
+        if self.owned is not None and key not in self.owned:
+            cell = self.cells[key] = list(cell)
+            self.owned.add(key)
+        return cell
+
+    def insert(self, index: int, x: int, y: int, w: int, h: int) -> None:
+        cx0, cy0, cx1, cy1 = self.cell_range(x, y, w, h)
+        for cy in range(cy0, cy1 + 1):
+            for cx in range(cx0, cx1 + 1):
+                if (cx, cy) in self.cells:
+                    self.writable((cx, cy)).append(index)
+                else:
+                    self.cells[(cx, cy)] = [index]
+                    if self.owned is not None:
+                        self.owned.add((cx, cy))
+
+    def remove(self, index: int, x: int, y: int, w: int, h: int) -> None:
+        cx0, cy0, cx1, cy1 = self.cell_range(x, y, w, h)
+        for cy in range(cy0, cy1 + 1):
+            for cx in range(cx0, cx1 + 1):
+                cell = self.cells.get((cx, cy))
+                if cell is None or index not in cell:
+                    continue
+                cell = self.writable((cx, cy))
+                cell.remove(index)
+                if not cell:
+                    del self.cells[(cx, cy)]
+
+    #
+    # Return the ids stored in the cells covered by the rectangle.
+    # Blocks spanning several cells are only returned once. A query inside a
+    # single cell returns that cell's own list, which callers must not modify.
+    #
+    def query(self, x: float, y: float, w: float, h: float) -> Sequence[int]:
+        cx0, cy0, cx1, cy1 = self.cell_range(x, y, w, h)
+        if cx0 == cx1 and cy0 == cy1:
+            return self.cells.get((cx0, cy0), ())
+
+        found: List[int] = []
+        seen = set()
+        for cy in range(cy0, cy1 + 1):
+            for cx in range(cx0, cx1 + 1):
+                cell = self.cells.get((cx, cy))
+                if not cell:
+                    continue
+                for index in cell:
+                    if index not in seen:
+                        seen.add(index)
+                        found.append(index)
+        return found
+
+    def copy(self) -> "SpatialGrid":
+        grid = SpatialGrid(self.cell_size)
+        grid.cells = dict(self.cells)
+        #
+        # Every list is now shared, so neither grid may change one in place
+        #
+        self.owned = set()
+        grid.owned = set()
+        return grid
+
+    def __repr__(self) -> str:
+        return f"SpatialGrid(cell_size={self.cell_size},cells={len(self.cells)})"  # return string repr
@@ -0,0 +1,49 @@
+#
+# Level pack builder.
+# Compiles every levelN.json in a directory into one level pack file, which
+# the game then reads instead of the loose JSON files (see Objects.levelPack).
+#
+# Usage:
+#   python -m Tools.buildLevelPack [levels_dir] [--out=Assets/levels.pack]
+#
+import argparse
+import os
+import sys
+
+#
+# Allow running as a script from the Tools folder
+#
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from Core import config
+from Objects.levelPack import LevelPack, build_pack
+
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Build a level pack from a directory of JSON levels.")
+    parser.add_argument("levels_dir", nargs="?", default=os.path.join(ROOT, config.LEVELS_DIR),
+                        help="directory of levelN.json files (default: the game's levels directory)")
+    parser.add_argument("--out", default=os.path.join(ROOT, config.LEVEL_PACK),
+                        help="pack file to write (default: the pack the game loads)")
+    args = parser.parse_args(argv)
+
+    numbers = build_pack(args.levels_dir, args.out)
+    if not numbers:
+        print(f"No level files found in {args.levels_dir}")
+        return 1
+
+    pack = LevelPack(args.out)
+    try:
+        for number in numbers:
+            entry = pack.get(number)
+            print(f"level {number}: {entry.title}, {entry.blocks} blocks, {entry.size} bytes")
+    finally:
+        pack.close()
+    print(f"Wrote {len(numbers)} levels to {args.out} ({os.path.getsize(args.out)} bytes)")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
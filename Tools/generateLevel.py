@@ -0,0 +1,56 @@
+#
+# Stress level generator.
+# Writes a seeded synthetic level (see Objects.levelGenerator) for
+# benchmarking and soak testing. The same arguments always produce the same
+# file.
+#
+# Usage:
+#   python -m Tools.generateLevel out.json [--blocks=100000] [--seed=0] [--density=0.8]
+#                                 [--hp=1:6,2:3,3:1] [--min-size=0.5] [--max-size=1.0]
+#                                 [--placement=grid|overlap]
+#
+import argparse
+import os
+import sys
+import time
+
+#
+# Allow running as a script from the Tools folder
+#
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from Objects.levelGenerator import MAX_BLOCKS, PLACEMENTS, parse_hp_weights, write_level
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Generate a synthetic stress level.")
+    parser.add_argument("out", help="level file to write")
+    parser.add_argument("--blocks", type=int, default=10000, help=f"number of blocks, up to {MAX_BLOCKS}")
+    parser.add_argument("--seed", type=int, default=0, help="random seed")
+    parser.add_argument("--density", type=float, default=0.8,
+                        help="blocks per tile of the filled region (above 1 only with overlap placement)")
+    parser.add_argument("--hp", default="1:6,2:3,3:1", help="hp distribution as hp:weight pairs")
+    parser.add_argument("--min-size", type=float, default=1.0, help="smallest block side, in tiles")
+    parser.add_argument("--max-size", type=float, default=1.0, help="largest block side, in tiles")
+    parser.add_argument("--placement", choices=PLACEMENTS, default="grid",
+                        help="grid: one block per tile; overlap: random tiles, blocks may overlap")
+    parser.add_argument("--width", type=int, default=None, help="level width in pixels")
+    parser.add_argument("--height", type=int, default=None, help="level height in pixels")
+    args = parser.parse_args(argv)
+
+    try:
+        hp_weights = parse_hp_weights(args.hp)
+        t0 = time.perf_counter()
+        grid = write_level(args.out, args.blocks, args.seed, args.density, hp_weights, args.min_size,
+                           args.max_size, args.placement, args.width, args.height)
+    except ValueError as e:
+        print(e)
+        return 1
+    print(f"Wrote {args.blocks} blocks to {args.out} ({os.path.getsize(args.out)} bytes) in "
+          f"{time.perf_counter() - t0:.2f}s: tile {grid.tile_size}px, {grid.columns}x{grid.rows} tiles, "
+          f"{grid.width}x{grid.height}px")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,3 +1,5 @@
 from .menu import menu, hex_to_rgb
+from .blockLayer import blockLayer
+from .textCache import textCache
 
-__all__ = ['menu', 'hex_to_rgb']
\ No newline at end of file
+__all__ = ['menu', 'hex_to_rgb', 'blockLayer', 'textCache']
\ No newline at end of file
@@ -0,0 +1,87 @@
+#
+# Cached static block layer.
+# The level's blocks are drawn once into an off-screen surface when a level is
+# loaded or reset. After that only the rectangles of blocks that were hit are
+# redrawn, and each frame just blits the layer, so render cost does not grow
+# with block count. Block colours are mapped to display pixel values once per
+# palette entry, so drawing a block is a plain fill.
+#
+from typing import Iterable, List, Optional, Tuple
+import pygame
+from Objects.blockField import BlockField, unpack_color
+from Objects.spatialGrid import SpatialGrid
+
+BACKGROUND = (0, 0, 0)
+OUTLINE = (255, 255, 255)
+
+
+class blockLayer:
+    def __init__(self, size: Tuple[int, int]):
+        self.surface = pygame.Surface(size)
+        if pygame.display.get_surface() is not None:
+            self.surface = self.surface.convert()
+        self.field: Optional[BlockField] = None
+        self.grid: Optional[SpatialGrid] = None
+        self.pixels: List[int] = []  # mapped colour per palette index
+        self.outline = self.surface.map_rgb(OUTLINE)
+
+    #
+    # True when the layer was built from a different (reloaded) field
+    #
+    def is_stale(self, field: BlockField) -> bool:
+        return self.field is not field
+
+    #
+    # Map any palette entries added since the last call
+    #
+    def map_palette(self) -> None:
+        palette = self.field.palette
+        for packed in palette[len(self.pixels):]:
+            self.pixels.append(self.surface.map_rgb(unpack_color(packed)))
+
+    def draw_block(self, index: int) -> None:
+        field = self.field
+        r = (field.x[index], field.y[index], field.width[index], field.height[index])
+        color_id = field.color[index]
+        if color_id >= len(self.pixels):
+            self.map_palette()
+        self.surface.fill(self.pixels[color_id], r)
+        #
+        # Draw white outline
+        #
+        pygame.draw.rect(self.surface, self.outline, r, width=1)
+
+    #
+    # Redraw the whole layer from the live blocks
+    #
+    def build(self, field: BlockField, grid: SpatialGrid) -> None:
+        self.field = field
+        self.grid = grid
+        self.pixels = []
+        self.map_palette()
+        self.surface.fill(BACKGROUND)
+        for i in field.alive_indices():
+            self.draw_block(i)
+
+    #
+    # Redraw the area of each damaged or destroyed block: clear it and repaint
+    # the live blocks overlapping it, in field order, clipped to that area.
+    # Returns the patched areas.
+    #
+    def patch(self, indices: Iterable[int]) -> List[pygame.Rect]:
+        field = self.field
+        areas = []
+        for index in indices:
+            x, y, w, h = field.rect(index)
+            area = pygame.Rect(x, y, w, h)
+            areas.append(area)
+            self.surface.set_clip(area)
+            self.surface.fill(BACKGROUND, area)
+            for i in sorted(self.grid.query(x, y, w, h)):
+                if field.alive[i]:
+                    self.draw_block(i)
+        self.surface.set_clip(None)
+        return areas
+
+    def draw(self, screen: pygame.Surface) -> None:
+        screen.blit(self.surface, (0, 0))
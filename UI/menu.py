@@ -1,7 +1,7 @@
-from turtle import title
-from typing import Tuple
+from typing import Dict, List, Tuple
 import pygame
 from Core import config
+from UI.textCache import textCache
 
 def hex_to_rgb(hexstr: str) -> Tuple[int, int, int]:
     s = hexstr.lstrip("#")
@@ -11,10 +11,12 @@ def hex_to_rgb(hexstr: str) -> Tuple[int, int, int]:
 
 class menu:
     def __init__(self):
-        # Initialize fonts
-        self.font_large = pygame.font.SysFont(None, 72)
-        self.font_medium = pygame.font.SysFont(None, 36)
-        self.font_small = pygame.font.SysFont(None, 24)
+        # Fonts by size, loaded on first use
+        self.fonts: Dict[int, pygame.font.Font] = {}
+        
+        # Rendered text, and the HUD fields' last text and surface
+        self.text = textCache()
+        self.hud_fields = {}
         
         # Colors
         self.colors = {
@@ -25,24 +27,50 @@ class menu:
             'blue': (100, 150, 255),
         }
     
+    #
+    # The default font is loaded directly: SysFont(None, ...) returns the same
+    # font but first scans every installed system font
+    #
+    def get_font(self, size: int) -> pygame.font.Font:
+        font = self.fonts.get(size)
+        if font is None:
+            if not pygame.font.get_init():
+                pygame.font.init()
+            font = self.fonts[size] = pygame.font.Font(None, size)
+        return font
+    
+    @property
+    def font_large(self) -> pygame.font.Font:
+        return self.get_font(72)
+    
+    @property
+    def font_medium(self) -> pygame.font.Font:
+        return self.get_font(36)
+    
+    @property
+    def font_small(self) -> pygame.font.Font:
+        return self.get_font(24)
+    
     def draw_menu(self, screen: pygame.Surface) -> None:
         screen.fill((0, 0, 0))
         
-        title = self.font_large.render("BREAKOUT", True, self.colors['white'])
-        start = self.font_medium.render("Press SPACE to Start", True, self.colors['light_gray'])
-        quit_text = self.font_medium.render("Press ESC to Quit", True, self.colors['light_gray'])
+        title = self.text.render(self.font_large, "BREAKOUT", True, self.colors['white'])
+        start = self.text.render(self.font_medium, "Press SPACE to Start", True, self.colors['light_gray'])
+        quit_text = self.text.render(self.font_medium, "Press ESC to Quit", True, self.colors['light_gray'])
         
         screen.blit(title, (config.SCREEN_WIDTH//2 - title.get_width()//2, 150))
         screen.blit(start, (config.SCREEN_WIDTH//2 - start.get_width()//2, 250))
         screen.blit(quit_text, (config.SCREEN_WIDTH//2 - quit_text.get_width()//2, 300))
     
-    def draw_level_select(self, screen: pygame.Surface, available_levels: list, selected_index: int) -> None:
+    def draw_level_select(self, screen: pygame.Surface, available_levels: list, selected_index: int,
+                          entries: dict = None) -> None:
         """Draw level selection screen with available levels.
         
         Args:
             screen: Pygame surface to draw on
             available_levels: List of available level numbers
             selected_index: Index of currently selected level
+            entries: Optional level number -> LevelEntry, for titles and block counts
         """
         screen.fill((0, 0, 0))
         
@@ -51,7 +79,7 @@ class menu:
         # Mike: Added a level select feature so that we can more easily test
         # levels, as we add more of them.
         #
-        title = self.font_large.render("SELECT LEVEL", True, self.colors['white'])
+        title = self.text.render(self.font_large, "SELECT LEVEL", True, self.colors['white'])
         screen.blit(title, (config.SCREEN_WIDTH//2 - title.get_width()//2, 80))
         
         # Draw level options
@@ -70,11 +98,17 @@ class menu:
                 color = self.colors['light_gray']
                 prefix = "   "
             
-            level_text = self.font_medium.render(f"{prefix}LEVEL {level_num}", True, color)
+            level_text = self.text.render(self.font_medium, f"{prefix}LEVEL {level_num}", True, color)
             screen.blit(level_text, (config.SCREEN_WIDTH//2 - level_text.get_width()//2, y_pos))
+            
+            # Title and block count from the level manifest
+            entry = entries.get(level_num) if entries else None
+            if entry is not None:
+                info = self.text.render(self.font_small, f"{entry.title} - {entry.blocks} blocks", True, self.colors['light_gray'])
+                screen.blit(info, (config.SCREEN_WIDTH//2 - info.get_width()//2, y_pos + level_text.get_height()))
         
         # Instructions
-        instructions = self.font_small.render("Use UP/DOWN arrows to select, ENTER to confirm", True, self.colors['light_gray'])
+        instructions = self.text.render(self.font_small, "Use UP/DOWN arrows to select, ENTER to confirm", True, self.colors['light_gray'])
         screen.blit(instructions, (config.SCREEN_WIDTH//2 - instructions.get_width()//2, config.SCREEN_HEIGHT - 100))
     
     def draw_pause_screen(self, screen: pygame.Surface) -> None:
@@ -84,8 +118,8 @@ class menu:
         screen.blit(overlay, (0, 0))
         
         # Draw pause text
-        pause_text = self.font_large.render("PAUSED", True, self.colors['white'])
-        continue_text = self.font_medium.render("Press P to Continue", True, self.colors['light_gray'])
+        pause_text = self.text.render(self.font_large, "PAUSED", True, self.colors['white'])
+        continue_text = self.text.render(self.font_medium, "Press P to Continue", True, self.colors['light_gray'])
         
         screen.blit(pause_text, (config.SCREEN_WIDTH//2 - pause_text.get_width()//2, 200))
         screen.blit(continue_text, (config.SCREEN_WIDTH//2 - continue_text.get_width()//2, 280))
@@ -95,14 +129,14 @@ class menu:
         screen.fill((0, 0, 0))
         
         if lives <= 0:
-            title = self.font_large.render("GAME OVER", True, self.colors['red'])
-            restart_text = self.font_medium.render("Press R to Restart", True, self.colors['light_gray'])
+            title = self.text.render(self.font_large, "GAME OVER", True, self.colors['red'])
+            restart_text = self.text.render(self.font_medium, "Press R to Restart", True, self.colors['light_gray'])
         else:
-            title = self.font_large.render("YOU WIN!", True, self.colors['green'])
-            restart_text = self.font_medium.render("Press R to Restart", True, self.colors['light_gray'])
+            title = self.text.render(self.font_large, "YOU WIN!", True, self.colors['green'])
+            restart_text = self.text.render(self.font_medium, "Press R to Restart", True, self.colors['light_gray'])
 
-        score_text = self.font_medium.render(f"Final Score: {score}", True, self.colors['white'])
-        quit_text = self.font_medium.render("Press ESC to Quit", True, self.colors['light_gray'])
+        score_text = self.text.render(self.font_medium, f"Final Score: {score}", True, self.colors['white'])
+        quit_text = self.text.render(self.font_medium, "Press ESC to Quit", True, self.colors['light_gray'])
 
         screen.blit(title, (config.SCREEN_WIDTH//2 - title.get_width()//2, 150))
         screen.blit(score_text, (config.SCREEN_WIDTH//2 - score_text.get_width()//2, 250))
@@ -113,11 +147,11 @@ class menu:
     def draw_next_level(self, screen: pygame.Surface, level_num: int, score: int) -> None:
         screen.fill((0, 0, 0))
         
-        title = self.font_large.render(f"LEVEL {level_num} COMPLETE!", True, self.colors['green'])
-        score_text = self.font_medium.render(f"Score: {score}", True, self.colors['white'])
-        next_text = self.font_medium.render("Press SPACE for Next Level", True, self.colors['light_gray'])
-        restart_text = self.font_medium.render("Press R to Replay Level", True, self.colors['light_gray'])
-        quit_text = self.font_medium.render("Press ESC to Quit", True, self.colors['light_gray'])
+        title = self.text.render(self.font_large, f"LEVEL {level_num} COMPLETE!", True, self.colors['green'])
+        score_text = self.text.render(self.font_medium, f"Score: {score}", True, self.colors['white'])
+        next_text = self.text.render(self.font_medium, "Press SPACE for Next Level", True, self.colors['light_gray'])
+        restart_text = self.text.render(self.font_medium, "Press R to Replay Level", True, self.colors['light_gray'])
+        quit_text = self.text.render(self.font_medium, "Press ESC to Quit", True, self.colors['light_gray'])
         
         screen.blit(title, (config.SCREEN_WIDTH//2 - title.get_width()//2, 150))
         screen.blit(score_text, (config.SCREEN_WIDTH//2 - score_text.get_width()//2, 250))
@@ -125,24 +159,38 @@ class menu:
         screen.blit(restart_text, (config.SCREEN_WIDTH//2 - restart_text.get_width()//2, 350))
         screen.blit(quit_text, (config.SCREEN_WIDTH//2 - quit_text.get_width()//2, 400))
 
-    def draw_hud(self, screen: pygame.Surface, score: int, lives: int, level_num: int) -> None:
+    #
+    # HUD text that changes during play is kept per field rather than in the
+    # shared cache, and re-rendered only when that field's text changes
+    #
+    def hud_field(self, name: str, text: str) -> pygame.Surface:
+        cached = self.hud_fields.get(name)
+        if cached is not None and cached[0] == text:
+            return cached[1]
+        surface = self.font_small.render(text, True, self.colors['white'])
+        self.hud_fields[name] = (text, surface)
+        return surface
+    
+    # Returns the screen areas drawn
+    def draw_hud(self, screen: pygame.Surface, score: int, lives: int, level_num: int) -> List[pygame.Rect]:
         # Score and lives
-        hud_text = self.font_small.render(f"Score: {score}  Lives: {lives}", True, self.colors['white'])
-        screen.blit(hud_text, (8, 8))
+        hud_text = self.hud_field("score", f"Score: {score}  Lives: {lives}")
+        hud_rect = screen.blit(hud_text, (8, 8))
         
         # Level number
-        level_text = self.font_small.render(f"Level: {level_num}", True, self.colors['white'])
-        screen.blit(level_text, (config.SCREEN_WIDTH - level_text.get_width() - 8, 8))
+        level_text = self.hud_field("level", f"Level: {level_num}")
+        level_rect = screen.blit(level_text, (config.SCREEN_WIDTH - level_text.get_width() - 8, 8))
+        return [hud_rect, level_rect]
     
-    def draw_launch_hint(self, screen: pygame.Surface) -> None:
-        hint = self.font_small.render("Press SPACE to Launch", True, self.colors['light_gray'])
-        screen.blit(hint, (config.SCREEN_WIDTH//2 - hint.get_width()//2, 
-                          config.SCREEN_HEIGHT - 100))
+    def draw_launch_hint(self, screen: pygame.Surface) -> pygame.Rect:
+        hint = self.text.render(self.font_small, "Press SPACE to Launch", True, self.colors['light_gray'])
+        return screen.blit(hint, (config.SCREEN_WIDTH//2 - hint.get_width()//2, 
+                                 config.SCREEN_HEIGHT - 100))
     
     def draw_centered_text(self, screen: pygame.Surface, text: str, font_type: str = 'medium', 
                           y_offset: int = 0, color: str = 'white') -> None:
         font = getattr(self, f'font_{font_type}')
-        rendered = font.render(text, True, self.colors[color])
+        rendered = self.text.render(font, text, True, self.colors[color])
         x = config.SCREEN_WIDTH // 2 - rendered.get_width() // 2
         screen.blit(rendered, (x, config.SCREEN_HEIGHT // 2 + y_offset))
         
\ No newline at end of file
@@ -0,0 +1,148 @@
+#
+# Block-destruction particles.
+# Particles live in preallocated NumPy arrays of fixed capacity used as a
+# ring: a burst writes the next slots after the previous one, overwriting
+# the oldest particles, so the pool never grows. Bursts draw their random
+# values into preallocated scratch arrays and write the slots in place, so
+# emitting allocates no new arrays (drawing does, for the live subset).
+# Every particle is integrated at once with in-place array operations, and the
+# live ones are drawn with one Surface.blits call from small pre-rendered
+# squares (one per colour and size).
+#
+# As the pool fills, bursts shrink: full size up to half the capacity in use,
+# then linearly down to MIN_QUALITY of it when the pool is full.
+#
+# Requires numpy; the game runs without particles when it is missing.
+#
+from typing import Dict, List, Optional
+import numpy as np
+import pygame
+from Core import config
+from Objects.blockField import unpack_color
+
+SIZES = (1, 2, 3)  # particle side in pixels, by remaining life
+MIN_QUALITY = 0.125
+SPEED = (60.0, 220.0)  # burst speed range, pixels per second
+
+
+class particleSystem:
+    def __init__(self, capacity: int = None, burst: int = None, seed: int = 0):
+        self.capacity = int(capacity or config.PARTICLE_CAPACITY)
+        self.burst_size = int(burst or config.PARTICLE_BURST)
+        n = self.capacity
+        self.x = np.zeros(n)
+        self.y = np.zeros(n)
+        self.vx = np.zeros(n)
+        self.vy = np.zeros(n)
+        self.life = np.zeros(n)  # seconds left, <= 0 when the slot is free
+        self.sprite = np.zeros(n, dtype=np.intp)  # colour slot * len(SIZES)
+        self.scratch = np.zeros(n)
+        self.angle = np.zeros(n)  # burst scratch
+        self.speed = np.zeros(n)
+        self.alive = np.zeros(n, dtype=bool)
+        self.head = 0  # next slot to write
+        self.live = 0
+        self.quality = 1.0
+        self.rng = np.random.default_rng(seed)
+        self.colors: Dict[int, int] = {}  # packed colour -> colour slot
+        self.sprites: List[pygame.Surface] = []
+
+    #
+    # Colour slot for a packed 0xRRGGBB colour, rendering its sprites once
+    #
+    def color_slot(self, packed: int) -> int:
+        slot = self.colors.get(packed)
+        if slot is None:
+            slot = self.colors[packed] = len(self.colors)
+            rgb = unpack_color(packed)
+            for size in SIZES:
+                sprite = pygame.Surface((size, size))
+                sprite.fill(rgb)
+                self.sprites.append(sprite)
+        return slot
+
+    #
+    # Emit a burst from the centre of a destroyed block
+    #
+    def burst(self, x: float, y: float, packed_color: int) -> int:
+        count = min(self.capacity, max(1, int(self.burst_size * self.quality)))
+        start = self.head
+        if start + count > self.capacity:
+            start = 0  # wrap early rather than split the burst
+        end = start + count
+        self.head = end if end < self.capacity else 0
+        self.live = min(self.capacity, self.live + count)
+
+        #
+        # Draw into the scratch arrays and write the slots in place:
+        # angle in [0, 2pi), speed in SPEED, life in [0.5, 1) x PARTICLE_LIFE
+        #
+        angle, speed = self.angle[:count], self.speed[:count]
+        vx, vy, life = self.vx[start:end], self.vy[start:end], self.life[start:end]
+        self.rng.random(out=angle)
+        angle *= 2 * np.pi
+        self.rng.random(out=speed)
+        speed *= SPEED[1] - SPEED[0]
+        speed += SPEED[0]
+        np.cos(angle, out=vx)
+        vx *= speed
+        np.sin(angle, out=vy)
+        vy *= speed
+        self.rng.random(out=life)
+        life *= 0.5 * config.PARTICLE_LIFE
+        life += 0.5 * config.PARTICLE_LIFE
+        self.x[start:end] = x
+        self.y[start:end] = y
+        self.sprite[start:end] = self.color_slot(packed_color) * len(SIZES)
+        return count
+
+    #
+    # Integrate every slot by dt (dead slots are harmless) and update the
+    # quality from how full the pool is
+    #
+    def update(self, dt: float) -> None:
+        tmp = self.scratch
+        np.multiply(self.vx, dt, out=tmp)
+        self.x += tmp
+        self.vy += config.PARTICLE_GRAVITY * dt
+        np.multiply(self.vy, dt, out=tmp)
+        self.y += tmp
+        self.life -= dt
+
+        np.greater(self.life, 0.0, out=self.alive)
+        self.live = int(np.count_nonzero(self.alive))
+        load = self.live / self.capacity
+        self.quality = 1.0 if load <= 0.5 else max(MIN_QUALITY, 2.0 * (1.0 - load))
+
+    def clear(self) -> None:
+        self.life[:] = 0.0
+        self.alive[:] = False
+        self.live = 0
+        self.quality = 1.0
+
+    #
+    # Draw the live particles, shrinking as they fade. Returns the screen
+    # area covered (None when there are none).
+    #
+    def draw(self, surface: pygame.Surface) -> Optional[pygame.Rect]:
+        if not self.live:
+            return None
+        np.greater(self.life, 0.0, out=self.alive)
+        live = np.flatnonzero(self.alive)
+        if not len(live):
+            return None
+        xs = self.x[live].astype(np.intc)
+        ys = self.y[live].astype(np.intc)
+        fade = np.minimum(self.life[live] * (len(SIZES) / config.PARTICLE_LIFE), len(SIZES) - 1)
+        sprites = self.sprites
+        surface.blits(zip([sprites[i] for i in (self.sprite[live] + fade.astype(np.intp)).tolist()],
+                          zip(xs.tolist(), ys.tolist())), doreturn=False)
+        x0, y0 = int(xs.min()), int(ys.min())
+        area = pygame.Rect(x0, y0, int(xs.max()) - x0 + max(SIZES), int(ys.max()) - y0 + max(SIZES))
+        return area.clip(surface.get_rect())
+
+    def __len__(self) -> int:
+        return self.live
+
+    def __repr__(self) -> str:
+        return f"particleSystem(live={self.live},capacity={self.capacity},quality={self.quality:.2f})"  # return string repr
@@ -0,0 +1,52 @@
+#
+# Frame presentation.
+# In "dirty" mode only the screen regions that changed this frame are sent to
+# the display with pygame.display.update(rects); in "flip" mode (or after
+# full()) the whole surface is flipped. present() is called exactly once per
+# frame.
+#
+# Regions come in two kinds:
+#   mark()   - something drawn at a moving position (ball, paddle, HUD text).
+#              It is presented this frame and again next frame, so the old
+#              position is cleared when the object moves.
+#   damage() - a one-off change (a patched block).
+#
+from typing import List
+import pygame
+from Core import config
+
+
+class presenter:
+    def __init__(self, mode: str = None):
+        self.mode = mode or config.PRESENT_MODE
+        self.marked: List[pygame.Rect] = []
+        self.previous: List[pygame.Rect] = []
+        self.damaged: List[pygame.Rect] = []
+        self.full_frame = True
+
+    def mark(self, rect) -> None:
+        if rect:
+            self.marked.append(pygame.Rect(rect))
+
+    def damage(self, rect) -> None:
+        if rect:
+            self.damaged.append(pygame.Rect(rect))
+
+    #
+    # Present the whole screen on the next present() (state transitions,
+    # rebuilt layers)
+    #
+    def full(self) -> None:
+        self.full_frame = True
+
+    def present(self) -> None:
+        if self.full_frame or self.mode != "dirty":
+            pygame.display.flip()
+        else:
+            rects = self.previous + self.marked + self.damaged
+            if rects:
+                pygame.display.update(rects)
+        self.previous, self.marked = self.marked, self.previous
+        self.marked.clear()
+        self.damaged.clear()
+        self.full_frame = False
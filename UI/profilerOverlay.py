@@ -0,0 +1,73 @@
+#
+# Profiler overlay.
+# Draws the frame timer's percentiles, mean per-phase times and a graph of
+# recent frame times in a panel at the bottom-left of the screen. The text
+# is re-rendered a few times a second; the graph is redrawn every frame.
+#
+from typing import List
+import pygame
+from Core import config
+from Core.frameTimer import FrameTimer
+
+PANEL = (8, config.SCREEN_HEIGHT - 148, 260, 140)
+GRAPH_FRAMES = 120
+TEXT_EVERY = 15  # frames between text updates
+BUDGET_MS = 1000.0 / config.FPS
+
+
+class profilerOverlay:
+    def __init__(self):
+        self.font = None
+        self.lines: List[pygame.Surface] = []
+        self.panel = pygame.Surface(PANEL[2:], pygame.SRCALPHA)
+        self.frames_at_text = -TEXT_EVERY
+
+    def update_text(self, timer: FrameTimer) -> None:
+        if self.font is None:
+            if not pygame.font.get_init():
+                pygame.font.init()
+            self.font = pygame.font.Font(None, 18)
+        stats = timer.summary()
+        if not stats:
+            texts = ["no frames recorded"]
+        else:
+            texts = [
+                f"frame p50 {stats['p50']:.2f}  p95 {stats['p95']:.2f}  p99 {stats['p99']:.2f}  max {stats['max']:.2f} ms",
+                "  ".join(f"{name} {stats[name]:.2f}" for name in timer.phases[:3]),
+                "  ".join(f"{name} {stats[name]:.2f}" for name in timer.phases[3:]),
+            ]
+        self.lines = [self.font.render(t, True, (255, 255, 255)) for t in texts]
+        self.frames_at_text = timer.frames
+
+    #
+    # Returns the screen area drawn
+    #
+    def draw(self, screen: pygame.Surface, timer: FrameTimer) -> pygame.Rect:
+        #
+        # Also refresh when the timer was cleared (toggled) since the last text
+        #
+        if timer.frames - self.frames_at_text >= TEXT_EVERY or timer.frames < self.frames_at_text:
+            self.update_text(timer)
+
+        panel = self.panel
+        panel.fill((0, 0, 0, 170))
+        y = 4
+        for line in self.lines:
+            panel.blit(line, (6, y))
+            y += line.get_height() + 2
+
+        #
+        # Frame graph: one bar per frame, the line marks the frame budget
+        #
+        gx, gy, gw, gh = 6, y + 4, PANEL[2] - 12, PANEL[3] - y - 10
+        scale = gh / (2 * BUDGET_MS)
+        times = timer.frame_times(GRAPH_FRAMES)
+        bar = max(1, gw // GRAPH_FRAMES)
+        for i, t in enumerate(times):
+            h = min(gh, max(1, int(t * 1e3 * scale)))
+            color = (80, 220, 80) if t * 1e3 <= BUDGET_MS else (230, 80, 60)
+            panel.fill(color, (gx + i * bar, gy + gh - h, bar, h))
+        budget_y = gy + gh - int(BUDGET_MS * scale)
+        pygame.draw.line(panel, (200, 200, 200), (gx, budget_y), (gx + gw, budget_y))
+
+        return screen.blit(panel, PANEL[:2])
@@ -0,0 +1,59 @@
+#
+# Rendered-text cache.
+# Font.render surfaces are kept in an LRU keyed by (font, text, colour,
+# antialias) so static strings are rasterised once. The cache is bounded both
+# by entry count and by the total pixel memory of the cached surfaces.
+#
+from collections import OrderedDict
+from typing import Tuple
+import pygame
+from Core import config
+
+
+class textCache:
+    def __init__(self, max_bytes: int = None, max_entries: int = None):
+        self.max_bytes = max_bytes or config.TEXT_CACHE_BYTES
+        self.max_entries = max_entries or config.TEXT_CACHE_ENTRIES
+        self.entries: "OrderedDict[tuple, pygame.Surface]" = OrderedDict()
+        self.bytes = 0
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def surface_bytes(surface: pygame.Surface) -> int:
+        w, h = surface.get_size()
+        return w * h * surface.get_bytesize()
+
+    #
+    # Same arguments as Font.render, plus the font
+    #
+    def render(self, font: pygame.font.Font, text: str, antialias: bool, color: Tuple[int, ...]) -> pygame.Surface:
+        key = (font, text, tuple(color), antialias)
+        surface = self.entries.get(key)
+        if surface is not None:
+            self.entries.move_to_end(key)
+            self.hits += 1
+            return surface
+
+        self.misses += 1
+        surface = font.render(text, antialias, color)
+        size = self.surface_bytes(surface)
+        if size > self.max_bytes:
+            return surface  # too big to keep
+
+        self.entries[key] = surface
+        self.bytes += size
+        #
+        # Evict least recently used entries until back under both caps
+        #
+        while self.bytes > self.max_bytes or len(self.entries) > self.max_entries:
+            _, old = self.entries.popitem(last=False)
+            self.bytes -= self.surface_bytes(old)
+        return surface
+
+    def clear(self) -> None:
+        self.entries.clear()
+        self.bytes = 0
+
+    def __len__(self) -> int:
+        return len(self.entries)
@@ -0,0 +1,218 @@
+#
+# Performance benchmarks.
+# Builds synthetic levels from 10 to 100k blocks and measures, per size:
+#   collision  collisionManager.check_ball_blocks, microseconds per call
+#   render     Game.render on the dummy video driver, milliseconds per frame
+#   parse      Level.from_file on the level's JSON, milliseconds per load
+#   headless   Simulation.step under the autopilot, steps per second
+# Results are written as JSON. With --compare, every metric is checked
+# against a stored baseline and slowdowns beyond --threshold are reported
+# (exit status 1), so a run can gate a change.
+#
+# Usage:
+#   python -m benchmarks.suite [--sizes=10,100,...] [--repeat=N] [--out=results.json]
+#                              [--compare=baseline.json] [--threshold=0.15]
+#
+import argparse
+import json
+import os
+import platform
+import random
+import sys
+import tempfile
+import time
+from typing import Dict, List
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from Core import config
+from Core.simulation import Simulation, autoplay_action
+from Managers.collisionManager import collisionManager
+from Objects.ball import Ball
+from Objects.level import Level
+
+DEFAULT_SIZES = (10, 100, 1000, 10000, 100000)
+
+#
+# Metric name prefix -> (unit, whether lower values are better)
+#
+METRICS = {
+    "collision": ("us/call", True),
+    "render": ("ms/frame", True),
+    "parse": ("ms/load", True),
+    "headless": ("steps/s", False),
+}
+
+
+#
+# A level of `blocks` blocks packed into rows across the top two thirds of
+# the screen, with the tile size shrunk so they fit
+#
+def synthetic_level_data(blocks: int, seed: int = 0) -> dict:
+    rng = random.Random(seed)
+    area = config.SCREEN_WIDTH * config.SCREEN_HEIGHT * 2 // 3
+    tile = max(1, min(config.TILE_SIZE, int((area / max(blocks, 1)) ** 0.5)))
+    columns = config.SCREEN_WIDTH // tile
+    palette = ["#FF0000", "#FF7F00", "#FFFF00", "#00FF00", "#0000FF", "#9400D3"]
+    return {
+        "width": config.SCREEN_WIDTH,
+        "height": config.SCREEN_HEIGHT,
+        "tile_size": tile,
+        "palette": palette,
+        "blocks": [
+            {"x": i % columns, "y": i // columns, "hp": rng.choice((1, 1, 2)), "color": i % len(palette)}
+            for i in range(blocks)
+        ],
+    }
+
+
+def write_level(folder: str, blocks: int) -> str:
+    path = os.path.join(folder, f"bench{blocks}.json")
+    with open(path, "w", encoding="utf-8") as fh:
+        json.dump(synthetic_level_data(blocks), fh)
+    return path
+
+
+def best_of(repeat: int, run) -> float:
+    return min(run() for _ in range(repeat))
+
+
+def bench_collision(level: Level, calls: int = 2000) -> float:
+    rng = random.Random(1)
+    tile = level.tile_size
+    bottom = max((y + h for y, h in zip(level.field.y, level.field.height)), default=tile)
+    positions = [(rng.uniform(0, config.SCREEN_WIDTH), rng.uniform(0, bottom + tile)) for _ in range(calls)]
+    field = level.field.copy()
+    grid = level.grid.copy()
+    ball = Ball(0, 0)
+    check = collisionManager.check_ball_blocks
+
+    t0 = time.perf_counter()
+    for x, y in positions:
+        ball.x = x
+        ball.y = y
+        check(ball, field, grid)
+    return (time.perf_counter() - t0) / calls * 1e6
+
+
+def bench_parse(path: str) -> float:
+    t0 = time.perf_counter()
+    Level.from_file(path)
+    return (time.perf_counter() - t0) * 1e3
+
+
+def bench_headless(level: Level, steps: int = 2000) -> float:
+    sim = Simulation()
+    sim.reset(level)
+    dt = 1.0 / config.PHYSICS_HZ
+    t0 = time.perf_counter()
+    for _ in range(steps):
+        sim.step(autoplay_action(sim), dt)
+    return steps / (time.perf_counter() - t0)
+
+
+#
+# Render cost per frame once the block layer is built, with the game
+# advancing (and patching hit blocks) between timed frames
+#
+def bench_render(game, level: Level, frames: int = 200) -> float:
+    from Managers.game_state import GameState
+
+    game.sim.reset(level)
+    game.game_state = GameState.PLAYING
+    game.render()
+    dt = 1.0 / config.PHYSICS_HZ
+    elapsed = 0.0
+    for _ in range(frames):
+        if game.game_state != GameState.PLAYING:
+            game.sim.reset(level)
+            game.game_state = GameState.PLAYING
+        game.update(dt, autoplay_action(game.sim))
+        t0 = time.perf_counter()
+        game.render(1.0)
+        elapsed += time.perf_counter() - t0
+    return elapsed / frames * 1e3
+
+
+def make_game():
+    os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+    import breakout
+    return breakout.Game(initial_level=1)
+
+
+def run_suite(sizes: List[int], repeat: int = 3, render: bool = True) -> Dict[str, float]:
+    results: Dict[str, float] = {}
+    game = make_game() if render else None
+    with tempfile.TemporaryDirectory() as folder:
+        for size in sizes:
+            path = write_level(folder, size)
+            level = Level.from_file(path)
+            results[f"parse/{size}"] = best_of(repeat, lambda: bench_parse(path))
+            results[f"collision/{size}"] = best_of(repeat, lambda: bench_collision(level))
+            results[f"headless/{size}"] = max(bench_headless(level) for _ in range(repeat))
+            if game is not None:
+                results[f"render/{size}"] = best_of(repeat, lambda: bench_render(game, level))
+            print(f"{size:>7} blocks: " + ", ".join(
+                f"{name.split('/')[0]} {value:.3f} {METRICS[name.split('/')[0]][0]}"
+                for name, value in results.items() if name.endswith(f"/{size}")), flush=True)
+    return results
+
+
+#
+# Metrics that got worse than the baseline by more than `threshold`
+# (a fraction). Returns (name, baseline, current, change) tuples.
+#
+def compare(results: Dict[str, float], baseline: Dict[str, float], threshold: float) -> List[tuple]:
+    slower = []
+    for name, current in results.items():
+        base = baseline.get(name)
+        if not base:
+            continue
+        lower_is_better = METRICS[name.split("/")[0]][1]
+        change = (current - base) / base if lower_is_better else (base - current) / base
+        if change > threshold:
+            slower.append((name, base, current, change))
+    return slower
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Run the performance benchmarks.")
+    parser.add_argument("--sizes", default=",".join(map(str, DEFAULT_SIZES)),
+                        help="comma-separated block counts of the synthetic levels")
+    parser.add_argument("--repeat", type=int, default=3, help="runs per measurement, best one kept")
+    parser.add_argument("--no-render", action="store_true", help="skip the render benchmark")
+    parser.add_argument("--out", default=None, help="write the results as JSON to this file")
+    parser.add_argument("--compare", default=None, help="baseline results JSON to check against")
+    parser.add_argument("--threshold", type=float, default=0.15,
+                        help="flag metrics more than this fraction slower than the baseline")
+    args = parser.parse_args(argv)
+
+    sizes = [int(s) for s in args.sizes.split(",") if s]
+    results = run_suite(sizes, args.repeat, render=not args.no_render)
+    report = {
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "time": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        "units": {name: unit for name, (unit, _) in METRICS.items()},
+        "results": results,
+    }
+
+    if args.out:
+        with open(args.out, "w", encoding="utf-8") as fh:
+            json.dump(report, fh, indent=2)
+        print(f"Wrote {args.out}")
+
+    if args.compare:
+        with open(args.compare, "r", encoding="utf-8") as fh:
+            baseline = json.load(fh)["results"]
+        slower = compare(results, baseline, args.threshold)
+        for name, base, current, change in slower:
+            print(f"SLOWER {name}: {base:.3f} -> {current:.3f} ({change:+.0%})")
+        if slower:
+            return 1
+        print(f"No metric more than {args.threshold:.0%} slower than {args.compare}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,83 +1,159 @@
 #
-# Auto-detect and use virtual environment if available
+# A variant of the classic breakout arcade game.
+# This file contains a `Game` class which manages a Pygame loop and renders
+# `Block`, `Paddle`, and `Ball` objects. A headless mode is provided via the
+# `--headless` CLI flag (with optional `--frames=N`) which runs the pygame-free
+# simulation core under an autopilot without opening a window.
 #
+import time
+_started = time.perf_counter()
+
 import os
 import sys
+from typing import TYPE_CHECKING
+
+from Core.startupProfile import StartupProfile
 
-script_dir = os.path.dirname(os.path.abspath(__file__))
-venv_python = os.path.join(script_dir, '..', '.venv', 'Scripts', 'python.exe')
-venv_python = os.path.abspath(venv_python)
+_imports = StartupProfile(start=_started)
+with _imports.phase("import", "simulation core"):
+    from Core import config
+    from Core.simulation import Action, Simulation, autoplay_action
+    from Core.frameTimer import FrameTimer
+    from Objects.paddle import Paddle
+    from Objects.ball import Ball
+    from Managers import GameState, scoreManager
+    from Managers.inputRecorder import FrameInput, inputRecorder, read_recording
 
-if os.path.exists(venv_python) and sys.executable != venv_python:
-    import subprocess
-    subprocess.run([venv_python] + sys.argv)
-    sys.exit()
+if TYPE_CHECKING:
+    from Core.sessionProfiler import SessionProfiler  # loads cProfile and tracemalloc; main() imports it for --profile
 
 #
-# A variant of the classic breakout arcade game.
-# This file contains a `Game` class which manages a Pygame loop and renders
-# `Block`, `Paddle`, and `Ball` objects. A headless test mode is provided via
-# the `--headless` CLI flag to run a small smoke test without opening a window.
+# Pygame and the display side are imported by the first Game, so headless
+# runs never load them
 #
-import pygame
+pygame = menu = blockLayer = presenter = inputManager = profilerOverlay = None
+
 
-from Core import config
-from Objects.paddle import Paddle
-from Objects.ball import Ball
-from UI.menu import menu, hex_to_rgb
-from Managers import GameState, collisionManager, inputManager, scoreManager
+def import_display_modules(profile: StartupProfile) -> None:
+    global pygame, menu, blockLayer, presenter, inputManager, profilerOverlay
+    if pygame is not None:
+        return
+    with profile.phase("import", "pygame"):
+        import pygame
+    with profile.phase("import", "UI and input"):
+        from UI.menu import menu
+        from UI.profilerOverlay import profilerOverlay
+        from UI.blockLayer import blockLayer
+        from UI.presenter import presenter
+        from Managers.inputManager import inputManager
+
+
+#
+# Re-run under the project's Windows virtual environment if there is one.
+# Skipped elsewhere and when already running inside a virtual environment.
+#
+def use_project_venv() -> None:
+    if os.name != "nt" or sys.prefix != sys.base_prefix:
+        return
+    script_dir = os.path.dirname(os.path.abspath(__file__))
+    venv_python = os.path.abspath(os.path.join(script_dir, '..', '.venv', 'Scripts', 'python.exe'))
+    if os.path.exists(venv_python) and sys.executable != venv_python:
+        import subprocess
+        subprocess.run([venv_python] + sys.argv)
+        sys.exit()
 
 class Game:
-    def __init__(self, initial_level: int = 1):
-        pygame.init()
-        self.screen = pygame.display.set_mode((config.SCREEN_WIDTH, config.SCREEN_HEIGHT))
-        pygame.display.set_caption("Breakout")
+    def __init__(self, initial_level: int = 1, profile: StartupProfile = None):
+        #
+        # Only the display subsystem is started (it also drives events and the
+        # keyboard); fonts start on first use and audio is never needed
+        #
+        self.profile = profile or StartupProfile(enabled=False)
+        import_display_modules(self.profile)
+        with self.profile.phase("init", "display"):
+            pygame.display.init()
+            self.screen = pygame.display.set_mode((config.SCREEN_WIDTH, config.SCREEN_HEIGHT))
+            pygame.display.set_caption("Breakout")
         self.clock = pygame.time.Clock()
         
+        # Managers
+        with self.profile.phase("init", "UI"):
+            self.ui = menu()
+            self.block_layer = blockLayer((config.SCREEN_WIDTH, config.SCREEN_HEIGHT))
+            self.damaged_blocks = []  # block ids hit since the last render
+            self.particles = None  # created by start_particles once the first frame is up
+            self.presenter = presenter()
+            #
+            # Per-phase frame timing, off until toggled (F3); the timer in use
+            # for the current frame, None when timing is off
+            #
+            self.frame_timer = FrameTimer()
+            self.active_timer = None
+            self.profiler_overlay = profilerOverlay()
+        with self.profile.phase("init", "level index"):
+            self.level_manager = scoreManager()
+            self.sim = Simulation(self.level_manager)
+        
         # Game state
         self.game_state = GameState.MENU
         self.running = True
-        self.score = 0
-        self.lives = 3
-        self.ball_launched = False
-        
-        # Managers
-        self.ui = menu()
-        self.level_manager = scoreManager()
+        self.accumulator = 0.0  # frame time not yet consumed by physics steps
         
         # Level selection
         self.available_levels = self.level_manager.get_available_levels()
         self.selected_level_index = 0  # Index in available_levels list
         
         # Load initial level
-        if not self.level_manager.load_level(initial_level):
+        with self.profile.phase("init", "initial level"):
+            loaded = self.sim.reset(initial_level)
+        if not loaded:
             print(f"Failed to load level {initial_level}")
             self.running = False
             return
-        
-        # Initialize game objects
-        self.reset_paddle_and_ball()
+
+    #
+    # Gameplay state lives in the simulation core
+    #
+    @property
+    def paddle(self) -> Paddle:
+        return self.sim.paddle
+
+    @property
+    def ball(self) -> Ball:
+        return self.sim.ball
+
+    @property
+    def score(self) -> int:
+        return self.sim.score
+
+    @score.setter
+    def score(self, value: int) -> None:
+        self.sim.score = value
+
+    @property
+    def lives(self) -> int:
+        return self.sim.lives
+
+    @lives.setter
+    def lives(self, value: int) -> None:
+        self.sim.lives = value
+
+    @property
+    def ball_launched(self) -> bool:
+        return self.sim.ball_launched
+
+    @ball_launched.setter
+    def ball_launched(self, value: bool) -> None:
+        self.sim.ball_launched = value
 
     def reset_paddle_and_ball(self) -> None:
-        # Paddle positioned near bottom center
-        paddle_y = config.SCREEN_HEIGHT - 40
-        self.paddle = Paddle(config.SCREEN_WIDTH / 2, paddle_y)
-        
-        # Ball starts on top of paddle
-        ball_x = self.paddle.x
-        ball_y = self.paddle.y - self.paddle.height / 2 - config.BALL_RADIUS - 2
-        self.ball = Ball(ball_x, ball_y)
-        self.ball_launched = False
+        self.sim.reset_paddle_and_ball()
 
     def reset_level_state(self) -> None:
-        self.level_manager.reset_level_blocks()
-        self.reset_paddle_and_ball()
+        self.sim.reset_level_state()
 
     def reset_game_state(self) -> None:
-        self.level_manager.reset_level_blocks()
-        self.lives = 3
-        self.score = 0
-        self.reset_paddle_and_ball()
+        self.sim.reset_game_state()
 
     def next_level(self) -> None:
         success, message = self.level_manager.next_level()
@@ -88,97 +164,81 @@ class Game:
             self.game_state = GameState.GAME_OVER
             print(message)
 
-    def launch_ball_if_needed(self) -> None:
-        if not self.ball_launched:
-            self.ui.draw_launch_hint(self.screen)
-            pygame.display.flip()
-            keys = pygame.key.get_pressed()
-            if inputManager.check_launch_ball(keys, self.ball_launched):
-                self.ball_launched = True
-                self.ball.vx = 0.0
-                self.ball.vy = -1.0
-
-    def update(self, dt: float) -> None:
+    #
+    # Advance the simulation by `dt`, reading the keyboard unless an explicit
+    # action is given.
+    #
+    def update(self, dt: float, action: Action = None) -> None:
         if self.game_state != GameState.PLAYING:
             return
-            
-        if not self.ball_launched:
-            self.launch_ball_if_needed()
-            # Keep ball on paddle
-            self.ball.x = self.paddle.x
-            self.ball.y = self.paddle.y - self.paddle.height / 2 - self.ball.radius - 2
-            return
 
-        self.ball.update(dt)
-
-        # Check collisions
-        collisionManager.check_ball_walls(self.ball)
-        
-        # Check bottom collision (life loss)
-        if collisionManager.check_ball_bottom(self.ball):
-            self.handle_life_loss()
-            return
-            
-        # Check paddle collision
-        collisionManager.check_ball_paddle(self.ball, self.paddle)
-        
-        # Check block collisions
-        self.level_manager.blocks, score_increase = collisionManager.check_ball_blocks(
-            self.ball, self.level_manager.blocks
-        )
-        self.score += score_increase
-        
-        # Check level completion
-        if len(self.level_manager.blocks) == 0:
-            self.game_state = GameState.LEVEL_COMPLETE
+        if action is None:
+            action = inputManager.read_action(self.game_state)
+        self.game_state = self.sim.step(action, dt)
+        particles = self.particles
+        if self.sim.events:
+            self.damaged_blocks.extend(event.index for event in self.sim.events)
+            if particles is not None:
+                field = self.level_manager.blocks
+                for event in self.sim.events:
+                    if event.destroyed:
+                        x, y, w, h = field.rect(event.index)
+                        particles.burst(x + w / 2, y + h / 2, field.color_of(event.index))
+        if particles is not None:
+            particles.update(dt)
 
     #
     # Bottom (life loss)
     #
     def handle_life_loss(self) -> None:
-        self.lives -= 1
-        if self.lives <= 0:
-            self.game_state = GameState.GAME_OVER
-            return
-            
-        self.ball_launched = False
-        self.ball.x = self.paddle.x
-        self.ball.y = self.paddle.y - self.paddle.height / 2 - self.ball.radius - 2
-        self.ball.vx = 0.0
-        self.ball.vy = -1.0
-
-    def render(self) -> None:
-        self.screen.fill((0, 0, 0))
+        self.sim.handle_life_loss()
+        self.game_state = self.sim.state
 
+    def render(self, alpha: float = 1.0) -> None:
         #
-        # Draw blocks
+        # Draw blocks: the cached layer is rebuilt when the level's blocks are
+        # reloaded and otherwise only patched where blocks were hit
         #
-        for block in self.level_manager.blocks:
-            r = block.rect()
-            color = hex_to_rgb(block.color)
-            pygame.draw.rect(self.screen, color, pygame.Rect(*r))
-            #
-            # Draw white outline
-            #
-            pygame.draw.rect(self.screen, (255, 255, 255), pygame.Rect(*r), width=1)
+        field = self.level_manager.blocks
+        if self.block_layer.is_stale(field):
+            self.block_layer.build(field, self.level_manager.grid)
+            self.presenter.full()
+            if self.particles is not None:
+                self.particles.clear()
+        elif self.damaged_blocks:
+            for area in self.block_layer.patch(self.damaged_blocks):
+                self.presenter.damage(area)
+        self.damaged_blocks.clear()
+        self.block_layer.draw(self.screen)
+        if self.particles is not None:
+            self.presenter.mark(self.particles.draw(self.screen))
 
         #
         # Draw paddle
         #
-        pr = self.paddle.rect()
-        pygame.draw.rect(self.screen, (200, 200, 200), pygame.Rect(*pr))
+        pr = self.paddle.render_rect(alpha)
+        self.presenter.mark(pygame.draw.rect(self.screen, (200, 200, 200), pygame.Rect(*pr)))
         #
-        # Draw ball
+        # Draw balls
         #
-        pygame.draw.circle(self.screen, (255, 255, 255), (int(self.ball.x), int(self.ball.y)), self.ball.radius)
+        for ball in self.sim.balls:
+            bx, by = ball.render_pos(alpha)
+            self.presenter.mark(pygame.draw.circle(self.screen, (255, 255, 255), (int(bx), int(by)), ball.radius))
+        timer = self.active_timer
+        if timer is not None:
+            timer.mark("render")
         #
         # HUD
         #
         level_info = self.level_manager.get_level_info()
-        self.ui.draw_hud(self.screen, self.score, self.lives, level_info["number"])
+        for area in self.ui.draw_hud(self.screen, self.score, self.lives, level_info["number"]):
+            self.presenter.mark(area)
+        if timer is not None:
+            timer.mark("hud")
 
     def process_actions(self, action: str) -> None:
         if action == "open_level_select":
+            self.level_manager.refresh_levels()
             self.available_levels = self.level_manager.get_available_levels()
             self.selected_level_index = 0
         
@@ -214,65 +274,248 @@ class Game:
             self.reset_level_state()
             self.game_state = GameState.PLAYING
 
-    def run(self, max_frames: int = None) -> None:
+        elif action == "toggle_profiler":
+            self.frame_timer.enabled = not self.frame_timer.enabled
+            self.frame_timer.clear()
+
+        elif action == "dump_profiler":
+            path = os.path.abspath(f"frame_times_{time.strftime('%Y%m%d_%H%M%S')}.json")
+            self.frame_timer.dump_json(path)
+            print(f"Wrote {len(self.frame_timer)} frame timings to {path}")
+
+    #
+    # Advance one frame from its input: the state transition and action
+    # produced by inputManager and the paddle/launch keys. Runs the
+    # fixed-step physics while playing and returns the interpolation alpha
+    # for rendering, or None if the frame does not end in gameplay (the
+    # level may be completed or lost partway through the steps).
+    #
+    def step_frame(self, frame_dt: float, state: GameState, running: bool, action: str, keys: Action):
+        self.game_state, self.running = state, running
+        
+        # Process actions
+        if action:
+            self.process_actions(action)
+        
+        alpha = None
+        if self.game_state == GameState.PLAYING:
+            #
+            # Fixed-step physics: consume the frame time in whole steps,
+            # capped so a long stall cannot spiral into more catch-up work
+            #
+            step_dt = 1.0 / config.PHYSICS_HZ
+            self.accumulator += frame_dt
+            steps = 0
+            while self.accumulator >= step_dt and steps < config.MAX_PHYSICS_STEPS:
+                self.update(step_dt, keys)
+                self.accumulator -= step_dt
+                steps += 1
+                if self.game_state != GameState.PLAYING:
+                    break
+            if steps == config.MAX_PHYSICS_STEPS:
+                self.accumulator = min(self.accumulator, step_dt)
+            alpha = min(self.accumulator / step_dt, 1.0)
+        
+        if self.game_state != GameState.PLAYING:
+            self.accumulator = 0.0
+            alpha = None
+        return alpha
+
+    #
+    # run() calls this after the first frame is presented. pygame has already
+    # imported numpy by then, so only UI.particles and numpy.random remain:
+    # about 15 ms (3 ms import, 12 ms for the first default_rng), kept off
+    # the time to first frame. Without numpy the game plays on without
+    # particles.
+    #
+    def start_particles(self) -> None:
+        if not config.PARTICLES or self.particles is not None:
+            return
+        with self.profile.phase("import", "particles (numpy)"):
+            try:
+                from UI.particles import particleSystem
+            except ImportError:
+                return
+        self.particles = particleSystem()
+
+    #
+    # Advance one frame of `frame_ms` milliseconds. Every state event is
+    # applied at its time in the frame: physics runs up to the event, which
+    # then goes through the state machine against the state at that moment,
+    # so a pause followed by a resume, or two menu moves, all take effect.
+    # Each stretch between events is one step_frame call (and one recorded
+    # FrameInput, so replays split the frame the same way). Returns the render
+    # alpha and the actions applied, in order.
+    #
+    def run_frame(self, frame_ms: int, events, keys: Action, recorder: inputRecorder = None):
+        frame_start = pygame.time.get_ticks() - frame_ms
+        actions = []
+        cursor = 0
+        state, running, action = self.game_state, self.running, ""
+        for event, offset in inputManager.state_events(events, frame_start, frame_ms):
+            if action or offset > cursor:
+                self.advance(offset - cursor, state, running, action, keys, recorder)
+                cursor = offset
+            state, running, action = inputManager.transition(event, self.game_state, self.running)
+            if action:
+                actions.append(action)
+            if not running:
+                break
+        alpha = self.advance(frame_ms - cursor, state, running, action, keys, recorder)
+        return alpha, actions
+
+    def advance(self, dt_ms: int, state: GameState, running: bool, action: str, keys: Action,
+                recorder: inputRecorder = None):
+        alpha = self.step_frame(dt_ms / 1000.0, state, running, action, keys)
+        if recorder is not None:
+            recorder.record(FrameInput(dt_ms, int(keys.direction), keys.launch, running, action,
+                                       state, self.level_manager.current_level))
+        return alpha
+
+    def run(self, max_frames: int = None, recorder: inputRecorder = None, profiler: "SessionProfiler" = None) -> None:
         frames = 0
+        self.accumulator = 0.0
+        previous_state = None
         while self.running:
-            dt = self.clock.tick(config.FPS) / 1000.0
+            frame_ms = self.clock.tick(config.FPS)
+            if profiler is not None:
+                profiler.switch(self.game_state, self.level_manager.current_level)
+            timer = self.active_timer = self.frame_timer if self.frame_timer.enabled else None
+            if timer is not None:
+                timer.begin_frame()
             
             # Get events
             events = pygame.event.get()
+            if timer is not None:
+                timer.mark("events")
             
-            # Handle input and state transitions
-            self.game_state, self.running, action = inputManager.handle_state_transitions(
-                events, self.game_state, self.running
-            )
+            # The keys are read once per frame and drive every physics step
+            # in it; state events are applied in order within the frame
+            keys = inputManager.read_action(GameState.PLAYING)
+            if timer is not None:
+                timer.mark("input")
+            alpha, actions = self.run_frame(frame_ms, events, keys, recorder)
+            if timer is not None:
+                timer.mark("update")
             
-            # Process actions
-            if action:
-                self.process_actions(action)
+            # Anything but steady gameplay repaints the whole screen
+            if actions or self.game_state != previous_state:
+                self.presenter.full()
+            previous_state = self.game_state
             
-            # Handle game input (paddle movement)
-            inputManager.handle_game_input(events, self.game_state, self.paddle, dt)
+            # Render based on game state
+            if alpha is not None:
+                self.render(alpha)
+                if not self.ball_launched:
+                    self.presenter.mark(self.ui.draw_launch_hint(self.screen))
             
-            # Update and render based on game state
-            if self.game_state == GameState.MENU:
+            elif self.game_state == GameState.MENU:
                 self.ui.draw_menu(self.screen)
-                pygame.display.flip()
                 
             elif self.game_state == GameState.LEVEL_SELECT:
-                self.ui.draw_level_select(self.screen, self.available_levels, self.selected_level_index)
-                pygame.display.flip()
-                
-            elif self.game_state == GameState.PLAYING:
-                self.update(dt)
-                self.render()
-                if not self.ball_launched:
-                    self.ui.draw_launch_hint(self.screen)
-                pygame.display.flip()
+                self.ui.draw_level_select(self.screen, self.available_levels, self.selected_level_index,
+                                          self.level_manager.manifest.entries)
                 
             elif self.game_state == GameState.PAUSED:
                 self.render()
                 self.ui.draw_pause_screen(self.screen)
-                pygame.display.flip()
                 
             elif self.game_state == GameState.LEVEL_COMPLETE:
                 level_info = self.level_manager.get_level_info()
                 self.ui.draw_next_level(self.screen, level_info["number"], self.score)
-                pygame.display.flip()
                 
             elif self.game_state == GameState.GAME_OVER:
                 level_info = self.level_manager.get_level_info()
                 self.ui.draw_game_over(self.screen, self.lives, self.score)
-                pygame.display.flip()
+
+            if timer is not None:
+                timer.mark("render")
+                if self.frame_timer.enabled:
+                    self.presenter.mark(self.profiler_overlay.draw(self.screen, timer))
+                    timer.mark("hud")
+
+            # Present once per frame
+            self.presenter.present()
+            if timer is not None:
+                timer.mark("present")
+                timer.end_frame()
+            if frames == 0:
+                if self.profile.enabled:
+                    self.profile.frame_presented()
+                    print(self.profile.report())
+                self.start_particles()
 
             frames += 1
             if max_frames is not None and frames >= max_frames:
                 break
 
+        if recorder is not None:
+            recorder.close()
+        if profiler is not None:
+            profiler.close()
         pygame.quit()
 
+    #
+    # Play recorded frames back as fast as possible, without rendering.
+    # Returns the number of frames replayed; stops early with a message if
+    # the game reaches a different level than the recording did.
+    #
+    def replay(self, frames) -> int:
+        self.accumulator = 0.0
+        count = 0
+        for frame in frames:
+            if not self.running:
+                break
+            keys = Action(float(frame.direction), frame.launch)
+            self.step_frame(frame.dt_ms / 1000.0, frame.state, frame.running, frame.action, keys)
+            count += 1
+            if self.level_manager.current_level != frame.level:
+                print(f"Replay diverged at frame {count}: level {self.level_manager.current_level}, "
+                      f"recorded {frame.level}")
+                break
+        return count
+
+#
+# Run the simulation core under the autopilot at the fixed physics rate
+#
+def run_headless(level: int, frames: int) -> None:
+    sim = Simulation()
+    if not sim.reset(level):
+        print(f"Failed to load level {level}")
+        return
+
+    dt = 1.0 / config.PHYSICS_HZ
+    for _ in range(frames):
+        if sim.step(autoplay_action(sim), dt) != GameState.PLAYING:
+            break
+    print(f"Headless: {sim.frames} frames, state={sim.state.name}, score={sim.score}, lives={sim.lives}")
+
+#
+# Replay an input recording headless and report where the game ended up
+#
+def run_replay(path: str) -> None:
+    level, physics_hz, balls, frames = read_recording(path)
+    if physics_hz != config.PHYSICS_HZ:
+        print(f"Recording uses {physics_hz} Hz physics (config has {config.PHYSICS_HZ}); replaying at {physics_hz} Hz")
+        config.PHYSICS_HZ = physics_hz
+    if balls != config.BALLS:
+        print(f"Recording serves {balls} balls (config has {config.BALLS}); replaying with {balls}")
+        config.BALLS = balls
+    
+    os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+    game = Game(initial_level=level)
+    started = time.perf_counter()
+    count = game.replay(frames)
+    elapsed = time.perf_counter() - started
+    recorded = sum(frame.dt_ms for frame in frames[:count]) / 1000.0
+    print(f"Replay: {count}/{len(frames)} frames, state={game.game_state.name}, score={game.score}, "
+          f"lives={game.lives}, level={game.level_manager.current_level}, "
+          f"{recorded:.1f}s of play in {elapsed:.2f}s")
+    pygame.quit()
+
 def main(argv=None):
     argv = argv or sys.argv[1:]
+    use_project_venv()
     
     # Check for level parameter
     start_level = 1
@@ -284,16 +527,53 @@ def main(argv=None):
                 print(f"Invalid level number: {arg}")
                 return
     
-    # headless test mode
-    headless = "--headless" in argv
-    if headless:
-        os.environ.setdefault("SDL_VIDEODRIVER", "dummy") # set dummy video driver
+    # --balls=N serves N balls per life (multi-ball); recordings store N
+    for arg in argv:
+        if arg.startswith("--balls="):
+            try:
+                config.BALLS = max(1, int(arg.split("=")[1]))
+            except ValueError:
+                print(f"Invalid ball count: {arg}")
+                return
+    
+    # headless mode: simulation core only, no display, fonts or frame limiter
+    if "--headless" in argv:
+        frames = 10
+        for arg in argv:
+            if arg.startswith("--frames="):
+                try:
+                    frames = int(arg.split("=")[1])
+                except ValueError:
+                    print(f"Invalid frame count: {arg}")
+                    return
+        run_headless(start_level, frames)
+        return
+    
+    # replay mode: a recorded session through Game.step_frame, no window or frame limiter
+    for arg in argv:
+        if arg.startswith("--replay="):
+            run_replay(arg.split("=", 1)[1])
+            return
+    
+    # --record=FILE logs every frame's input for --replay
+    recorder = None
+    for arg in argv:
+        if arg.startswith("--record="):
+            recorder = inputRecorder(arg.split("=", 1)[1], start_level, config.PHYSICS_HZ, config.BALLS)
+    
+    # --profile[=DIR] writes cProfile stats per game state and level to DIR on
+    # exit, and --profile-memory adds tracemalloc allocation diffs
+    profiler = None
+    for arg in argv:
+        if arg == "--profile" or arg.startswith("--profile="):
+            from Core.sessionProfiler import SessionProfiler
+            out_dir = arg.split("=", 1)[1] if "=" in arg else "profile"
+            profiler = SessionProfiler(out_dir, memory="--profile-memory" in argv)
     
-    game = Game(initial_level=start_level)
-    if headless:
-        game.run(max_frames=10)  # run a short headless smoke test
-    else:
-        game.run()  # run interactive loop
+    # --startup-profile prints import and init times once the first frame is up
+    profile = _imports if "--startup-profile" in argv else None
+    game = Game(initial_level=start_level, profile=profile)
+    game.run(recorder=recorder, profiler=profiler)  # run interactive loop
 
 
 if __name__ == "__main__":
@@ -0,0 +1,189 @@
+#
+# Level evaluation runner.
+# Plays each level file many times with a seeded autopilot on the headless
+# simulation core, spreads the runs over a process pool and reports per-level
+# statistics (frames-to-clear, lives lost, score) as JSON.
+#
+# Each worker builds one Simulation (and its level index) when it starts and
+# resets it with the already parsed level for every run. Runs go to the
+# workers in chunks, and a run that raises is reported as failed without
+# stopping the others.
+#
+# Usage:
+#   python evaluate.py [level.json ...] [--runs=N] [--workers=N] [--seed=S]
+#                      [--max-frames=N] [--out=results.json]
+#
+import argparse
+import glob
+import json
+import math
+import os
+import random
+import sys
+import time
+import traceback
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, List, Optional, Tuple
+
+from Core import config
+from Core.simulation import Simulation, autoplay_action
+from Managers.game_state import GameState
+from Objects.level import Level
+from Objects.levelCompiler import load_level
+
+_levels: Dict[str, Level] = {}  # per-process parse cache
+_simulation: Optional[Simulation] = None  # per-process simulation, reset for every run
+
+
+#
+# The worker's Simulation, built on first use (the pool initializer builds
+# it up front)
+#
+def worker_simulation() -> Simulation:
+    global _simulation
+    if _simulation is None:
+        _simulation = Simulation()
+    return _simulation
+
+
+def init_worker() -> None:
+    worker_simulation()
+
+
+#
+# One seeded autopilot run. The aim point on the paddle is re-rolled after
+# every paddle bounce so different seeds play different games.
+#
+def run_level(path: str, seed: int, max_frames: int) -> dict:
+    level = _levels.get(path)
+    if level is None:
+        level = _levels[path] = load_level(path)
+
+    rng = random.Random(seed)
+    sim = worker_simulation()
+    sim.reset(level)
+    dt = 1.0 / config.PHYSICS_HZ
+    aim = rng.uniform(-0.7, 0.7)
+    falling = False
+
+    state = GameState.PLAYING
+    while sim.frames < max_frames and state == GameState.PLAYING:
+        state = sim.step(autoplay_action(sim, aim), dt)
+        if falling and sim.ball.vy < 0:
+            aim = rng.uniform(-0.7, 0.7)
+        falling = sim.ball.vy > 0
+
+    return {
+        "level": path,
+        "seed": seed,
+        "cleared": state == GameState.LEVEL_COMPLETE,
+        "frames": sim.frames,
+        "lives_lost": sim.start_lives - sim.lives,
+        "score": sim.score,
+    }
+
+
+#
+# run_level for one (path, seed, max_frames) task, as a failed run record
+# instead of an exception if it raises
+#
+def run_task(task: Tuple[str, int, int]) -> dict:
+    path, seed, max_frames = task
+    try:
+        return run_level(path, seed, max_frames)
+    except Exception as e:
+        return {"level": path, "seed": seed, "error": f"{type(e).__name__}: {e}",
+                "traceback": traceback.format_exc()}
+
+
+#
+# Nearest-rank percentile of a non-empty list
+#
+def percentile(values: List[float], pct: float) -> float:
+    ordered = sorted(values)
+    rank = max(1, math.ceil(pct / 100.0 * len(ordered)))
+    return ordered[rank - 1]
+
+
+def summarise(runs: List[dict]) -> dict:
+    failed = len([r for r in runs if "error" in r])
+    runs = [r for r in runs if "error" not in r]
+    cleared = [r["frames"] for r in runs if r["cleared"]]
+    return {
+        "runs": len(runs),
+        "failed": failed,
+        "cleared": len(cleared),
+        "clear_rate": len(cleared) / len(runs) if runs else 0.0,
+        "mean_frames_to_clear": sum(cleared) / len(cleared) if cleared else None,
+        "p95_frames_to_clear": percentile(cleared, 95) if cleared else None,
+        "mean_lives_lost": sum(r["lives_lost"] for r in runs) / len(runs) if runs else 0.0,
+        "mean_score": sum(r["score"] for r in runs) / len(runs) if runs else 0.0,
+    }
+
+
+def default_level_files() -> List[str]:
+    base_dir = os.path.dirname(os.path.abspath(__file__))
+    return sorted(glob.glob(os.path.join(base_dir, config.LEVELS_DIR, "*.json")))
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Evaluate levels with seeded autopilot runs.")
+    parser.add_argument("levels", nargs="*", help="level files (default: every level in the levels directory)")
+    parser.add_argument("--runs", type=int, default=32, help="seeded runs per level")
+    parser.add_argument("--workers", type=int, default=os.cpu_count(), help="worker processes")
+    parser.add_argument("--seed", type=int, default=0, help="first seed; run i uses seed + i")
+    parser.add_argument("--max-frames", type=int, default=config.PHYSICS_HZ * 600,
+                        help="give up on a run after this many physics steps")
+    parser.add_argument("--out", default=None, help="write per-level stats as JSON to this file")
+    args = parser.parse_args(argv)
+
+    levels = [os.path.abspath(p) for p in args.levels] or default_level_files()
+    if not levels:
+        print("No level files found")
+        return 1
+
+    results: Dict[str, List[dict]] = {path: [] for path in levels}
+    total = len(levels) * args.runs
+    done = 0
+    started = time.perf_counter()
+
+    #
+    # Stream runs back in chunks of a few per worker
+    #
+    tasks = [(path, args.seed + i, args.max_frames) for path in levels for i in range(args.runs)]
+    workers = args.workers or os.cpu_count() or 1
+    chunksize = max(1, len(tasks) // (4 * workers))
+    failed = 0
+    with ProcessPoolExecutor(max_workers=workers, initializer=init_worker) as pool:
+        for run in pool.map(run_task, tasks, chunksize=chunksize):
+            results[run["level"]].append(run)
+            done += 1
+            if "error" in run:
+                failed += 1
+                print(f"[{done}/{total}] {os.path.basename(run['level'])} seed={run['seed']}: "
+                      f"failed: {run['error']}\n{run['traceback']}", flush=True)
+                continue
+            outcome = f"cleared in {run['frames']} frames" if run["cleared"] else f"not cleared after {run['frames']} frames"
+            print(f"[{done}/{total}] {os.path.basename(run['level'])} seed={run['seed']}: "
+                  f"{outcome}, score {run['score']}, lives lost {run['lives_lost']}", flush=True)
+
+    report = {
+        "runs_per_level": args.runs,
+        "max_frames": args.max_frames,
+        "physics_hz": config.PHYSICS_HZ,
+        "elapsed_seconds": time.perf_counter() - started,
+        "levels": {path: summarise(runs) for path, runs in results.items()},
+    }
+
+    text = json.dumps(report, indent=2)
+    if args.out:
+        with open(args.out, "w", encoding="utf-8") as fh:
+            fh.write(text)
+        print(f"Wrote {args.out}")
+    else:
+        print(text)
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -47,4 +47,14 @@ def test_rect_dimensions():
 
     assert (w, h) == (6, 6)
     assert left == int(b.x - b.radius)
-    assert top == int(b.y - b.radius)
\ No newline at end of file
+    assert top == int(b.y - b.radius)
+
+def test_render_pos_interpolates_between_steps():
+    b = Ball(x=0, y=0, speed=10.0, vx=1, vy=0)
+
+    b.snapshot()
+    b.update(dt=1.0)
+
+    assert b.render_pos(0.0) == pytest.approx((0.0, 0.0))
+    assert b.render_pos(0.5) == pytest.approx((5.0, 0.0))
+    assert b.render_pos(1.0) == pytest.approx((10.0, 0.0))
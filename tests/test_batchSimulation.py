@@ -0,0 +1,76 @@
+import sys
+import os
+import pytest
+
+#
+# Allow imports from project root
+#
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+np = pytest.importorskip("numpy")
+
+from Core import config
+from Core.batchSimulation import BatchSimulation, GAME_OVER, LEVEL_COMPLETE, PLAYING
+from Core.simulation import Simulation, autoplay_action
+from Objects.block import Block
+from Objects.level import Level
+
+
+def make_level():
+    blocks = []
+    for gx in range(4, 16):
+        for gy in range(2, 5):
+            blocks.append(Block(gx * 40, gy * 40, 38, 20, hp=1 + (gx + gy) % 2, score=10 * gx))
+    return Level(config.SCREEN_WIDTH, config.SCREEN_HEIGHT, config.TILE_SIZE, blocks)
+
+
+def test_batch_matches_discrete_simulation(monkeypatch):
+    #
+    # Same level, same autopilot aims: every game must track the scalar core
+    #
+    monkeypatch.setattr(config, "COLLISION_MODE", "discrete")
+    aims = [-0.6, -0.2, 0.3, 0.7]
+    dt = 1 / 120
+
+    batch = BatchSimulation(make_level(), n_games=len(aims))
+    sims = []
+    for aim in aims:
+        sim = Simulation()
+        sim.reset(make_level())
+        sims.append(sim)
+
+    aim_arr = np.array(aims)
+    for _ in range(3000):
+        batch.step(batch.autoplay_directions(aim_arr), True, dt)
+        for sim, aim in zip(sims, aims):
+            sim.step(autoplay_action(sim, aim), dt)
+
+    for i, sim in enumerate(sims):
+        assert batch.score[i] == sim.score
+        assert batch.lives[i] == sim.lives
+        assert batch.ball_x[i] == pytest.approx(sim.ball.x)
+        assert batch.ball_y[i] == pytest.approx(sim.ball.y)
+        assert batch.blocks_left[i] == sim.level_manager.blocks.live
+
+
+def test_batch_life_loss_and_game_over():
+    batch = BatchSimulation(make_level(), n_games=2, lives=1)
+    batch.step(0.0, True, 1 / 120)
+    batch.launched[:] = True
+    batch.ball_y[0] = config.SCREEN_HEIGHT + 50
+    batch.ball_vy[0] = 1.0
+
+    state = batch.step(0.0, False, 1 / 120)
+    assert state[0] == GAME_OVER
+    assert state[1] == PLAYING
+    assert batch.game_over.tolist() == [True, False]
+
+
+def test_batch_per_game_layouts_and_completion():
+    empty = Level(config.SCREEN_WIDTH, config.SCREEN_HEIGHT, config.TILE_SIZE, [])
+    batch = BatchSimulation([make_level(), empty], paddle_width=[100, 60], ball_speed=[300, 450])
+
+    state = batch.step(0.0, False, 1 / 120)
+    assert state.tolist() == [PLAYING, LEVEL_COMPLETE]
+    assert batch.paddle_width.tolist() == [100, 60]
+    assert batch.results()["completed"].tolist() == [False, True]
@@ -0,0 +1,43 @@
+import sys
+import os
+import json
+
+#
+# Allow imports from project root
+#
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from benchmarks import suite
+
+
+def test_synthetic_level_has_requested_blocks():
+    data = suite.synthetic_level_data(500)
+    assert len(data["blocks"]) == 500
+    tile = data["tile_size"]
+    assert max(b["y"] for b in data["blocks"]) * tile < data["height"]
+
+
+def test_compare_flags_slowdowns_by_direction():
+    baseline = {"collision/10": 2.0, "headless/10": 1000.0, "parse/10": 1.0}
+    results = {"collision/10": 2.5, "headless/10": 700.0, "parse/10": 1.05, "render/10": 9.0}
+    slower = {name for name, *_ in suite.compare(results, baseline, 0.1)}
+    assert slower == {"collision/10", "headless/10"}
+
+
+def test_suite_writes_results_and_gates_on_baseline(tmp_path):
+    out = str(tmp_path / "results.json")
+    assert suite.main(["--sizes=10", "--repeat=1", "--no-render", f"--out={out}"]) == 0
+    with open(out) as fh:
+        report = json.load(fh)
+    assert set(report["results"]) == {"parse/10", "collision/10", "headless/10"}
+
+    #
+    # A baseline ten times faster than this run flags every metric
+    #
+    fast = dict(report)
+    fast["results"] = {name: (value * 10 if name.startswith("headless") else value / 10)
+                       for name, value in report["results"].items()}
+    baseline = str(tmp_path / "baseline.json")
+    with open(baseline, "w") as fh:
+        json.dump(fast, fh)
+    assert suite.main(["--sizes=10", "--repeat=1", "--no-render", f"--compare={baseline}"]) == 1
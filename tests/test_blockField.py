@@ -0,0 +1,78 @@
+import sys
+import os
+
+#
+# Allow imports from project root
+#
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from Objects.block import Block
+import json
+import pytest
+from Objects.blockField import MAX_IDS, BlockField, pack_color, unpack_color
+from Objects.level import Level
+
+
+def test_append_and_view_round_trip():
+    field = BlockField()
+    index = field.append(10, 20, 40, 15, type="hard", hp=2, score=150, color="#ff8000")
+
+    view = field.block(index)
+    assert isinstance(view, Block)
+    assert view.rect() == (10, 20, 40, 15)
+    assert (view.type, view.hp, view.score, view.color) == ("hard", 2, 150, "#FF8000")
+    assert unpack_color(field.color_of(index)) == (255, 128, 0)
+
+
+def test_view_hit_updates_field_and_live_count():
+    field = BlockField.from_blocks([Block(0, 0, 20, 10, hp=2), Block(30, 0, 20, 10, hp=1)])
+    assert field.live == 2
+
+    assert field.block(0).hit() is False
+    assert field.hp[0] == 1
+    assert field.hit(1) is True
+    assert field.live == 1
+    assert field.alive_indices() == [0]
+    assert [v.index for v in field.live_blocks()] == [0]
+
+
+def test_copy_is_independent():
+    field = BlockField.from_blocks([Block(0, 0, 20, 10, hp=1)])
+    clone = field.copy()
+
+    clone.hit(0)
+    assert clone.live == 0
+    assert field.live == 1
+    assert field.hp[0] == 1
+
+
+def test_pack_color_invalid_is_white():
+    assert pack_color("#12") == 0xFFFFFF
+    assert pack_color("#GGGGGG") == 0xFFFFFF
+    assert pack_color("#010203") == 0x010203
+
+
+def test_colours_share_palette_entries():
+    field = BlockField()
+    for colour in ("#FF0000", "#00FF00", "#ff0000", "#FF0000"):
+        field.append(0, 0, 10, 10, color=colour)
+    assert list(field.palette) == [0xFF0000, 0x00FF00]
+    assert list(field.color) == [0, 1, 0, 0]
+
+    field.block(1).color = "#FF0000"
+    assert field.color[1] == 0
+    assert len(field.palette) == 2
+
+
+def test_too_many_types_is_a_clear_error(tmp_path):
+    field = BlockField()
+    field.types = [str(i) for i in range(MAX_IDS)]
+    field.type_ids = {name: i for i, name in enumerate(field.types)}
+    with pytest.raises(ValueError, match="block types"):
+        field.append(0, 0, 10, 10, type="one more")
+    assert len(field.x) == 0  # nothing half-written
+
+    path = tmp_path / "level1.json"
+    path.write_text(json.dumps({"palette": ["#%06X" % i for i in range(MAX_IDS + 1)], "blocks": []}))
+    with pytest.raises(ValueError, match="palette"):
+        Level.from_file(str(path))
@@ -0,0 +1,53 @@
+import sys
+import os
+
+#
+# Allow imports from project root
+#
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+import pygame
+from Objects.block import Block
+from Objects.blockField import BlockField
+from Objects.spatialGrid import SpatialGrid
+from UI.blockLayer import blockLayer
+
+
+def make_field():
+    #
+    # Overlapping blocks so a patch has to repaint its neighbours
+    #
+    return BlockField.from_blocks([
+        Block(10, 10, 50, 20, color="#FF0000"),
+        Block(40, 20, 50, 20, color="#00FF00"),
+        Block(120, 10, 40, 20, color="#0000FF"),
+    ])
+
+
+def test_patch_matches_full_rebuild():
+    field = make_field()
+    grid = SpatialGrid.from_field(field, cell_size=40)
+    layer = blockLayer((200, 100))
+    layer.build(field, grid)
+
+    #
+    # Destroy the first block and patch only its area
+    #
+    field.hit(0)
+    grid.remove(0, *field.rect(0))
+    layer.patch([0])
+
+    fresh = blockLayer((200, 100))
+    fresh.build(field, grid)
+    assert pygame.image.tobytes(layer.surface, "RGB") == pygame.image.tobytes(fresh.surface, "RGB")
+    assert layer.surface.get_at((15, 15))[:3] == (0, 0, 0)
+    assert layer.surface.get_at((50, 30))[:3] == (0, 255, 0)
+
+
+def test_layer_is_stale_for_a_new_field():
+    field = make_field()
+    layer = blockLayer((200, 100))
+    layer.build(field, SpatialGrid.from_field(field, cell_size=40))
+
+    assert layer.is_stale(field) is False
+    assert layer.is_stale(field.copy()) is True
@@ -0,0 +1,57 @@
+import sys
+import os
+
+#
+# Allow imports from project root
+#
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+
+import pytest
+import breakout
+from Core import config
+from Core.simulation import Action
+from Managers.game_state import GameState
+
+HOLD = Action(0.0, False)
+
+
+def playing_game():
+    game = breakout.Game(initial_level=1)
+    game.process_actions("start_selected_level")
+    game.game_state = GameState.PLAYING
+    return game
+
+
+def test_frame_time_runs_in_whole_steps_and_leaves_alpha():
+    game = playing_game()
+    step = 1.0 / config.PHYSICS_HZ
+    frames = game.sim.frames
+
+    alpha = game.step_frame(2.5 * step, GameState.PLAYING, True, "", HOLD)
+    assert game.sim.frames - frames == 2
+    assert alpha == pytest.approx(0.5)
+
+
+def test_steps_per_frame_are_capped():
+    game = playing_game()
+    frames = game.sim.frames
+
+    alpha = game.step_frame(1.0, GameState.PLAYING, True, "", HOLD)
+    assert game.sim.frames - frames == config.MAX_PHYSICS_STEPS
+    assert alpha == 1.0  # the backlog is dropped down to one step
+
+
+def test_no_alpha_once_the_level_ends_mid_frame():
+    game = playing_game()
+    blocks = game.level_manager.blocks
+    for index in blocks.alive_indices():
+        blocks.kill(index)
+    game.ball_launched = True
+
+    #
+    # Several physics steps' worth of time; the first one completes the level
+    #
+    alpha = game.step_frame(0.1, GameState.PLAYING, True, "", HOLD)
+    assert game.game_state == GameState.LEVEL_COMPLETE
+    assert alpha is None
@@ -9,10 +9,12 @@ import pytest
 sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
 
 from Core import config
-from Managers.collisionManager import collisionManager
+from Managers.collisionManager import HitEvent, NO_HITS, collisionManager
 from Objects.ball import Ball
 from Objects.paddle import Paddle
 from Objects.block import Block
+from Objects.blockField import BlockField
+from Objects.spatialGrid import SpatialGrid
 
 
 def test_check_ball_walls_left_right_top(monkeypatch):
@@ -76,12 +78,54 @@ def test_check_ball_blocks_destroys_and_scores():
     # 
     # Block at (0,0) size 10x10; ball centered will collide and destroy it
     #
-    block = Block(x=0, y=0, width=10, height=10, hp=1, score=123)
+    field = BlockField.from_blocks([Block(x=0, y=0, width=10, height=10, hp=1, score=123)])
     b = Ball(x=5.0, y=5.0, radius=6, vx=0, vy=1)
 
-    remaining, score_inc = collisionManager.check_ball_blocks(b, [block])
-    assert score_inc == 123
-    assert remaining == []
+    events = collisionManager.check_ball_blocks(b, field)
+    assert len(events) == 1
+    assert events[0].index == 0
+    assert events[0].destroyed is True
+    assert collisionManager.score_events(field, events) == 123
+    assert field.live == 0
+
+
+def test_check_ball_blocks_with_grid_removes_in_place():
+    #
+    # Only the block under the ball is tested; the far block stays untouched
+    #
+    field = BlockField.from_blocks([
+        Block(x=0, y=0, width=10, height=10, hp=1, score=50),
+        Block(x=400, y=400, width=10, height=10, hp=1, score=70),
+    ])
+    grid = SpatialGrid.from_field(field, cell_size=40)
+    b = Ball(x=5.0, y=5.0, radius=6, vx=0, vy=1)
+
+    events = collisionManager.check_ball_blocks(b, field, grid)
+    assert collisionManager.score_events(field, events) == 50
+    assert field.alive_indices() == [1]
+    assert len(grid.query(0, 0, 10, 10)) == 0
+
+
+def test_check_ball_blocks_reports_events_without_rebuilding():
+    #
+    # Miss: shared empty result. Hit on a 2hp block: damaged, not destroyed,
+    # normal pointing up towards the ball above it
+    #
+    field = BlockField.from_blocks([Block(x=40, y=40, width=80, height=20, hp=2)])
+    grid = SpatialGrid.from_field(field, cell_size=40)
+
+    b = Ball(x=300.0, y=300.0, radius=6, vx=0, vy=1)
+    assert collisionManager.check_ball_blocks(b, field, grid) is NO_HITS
+
+    #
+    # Ball straddles two cells the block spans; it must be hit only once
+    #
+    b = Ball(x=80.0, y=36.0, radius=6, vx=0, vy=1)
+    events = collisionManager.check_ball_blocks(b, field, grid)
+    assert events == [HitEvent(0, 1, False, 0.0, -1.0)]
+    assert b.vy < 0
+    assert field.hp[0] == 1
+    assert field.live == 1
 
 
 def test_check_ball_bottom(monkeypatch):
@@ -91,3 +135,129 @@ def test_check_ball_bottom(monkeypatch):
     monkeypatch.setattr(config, "SCREEN_HEIGHT", 50)
     b = Ball(x=10, y=100, radius=5, vx=0, vy=1)
     assert collisionManager.check_ball_bottom(b) is True
+
+
+def test_sweep_ball_does_not_tunnel_through_block(monkeypatch):
+    #
+    # A single huge step would carry the ball straight past a 20px block
+    #
+    monkeypatch.setattr(config, "SCREEN_WIDTH", 800)
+    blocks = BlockField.from_blocks([Block(x=0, y=100, width=800, height=20, hp=1, score=100)])
+    p = Paddle(x=400.0, y=590.0, width=100, height=16, speed=10)
+    b = Ball(x=400.0, y=300.0, radius=6, speed=1000.0, vx=0, vy=-1)
+
+    events = collisionManager.sweep_ball(b, p, blocks, None, dt=0.25)
+    assert collisionManager.score_events(blocks, events) == 100
+    assert (events[0].nx, events[0].ny) == (0.0, 1.0)
+    assert blocks.live == 0
+    assert b.vy > 0
+    #
+    # Contact after 174px; the remaining 76px continue downward
+    #
+    assert b.y == pytest.approx(120 + 6 + 76)
+
+
+def test_sweep_ball_resolves_one_contact_between_adjacent_blocks(monkeypatch):
+    #
+    # Hitting the seam between two blocks flips vy once, not twice
+    #
+    monkeypatch.setattr(config, "SCREEN_WIDTH", 800)
+    field = BlockField.from_blocks([
+        Block(x=300, y=100, width=100, height=20, hp=2),
+        Block(x=400, y=100, width=100, height=20, hp=2),
+    ])
+    p = Paddle(x=400.0, y=590.0, width=100, height=16, speed=10)
+    b = Ball(x=400.0, y=200.0, radius=6, speed=300.0, vx=0, vy=-1)
+
+    collisionManager.sweep_ball(b, p, field, None, dt=0.5)
+    assert b.vy > 0
+    assert field.hp[0] + field.hp[1] == 3
+
+
+def test_sweep_starting_in_corner_region_hits_rounded_corner(monkeypatch):
+    #
+    # (95, 95) lies inside the block grown by the radius but 7px from its
+    # corner, so nothing touches yet
+    #
+    contact = collisionManager.sweep_circle_rect(95, 95, 6, 50, 50, 100, 100, 40, 20)
+    assert contact is not None
+    t, nx, ny = contact
+    assert 0 < t < 0.05
+    assert nx == pytest.approx(-2 ** -0.5) and ny == pytest.approx(-2 ** -0.5)
+
+    t, nx, ny = collisionManager.sweep_circle_rect(95, 95, 6, 10, 0, 100, 100, 40, 20)
+    assert t == pytest.approx((5 - 11 ** 0.5) / 10)
+    assert ny < 0
+
+    monkeypatch.setattr(config, "SCREEN_WIDTH", 800)
+    field = BlockField.from_blocks([Block(x=100, y=100, width=40, height=20)])
+    b = Ball(x=95.0, y=95.0, radius=6, speed=50 * 2 ** 0.5, vx=1, vy=1)
+    events = collisionManager.sweep_ball(b, None, field, None, dt=1.0)
+    assert len(events) == 1 and field.live == 0
+    assert b.vx < 0 and b.vy < 0
+
+
+def test_sweep_ball_bounces_off_paddle_and_walls(monkeypatch):
+    monkeypatch.setattr(config, "SCREEN_WIDTH", 800)
+    p = Paddle(x=400.0, y=500.0, width=100, height=16, speed=10)
+
+    b = Ball(x=400.0, y=300.0, radius=6, speed=2000.0, vx=0, vy=1)
+    collisionManager.sweep_ball(b, p, BlockField(), None, dt=0.2)
+    assert b.vy < 0
+    assert b.y < 500 - 8
+
+    b = Ball(x=20.0, y=300.0, radius=6, speed=1000.0, vx=-1, vy=0)
+    collisionManager.sweep_ball(b, p, BlockField(), None, dt=0.1)
+    assert b.vx > 0
+    assert b.x == pytest.approx(6 + 100 - 14)
+
+
+def test_sweep_circle_rect_rounded_corner_miss():
+    #
+    # Ray passing the square corner of the expanded rect but outside the
+    # rounded corner does not hit
+    #
+    contact = collisionManager.sweep_circle_rect(0.0, 0.0, 5.0, 100.0, 100.0, 54.0, 54.0, 10.0, 10.0)
+    assert contact is not None
+    contact = collisionManager.sweep_circle_rect(0.0, 8.5, 5.0, 100.0, 100.0, 60.0, 50.0, 10.0, 10.0)
+    assert contact is None
+
+
+def test_broad_phase_pairs_balls_with_paddle_and_blocks():
+    field = BlockField.from_blocks([Block(0, 0, 40, 20), Block(400, 0, 40, 20)])
+    grid = SpatialGrid.from_field(field, 40)
+    paddle = Paddle(200, 500)
+    near_block = Ball(20, 30, radius=5)
+    near_paddle = Ball(200, 485, radius=5)
+    twin = Ball(21, 30, radius=5)
+    far = Ball(700, 300, radius=5)
+
+    pairs = collisionManager.broad_phase([far, near_paddle, near_block, twin], paddle, field, grid, 1 / 120)
+    assert [pair.ball for pair in pairs] == [near_block, twin, near_paddle, far]
+    by_ball = {id(pair.ball): pair for pair in pairs}
+    assert list(by_ball[id(near_block)].blocks) == [0]
+    assert by_ball[id(twin)].blocks is by_ball[id(near_block)].blocks  # same cells, one lookup
+    assert by_ball[id(near_paddle)].paddle is paddle
+    assert by_ball[id(near_block)].paddle is None
+    assert not by_ball[id(far)].blocks
+
+    #
+    # Without a grid every ball shares the live block list
+    #
+    pairs = collisionManager.broad_phase([far, near_block], paddle, field, None, 1 / 120)
+    assert pairs[0].blocks is pairs[1].blocks
+    assert list(pairs[0].blocks) == [0, 1]
+
+
+def test_sweep_ball_skips_blocks_destroyed_by_another_ball(monkeypatch):
+    monkeypatch.setattr(config, "SCREEN_WIDTH", 400)
+    field = BlockField.from_blocks([Block(0, 0, 40, 20)])
+    grid = SpatialGrid.from_field(field, 40)
+    first = Ball(20, 30, radius=5, speed=600, vx=0, vy=-1)
+    second = Ball(22, 30, radius=5, speed=600, vx=0, vy=-1)
+    pairs = collisionManager.broad_phase([first, second], Paddle(200, 500), field, grid, 1 / 60)
+
+    hits = [collisionManager.sweep_ball(pair.ball, pair.paddle, field, grid, 1 / 60, pair.blocks)
+            for pair in pairs]
+    assert [len(h) for h in hits] == [1, 0]
+    assert hits[0][0].destroyed
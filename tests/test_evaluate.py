@@ -0,0 +1,67 @@
+import sys
+import os
+import json
+
+#
+# Allow imports from project root
+#
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+import evaluate
+
+
+def test_percentile_nearest_rank():
+    values = list(range(1, 101))
+    assert evaluate.percentile(values, 95) == 95
+    assert evaluate.percentile([7], 95) == 7
+
+
+def test_run_level_is_seeded(tmp_path):
+    level_file = tmp_path / "level1.json"
+    level_file.write_text(json.dumps({
+        "blocks": [{"x": 9, "y": 3, "width": 40, "height": 20, "score": 50}]
+    }))
+
+    first = evaluate.run_level(str(level_file), seed=3, max_frames=120 * 120)
+    second = evaluate.run_level(str(level_file), seed=3, max_frames=120 * 120)
+    assert first == second
+    assert first["cleared"] is True
+    assert first["score"] == 50
+
+
+def test_summarise_only_counts_cleared_runs_for_frames():
+    runs = [
+        {"cleared": True, "frames": 100, "lives_lost": 0, "score": 10},
+        {"cleared": False, "frames": 900, "lives_lost": 3, "score": 0},
+    ]
+    stats = evaluate.summarise(runs)
+    assert stats["clear_rate"] == 0.5
+    assert stats["mean_frames_to_clear"] == 100
+    assert stats["p95_frames_to_clear"] == 100
+    assert stats["mean_lives_lost"] == 1.5
+
+
+def test_runs_reuse_the_worker_simulation(tmp_path):
+    level_file = tmp_path / "level1.json"
+    level_file.write_text(json.dumps({"blocks": [{"x": 9, "y": 3, "score": 50}]}))
+
+    first = evaluate.run_level(str(level_file), seed=1, max_frames=200)
+    sim = evaluate.worker_simulation()
+    second = evaluate.run_level(str(level_file), seed=1, max_frames=200)
+    assert evaluate.worker_simulation() is sim
+    assert first == second
+
+
+def test_a_failing_run_does_not_stop_the_evaluation(tmp_path, capsys):
+    good = tmp_path / "level1.json"
+    good.write_text(json.dumps({"blocks": [{"x": 9, "y": 3, "score": 50}]}))
+    bad = tmp_path / "level2.json"
+    bad.write_text("not json")
+    out = tmp_path / "results.json"
+
+    assert evaluate.main([str(good), str(bad), "--runs=2", "--workers=1",
+                          "--max-frames=200", f"--out={out}"]) == 1
+    assert "failed: " in capsys.readouterr().out
+    report = json.loads(out.read_text())["levels"]
+    assert report[str(good)]["runs"] == 2
+    assert (report[str(bad)]["runs"], report[str(bad)]["failed"]) == (0, 2)
@@ -0,0 +1,60 @@
+import sys
+import os
+import json
+
+#
+# Allow imports from project root
+#
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from Core.frameTimer import FrameTimer, percentile
+
+
+def record(timer, frames):
+    for _ in range(frames):
+        timer.begin_frame()
+        for phase in timer.phases:
+            timer.mark(phase)
+        timer.end_frame()
+
+
+def test_ring_buffer_keeps_the_latest_frames():
+    timer = FrameTimer(capacity=4, phases=("a", "b"), enabled=True)
+    record(timer, 3)
+    assert len(timer) == 3
+    record(timer, 7)
+    assert timer.frames == 10
+    assert len(timer) == 4
+    rows = timer.rows()
+    assert len(rows) == 4 and all(len(row) == 3 for row in rows)
+    assert all(row[-1] >= row[0] + row[1] for row in rows)
+    assert timer.frame_times(2) == [row[-1] for row in rows[-2:]]
+
+
+def test_phase_marks_accumulate_within_a_frame():
+    timer = FrameTimer(capacity=2, phases=("render", "hud"))
+    timer.begin_frame()
+    timer.mark("render")
+    timer.mark("hud")
+    timer.mark("render")
+    timer.end_frame()
+    assert timer.rows()[0][0] >= 0.0
+    assert set(timer.summary()) == {"p50", "p95", "p99", "max", "render", "hud"}
+
+
+def test_dump(tmp_path):
+    timer = FrameTimer(capacity=8)
+    record(timer, 5)
+    path = str(tmp_path / "frames.json")
+    timer.dump_json(path)
+    with open(path) as fh:
+        dump = json.load(fh)
+    assert dump["phases"][-1] == "frame"
+    assert dump["frames_recorded"] == 5
+    assert len(dump["rows"]) == 5
+
+
+def test_percentile():
+    assert percentile([5, 1, 3, 2, 4], 50) == 3
+    assert percentile([5, 1, 3, 2, 4], 100) == 5
+    assert percentile([], 95) == 0.0
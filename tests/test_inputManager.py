@@ -10,32 +10,21 @@ sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
 
 import importlib
 im = importlib.import_module('Managers.inputManager')
+import pygame
 from Managers.game_state import GameState
 from Objects.paddle import Paddle
 
 
-def setup_dummy_pygame(module):
+#
+# Stand-in pygame with the real key and event constants (the transition
+# table is keyed on them) and a key getter the tests can control; monkeypatch
+# puts the real module back afterwards
+#
+def setup_dummy_pygame(monkeypatch):
     pg = SimpleNamespace()
-    # 
-    # basic keys
-    #
-    pg.K_SPACE = 32
-    pg.K_LEFT = 0
-    pg.K_a = 1
-    pg.K_RIGHT = 2
-    pg.K_d = 3
-    pg.K_ESCAPE = 27
-    pg.K_UP = 38
-    pg.K_DOWN = 40
-    pg.K_RETURN = 13
-    pg.K_p = ord('p')
-    pg.K_r = ord('r')
-
-    # 
-    # event type constants
-    #
-    pg.KEYDOWN = 1000
-    pg.QUIT = 1001
+    for name in ("K_SPACE", "K_LEFT", "K_a", "K_RIGHT", "K_d", "K_ESCAPE", "K_UP", "K_DOWN",
+                 "K_RETURN", "K_p", "K_r", "K_F3", "K_F4", "KEYDOWN", "QUIT"):
+        setattr(pg, name, getattr(pygame, name))
 
     # default key getter (returns no keys pressed)
     class KeyMap(dict):
@@ -45,12 +34,27 @@ def setup_dummy_pygame(module):
     pg.key = SimpleNamespace()
     pg.key.get_pressed = lambda: KeyMap()
 
-    module.pygame = pg
+    monkeypatch.setattr(im, "pygame", pg)
     return pg
 
 
-def test_check_launch_ball_true_false():
-    pg = setup_dummy_pygame(im)
+#
+# Run events through the state machine in order, as Game.run_frame does.
+# Returns the final state, running flag and actions; nothing after a quit.
+#
+def apply_events(events, game_state, running=True):
+    actions = []
+    for event in events:
+        game_state, running, action = im.inputManager.transition(event, game_state, running)
+        if action:
+            actions.append(action)
+        if not running:
+            break
+    return game_state, running, actions
+
+
+def test_check_launch_ball_true_false(monkeypatch):
+    pg = setup_dummy_pygame(monkeypatch)
 
     keys = {pg.K_SPACE: True}
     assert im.inputManager.check_launch_ball(keys, ball_launched=False) is True
@@ -61,7 +65,7 @@ def test_check_launch_ball_true_false():
 
 
 def test_handle_game_input_moves_when_playing(monkeypatch):
-    pg = setup_dummy_pygame(im)
+    pg = setup_dummy_pygame(monkeypatch)
 
     # simulate left key pressed; use the default KeyMap so missing keys return False
     keys_map = im.pygame.key.get_pressed()
@@ -73,8 +77,8 @@ def test_handle_game_input_moves_when_playing(monkeypatch):
     assert p.x < 50.0
 
 
-def test_handle_state_transitions_menu_and_quit():
-    pg = setup_dummy_pygame(im)
+def test_transitions_menu_and_quit(monkeypatch):
+    pg = setup_dummy_pygame(monkeypatch)
 
     # 
     # menu space -> open level select
@@ -82,16 +86,70 @@ def test_handle_state_transitions_menu_and_quit():
     ev = SimpleNamespace()
     ev.type = pg.KEYDOWN
     ev.key = pg.K_SPACE
-    state, running, action = im.inputManager.handle_state_transitions([ev], GameState.MENU, True)
+    state, running, actions = apply_events([ev], GameState.MENU)
     assert state == GameState.LEVEL_SELECT
     assert running is True
-    assert action == "open_level_select"
+    assert actions == ["open_level_select"]
 
     # 
     # quit event
     #
     ev2 = SimpleNamespace()
     ev2.type = pg.QUIT
-    state2, running2, action2 = im.inputManager.handle_state_transitions([ev2], GameState.PLAYING, True)
+    state2, running2, actions2 = apply_events([ev2], GameState.PLAYING)
     assert running2 is False
-    assert action2 == "quit"
+    assert actions2 == ["quit"]
+
+
+def test_profiler_keys_work_in_any_state(monkeypatch):
+    pg = setup_dummy_pygame(monkeypatch)
+    ev = SimpleNamespace(type=pg.KEYDOWN, key=pg.K_F3)
+    for game_state in (GameState.MENU, GameState.PLAYING, GameState.PAUSED):
+        state, running, actions = apply_events([ev], game_state)
+        assert (state, running, actions) == (game_state, True, ["toggle_profiler"])
+
+    ev.key = pg.K_F4
+    assert apply_events([ev], GameState.PLAYING)[2] == ["dump_profiler"]
+
+
+def keydown(pg, key, **extra):
+    return SimpleNamespace(type=pg.KEYDOWN, key=key, **extra)
+
+
+def test_every_event_in_a_batch_is_applied_in_order(monkeypatch):
+    pg = setup_dummy_pygame(monkeypatch)
+
+    #
+    # Pause and resume in one frame
+    #
+    events = [keydown(pg, pg.K_p), keydown(pg, pg.K_p)]
+    state, running, actions = apply_events(events, GameState.PLAYING)
+    assert (state, actions) == (GameState.PLAYING, ["pause", "resume"])
+
+    #
+    # Menu -> level select, two moves down, one up, start; unmapped keys ignored
+    #
+    events = [keydown(pg, k) for k in (pg.K_SPACE, pg.K_DOWN, pg.K_a, pg.K_DOWN, pg.K_UP, pg.K_RETURN)]
+    state, running, actions = apply_events(events, GameState.MENU)
+    assert state == GameState.PLAYING
+    assert actions == ["open_level_select", "select_next_level", "select_next_level",
+                       "select_prev_level", "start_selected_level"]
+
+    #
+    # Nothing after a quit
+    #
+    events = [keydown(pg, pg.K_ESCAPE), keydown(pg, pg.K_p)]
+    assert apply_events(events, GameState.PLAYING) == (
+        GameState.PLAYING, False, ["quit"])
+
+
+def test_state_events_are_timed_within_the_frame(monkeypatch):
+    pg = setup_dummy_pygame(monkeypatch)
+    events = [
+        keydown(pg, pg.K_p, timestamp=1005),
+        keydown(pg, pg.K_a, timestamp=1008),  # not a state key
+        SimpleNamespace(type=pg.KEYDOWN, key=pg.K_p),  # no timestamp: keeps the last time
+        keydown(pg, pg.K_p, timestamp=1100),  # clamped to the frame
+    ]
+    timed = im.inputManager.state_events(events, 1000, 33)
+    assert [offset for _, offset in timed] == [5, 5, 33]
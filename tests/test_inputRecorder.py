@@ -0,0 +1,136 @@
+import sys
+import os
+from types import SimpleNamespace
+
+#
+# Allow imports from project root
+#
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+
+import breakout
+from Core import config
+from Core.simulation import Action
+from Managers.game_state import GameState
+from Managers.inputManager import inputManager
+from Managers.inputRecorder import FrameInput, inputRecorder, read_recording
+
+
+def test_recording_round_trip(tmp_path):
+    path = str(tmp_path / "session.rec")
+    frames = [
+        FrameInput(16, 0, False, True, "open_level_select", GameState.LEVEL_SELECT, 1),
+        FrameInput(17, -1, True, True, "", GameState.PLAYING, 2),
+        FrameInput(16, 1, False, False, "quit", GameState.PLAYING, 2),
+    ]
+    recorder = inputRecorder(path, 2, 120, 3)
+    for frame in frames:
+        recorder.record(frame)
+    recorder.close()
+
+    assert os.path.getsize(path) == 16 + 10 * len(frames)
+    assert read_recording(path) == (2, 120, 3, frames)
+
+
+def test_long_stalls_record_and_actions_reach_disk(tmp_path):
+    path = str(tmp_path / "stall.rec")
+    recorder = inputRecorder(path, 1, 120)
+    stall = FrameInput(90_000, 0, False, True, "", GameState.PLAYING, 1)  # a 90 s frame
+    recorder.record(stall)
+    recorder.record(FrameInput(16, 0, False, True, "pause", GameState.PAUSED, 1))
+
+    #
+    # Flushed at the state action, before the recorder is closed
+    #
+    assert read_recording(path)[3][0] == stall
+    assert len(read_recording(path)[3]) == 2
+    recorder.close()
+
+
+#
+# Scripted "player": menu -> level select -> level 1, then launch and chase
+# the ball with the paddle, with uneven frame times
+#
+def scripted_session(monkeypatch, game):
+    frame = {"n": 0}
+    presses = {0: breakout.pygame.K_SPACE, 2: breakout.pygame.K_RETURN}
+
+    def keys(state):
+        ball, paddle = game.ball, game.paddle
+        direction = 0.0 if abs(ball.x - paddle.x) < 4 else (1.0 if ball.x > paddle.x else -1.0)
+        return Action(direction, frame["n"] > 5)
+
+    ticks = iter([16, 17, 17, 33, 16, 17, 50, 16] * 200)
+    monkeypatch.setattr(inputManager, "read_action", staticmethod(keys))
+
+    class Clock:
+        def tick(self, fps=0):
+            key = presses.get(frame["n"])
+            if key is not None:
+                breakout.pygame.event.post(breakout.pygame.event.Event(breakout.pygame.KEYDOWN, key=key))
+            frame["n"] += 1
+            return next(ticks)
+    monkeypatch.setattr(game, "clock", Clock())
+
+
+def test_replay_reproduces_recorded_session(tmp_path, monkeypatch):
+    path = str(tmp_path / "session.rec")
+    live = breakout.Game(initial_level=1)
+    scripted_session(monkeypatch, live)
+    live.run(max_frames=1200, recorder=inputRecorder(path, 1, config.PHYSICS_HZ))
+    monkeypatch.undo()
+    assert live.ball_launched
+
+    level, _, _, frames = read_recording(path)
+    assert len(frames) == 1200
+    replayed = breakout.Game(initial_level=level)
+    assert replayed.replay(frames) == 1200
+    assert replayed.game_state == live.game_state
+    assert (replayed.score, replayed.lives) == (live.score, live.lives)
+    assert (replayed.ball.x, replayed.ball.y) == (live.ball.x, live.ball.y)
+    assert replayed.paddle.x == live.paddle.x
+    assert replayed.level_manager.blocks.alive == live.level_manager.blocks.alive
+
+
+def test_events_split_the_frame_at_their_time(tmp_path, monkeypatch):
+    pygame = breakout.pygame
+    path = str(tmp_path / "split.rec")
+    game = breakout.Game(initial_level=1)
+    game.process_actions("start_selected_level")
+    game.game_state = GameState.PLAYING
+
+    #
+    # Pause 10 ms into a 50 ms frame and resume 30 ms in
+    #
+    start = pygame.time.get_ticks() - 50
+    events = [SimpleNamespace(type=pygame.KEYDOWN, key=pygame.K_p, timestamp=start + 10),
+              SimpleNamespace(type=pygame.KEYDOWN, key=pygame.K_p, timestamp=start + 30)]
+    recorder = inputRecorder(path, 1, config.PHYSICS_HZ)
+    alpha, actions = game.run_frame(50, events, Action(1.0, True), recorder)
+    recorder.close()
+
+    assert actions == ["pause", "resume"]
+    assert game.game_state == GameState.PLAYING and alpha is not None
+    _, _, _, frames = read_recording(path)
+    assert [f.action for f in frames] == ["", "pause", "resume"]
+    assert sum(f.dt_ms for f in frames) == 50
+    assert frames[1].state == GameState.PAUSED
+
+    replayed = breakout.Game(initial_level=1)
+    replayed.process_actions("start_selected_level")
+    replayed.game_state = GameState.PLAYING
+    assert replayed.replay(frames) == 3
+    assert replayed.paddle.x == game.paddle.x
+
+
+def test_replay_serves_the_recorded_ball_count(tmp_path, monkeypatch, capsys):
+    path = str(tmp_path / "multi.rec")
+    recorder = inputRecorder(path, 1, config.PHYSICS_HZ, 3)
+    recorder.record(FrameInput(16, 0, False, True, "start_selected_level", GameState.PLAYING, 1))
+    recorder.record(FrameInput(16, 0, True, True, "", GameState.PLAYING, 1))
+    recorder.close()
+
+    monkeypatch.setattr(config, "BALLS", 1)
+    breakout.run_replay(path)
+    assert config.BALLS == 3
+    assert "replaying with 3" in capsys.readouterr().out
@@ -47,6 +47,32 @@ def test_from_file_invalid_coordinates(tmp_path):
     with pytest.raises(ValueError, match="negative grid coordinates"):
         Level.from_file(temp_file)
         
+def test_from_file_palette(tmp_path):
+    level_data = {
+        "palette": ["#FF0000", "#00FF00"],
+        "blocks": [
+            {"x": 0, "y": 0, "color": 1},
+            {"x": 1, "y": 0, "color": 0},
+            {"x": 2, "y": 0, "color": "#00FF00"}
+        ]
+    }
+
+    temp_file = tmp_path / "palette_level.json"
+    temp_file.write_text(json.dumps(level_data))
+    level = Level.from_file(temp_file)
+
+    assert [b.color for b in level.blocks] == ["#00FF00", "#FF0000", "#00FF00"]
+    assert list(level.field.palette) == [0xFF0000, 0x00FF00]
+
+
+def test_from_file_unknown_palette_index(tmp_path):
+    level_data = {"palette": ["#FF0000"], "blocks": [{"x": 0, "y": 0, "color": 3}]}
+
+    temp_file = tmp_path / "palette_level.json"
+    temp_file.write_text(json.dumps(level_data))
+    with pytest.raises(ValueError, match="palette"):
+        Level.from_file(temp_file)
+
 def test_all_levels_load():
     #
     # Test that every levelX.json file in assets/ can be loaded.
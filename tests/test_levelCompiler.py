@@ -0,0 +1,117 @@
+import sys
+import os
+import json
+
+#
+# Allow imports from project root
+#
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+import pytest
+from Objects.level import Level
+from Objects.levelCompiler import HEADER, cache_path, compile_level, load_level, parse_compiled, read_compiled, write_compiled
+from Objects.spatialGrid import SpatialGrid
+
+LEVEL_DATA = {
+    "width": 640,
+    "height": 480,
+    "tile_size": 32,
+    "palette": ["#FF0000", "#00FF00"],
+    "blocks": [
+        {"x": 0, "y": 0, "color": 1},
+        {"x": 1, "y": 0, "type": "hard", "hp": 2, "score": 250, "color": "#0000FF", "width": 20},
+        {"x": 3, "y": 2, "color": 0},
+    ]
+}
+
+
+def write_level(tmp_path, data=LEVEL_DATA):
+    source = tmp_path / "level1.json"
+    source.write_text(json.dumps(data))
+    return str(source)
+
+
+def same_level(a: Level, b: Level) -> bool:
+    fa, fb = a.field, b.field
+    return (
+        (a.width, a.height, a.tile_size) == (b.width, b.height, b.tile_size)
+        and all(getattr(fa, n) == getattr(fb, n)
+                for n in ("x", "y", "width", "height", "hp", "score", "type_id", "color", "palette", "alive"))
+        and fa.types == fb.types and fa.live == fb.live
+    )
+
+
+def test_compiled_round_trip(tmp_path):
+    level = Level.from_file(write_level(tmp_path))
+    path = str(tmp_path / "level1.lvl")
+    write_compiled(level, path, (1, 2))
+
+    loaded = read_compiled(path, (1, 2))
+    assert same_level(level, loaded)
+    assert [b.color for b in loaded.blocks] == ["#00FF00", "#0000FF", "#FF0000"]
+    assert loaded.blocks[1].type == "hard"
+    assert len(loaded.grid.query(0, 0, 32, 32)) == 2
+
+    with pytest.raises(ValueError):
+        read_compiled(path, (1, 3))
+
+
+def test_compiled_level_stores_the_grid(tmp_path):
+    level = Level.from_file(write_level(tmp_path))
+    loaded = parse_compiled(compile_level(level))
+    assert loaded.grid.cells == SpatialGrid.from_field(level.field, level.tile_size).cells
+    assert loaded.grid.cell_size == level.tile_size
+
+
+def test_old_version_is_rejected(tmp_path):
+    data = bytearray(compile_level(Level.from_file(write_level(tmp_path))))
+    data[4:6] = (1).to_bytes(2, "little")
+    with pytest.raises(ValueError):
+        parse_compiled(data)
+    with pytest.raises(ValueError):
+        parse_compiled(bytes(data[:HEADER.size + 4]))
+
+
+def test_load_level_compiles_once_and_reuses_cache(tmp_path):
+    source = write_level(tmp_path)
+    cached = cache_path(source, ".cache")
+    assert not os.path.exists(cached)
+
+    first = load_level(source, ".cache")
+    assert os.path.exists(cached)
+    stamp = os.stat(cached).st_mtime_ns
+
+    second = load_level(source, ".cache")
+    assert os.stat(cached).st_mtime_ns == stamp
+    assert same_level(first, second)
+    assert same_level(second, Level.from_file(source))
+
+
+def test_load_level_recompiles_when_source_changes(tmp_path):
+    source = write_level(tmp_path)
+    load_level(source, ".cache")
+
+    data = dict(LEVEL_DATA, blocks=LEVEL_DATA["blocks"][:1])
+    write_level(tmp_path, data)
+    level = load_level(source, ".cache")
+    assert len(level.field) == 1
+    assert read_compiled(cache_path(source, ".cache")).field.live == 1
+
+
+def test_corrupt_cache_falls_back_to_json(tmp_path):
+    source = write_level(tmp_path)
+    cached = cache_path(source, ".cache")
+    os.makedirs(os.path.dirname(cached))
+    with open(cached, "wb") as fh:
+        fh.write(b"not a level")
+
+    level = load_level(source, ".cache")
+    assert len(level.field) == 3
+    assert same_level(read_compiled(cached), level)
+
+
+def test_cache_disabled(tmp_path):
+    source = write_level(tmp_path)
+    assert cache_path(source, "") is None
+    assert len(load_level(source, "").field) == 3
+    assert os.listdir(tmp_path) == ["level1.json"]
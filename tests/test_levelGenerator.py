@@ -0,0 +1,97 @@
+import sys
+import os
+import json
+
+#
+# Allow imports from project root
+#
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+import pytest
+from Objects.level import Level
+from Objects import levelGenerator
+from Objects.levelGenerator import iter_blocks, layout, parse_hp_weights, write_level
+from Tools import generateLevel
+
+
+def test_generated_level_loads_and_is_reproducible(tmp_path):
+    first = str(tmp_path / "a.json")
+    second = str(tmp_path / "b.json")
+    grid = write_level(first, 500, seed=3, hp_weights={1: 1, 4: 1}, min_size=0.5)
+    write_level(second, 500, seed=3, hp_weights={1: 1, 4: 1}, min_size=0.5)
+    assert open(first).read() == open(second).read()
+
+    level = Level.from_file(first)
+    assert len(level.field) == 500
+    assert level.tile_size == grid.tile_size
+    assert set(level.field.hp) <= {1, 4}
+    assert len({(w, h) for w, h in zip(level.field.width, level.field.height)}) > 1
+    assert json.load(open(first))["title"].startswith("Stress 500")
+
+
+def test_grid_placement_never_overlaps():
+    grid = layout(2000, 0.5)
+    cells = set()
+    for x, y, w, h, hp in iter_blocks(2000, seed=1, density=0.5, min_size=0.2, max_size=2.0, grid=grid):
+        assert w <= grid.tile_size and h <= grid.tile_size
+        cells.add((x, y))
+    assert len(cells) == 2000
+    assert all(x < grid.columns and y < grid.rows for x, y in cells)
+
+
+def test_overlap_placement_stacks_blocks():
+    grid = layout(2000, 4.0)
+    blocks = list(iter_blocks(2000, seed=1, density=4.0, max_size=2.5, placement="overlap", grid=grid))
+    assert len(blocks) == 2000
+    assert len({(x, y) for x, y, *_ in blocks}) < 2000
+    assert max(w for _, _, w, _, _ in blocks) > grid.tile_size
+
+
+def test_large_counts_extend_the_level():
+    grid = layout(1_000_000, 1.0)
+    assert grid.tile_size == 1
+    assert grid.columns * grid.rows >= 1_000_000
+    assert grid.height == grid.rows
+
+
+def test_invalid_parameters_are_rejected():
+    with pytest.raises(ValueError):
+        parse_hp_weights("0:1")
+    with pytest.raises(ValueError):
+        list(iter_blocks(10, density=2.0))
+    with pytest.raises(ValueError):
+        list(iter_blocks(10, placement="spiral"))
+
+
+def test_cli_writes_level(tmp_path, capsys):
+    out = str(tmp_path / "stress.json")
+    assert generateLevel.main([out, "--blocks=300", "--placement=overlap", "--density=2", "--hp=2"]) == 0
+    assert "Wrote 300 blocks" in capsys.readouterr().out
+    assert set(Level.from_file(out).field.hp) == {2}
+
+
+def test_bad_arguments_fail_before_writing(tmp_path):
+    out = str(tmp_path / "stress.json")
+    cases = [
+        (dict(blocks=10, density=0.0), "--density=0"),
+        (dict(blocks=10, density=-1.0), "--density=-1"),
+        (dict(blocks=2_000_000), "--blocks=2000000"),
+        (dict(blocks=10, min_size=0.0), "--min-size=0"),
+        (dict(blocks=10, width=0), "--width=0"),
+    ]
+    for kwargs, arg in cases:
+        with pytest.raises(ValueError):
+            write_level(out, **kwargs)
+        assert generateLevel.main([out, arg]) == 1
+    assert list(tmp_path.iterdir()) == []
+
+
+def test_failed_write_removes_the_temporary_file(tmp_path, monkeypatch):
+    def failing_blocks(*args):
+        yield 0, 0, 8, 8, 1
+        raise OSError("disk full")
+
+    monkeypatch.setattr(levelGenerator, "iter_blocks", failing_blocks)
+    with pytest.raises(OSError):
+        write_level(str(tmp_path / "stress.json"), 10)
+    assert list(tmp_path.iterdir()) == []
@@ -0,0 +1,114 @@
+import sys
+import os
+import json
+import pytest
+
+#
+# Allow imports from project root
+#
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from Managers.levelManifest import levelManifest
+from Managers.scoreManager import scoreManager
+from Objects.level import read_level_entry
+
+
+def write_level(folder, number, blocks, title=None):
+    data = {"blocks": [{"x": i, "y": 0} for i in range(blocks)]}
+    if title:
+        data["title"] = title
+    (folder / f"level{number}.json").write_text(json.dumps(data))
+
+
+def test_scan_finds_levels_with_gaps_and_metadata(tmp_path):
+    write_level(tmp_path, 1, 3, "Intro")
+    write_level(tmp_path, 4, 5)
+    (tmp_path / "notes.txt").write_text("not a level")
+
+    manifest = levelManifest(str(tmp_path), cache_dir="")
+    assert manifest.numbers() == [1, 4]
+    assert manifest.get(1).title == "Intro"
+    assert manifest.get(1).blocks == 3
+    assert manifest.get(4).title == "Level 4"
+    assert manifest.next_number(1) == 4
+    assert manifest.next_number(4) is None
+
+
+def test_entry_reads_title_and_block_count(tmp_path):
+    path = tmp_path / "level2.json"
+    path.write_text(json.dumps({"title": 'Say "hi"', "blocks": [
+        {"x": 0, "y": 0, "extra": {"nested": [1, 2]}},
+        {"x": 1, "y": 0, "type": "hard"},
+    ]}, indent=4))
+    entry = read_level_entry(2, str(path))
+    assert (entry.blocks, entry.title) == (2, 'Say "hi"')
+
+    path.write_text("not json")
+    entry = read_level_entry(2, str(path))
+    assert (entry.blocks, entry.title) == (0, "Level 2")
+    assert read_level_entry(2, str(tmp_path / "missing.json")).blocks == 0
+
+
+def test_queries_do_not_rescan(tmp_path, monkeypatch):
+    write_level(tmp_path, 1, 2)
+    manifest = levelManifest(str(tmp_path), cache_dir="")
+    assert manifest.scans == 1
+
+    monkeypatch.setattr(os, "scandir", lambda *a: pytest.fail("queries must not scan"))
+    monkeypatch.setattr(os, "stat", lambda *a, **k: pytest.fail("queries must not stat"))
+    assert manifest.numbers() == [1]
+    assert manifest.get(1).blocks == 2
+    assert len(manifest) == 1
+    assert manifest.next_number(0) == 1
+
+
+def test_refresh_rereads_only_changed_files(tmp_path, monkeypatch):
+    write_level(tmp_path, 1, 2)
+    write_level(tmp_path, 2, 3)
+    manifest = levelManifest(str(tmp_path), cache_dir=".cache")
+
+    opened = []
+    read_entry = levelManifest.read_entry
+    monkeypatch.setattr(levelManifest, "read_entry",
+                        staticmethod(lambda n, *a: opened.append(n) or read_entry(n, *a)))
+    assert manifest.refresh() is False  # creating .cache/ changed nothing
+    assert opened == []
+
+    #
+    # Level 1 is edited in place, which leaves the directory's mtime alone,
+    # and level 3 is added: both are read, level 2 is not
+    #
+    write_level(tmp_path, 1, 7)
+    write_level(tmp_path, 3, 1)
+    assert manifest.numbers() == [1, 2]  # until refreshed
+    assert manifest.refresh() is True
+    assert sorted(opened) == [1, 3]
+    assert manifest.numbers() == [1, 2, 3]
+    assert manifest.get(1).blocks == 7
+
+
+def test_saved_manifest_avoids_reopening_files(tmp_path, monkeypatch):
+    write_level(tmp_path, 1, 2, "Saved")
+    levelManifest(str(tmp_path), cache_dir=".cache").numbers()
+    assert os.path.exists(tmp_path / ".cache" / "manifest.json")
+
+    def fail(*args):
+        raise AssertionError("level file reopened")
+    monkeypatch.setattr(levelManifest, "read_entry", staticmethod(fail))
+    manifest = levelManifest(str(tmp_path), cache_dir=".cache")
+    assert manifest.get(1).title == "Saved"
+
+
+def test_score_manager_skips_numbering_gaps(tmp_path):
+    write_level(tmp_path, 1, 1)
+    write_level(tmp_path, 3, 2)
+
+    sm = scoreManager(levels_dir=str(tmp_path))
+    assert sm.get_available_levels() == [1, 3]
+    assert sm.total_levels == 2
+    assert sm.level_exists(2) is False
+    assert sm.load_level(1) is True
+    assert sm.is_last_level() is False
+    assert sm.next_level()[0] is True
+    assert sm.current_level == 3
+    assert sm.is_last_level() is True
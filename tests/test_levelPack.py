@@ -0,0 +1,93 @@
+import sys
+import os
+import json
+
+#
+# Allow imports from project root
+#
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+import pytest
+from Managers.scoreManager import scoreManager
+from Objects.level import Level
+from Objects.levelPack import LevelPack, build_pack
+from Tools import buildLevelPack
+
+
+def write_levels(folder):
+    (folder / "level1.json").write_text(json.dumps({
+        "title": "First", "blocks": [{"x": 0, "y": 0, "color": "#FF0000"}, {"x": 2, "y": 1, "hp": 3}]}))
+    (folder / "level5.json").write_text(json.dumps({
+        "tile_size": 20, "blocks": [{"x": i, "y": 0, "type": "hard"} for i in range(7)]}))
+    (folder / "readme.json").write_text("{}")
+
+
+def test_pack_index_and_random_access(tmp_path):
+    write_levels(tmp_path)
+    path = str(tmp_path / "levels.pack")
+    assert build_pack(str(tmp_path), path) == [1, 5]
+
+    pack = LevelPack(path)
+    try:
+        assert pack.numbers() == [1, 5]
+        assert pack.get(1).title == "First"
+        assert pack.get(5).blocks == 7
+        assert pack.next_number(1) == 5
+
+        level = pack.load(5)
+        source = Level.from_file(str(tmp_path / "level5.json"))
+        assert level.tile_size == 20
+        assert [b.rect() for b in level.blocks] == [b.rect() for b in source.blocks]
+        assert {b.type for b in level.blocks} == {"hard"}
+        assert pack.load(1).blocks[1].hp == 3
+        with pytest.raises(KeyError):
+            pack.load(2)
+    finally:
+        pack.close()
+
+
+def test_not_a_pack(tmp_path):
+    path = tmp_path / "bad.pack"
+    path.write_bytes(b"nothing here")
+    with pytest.raises(ValueError):
+        LevelPack(str(path))
+
+
+def test_score_manager_reads_from_pack(tmp_path):
+    write_levels(tmp_path)
+    path = str(tmp_path / "levels.pack")
+    assert buildLevelPack.main([str(tmp_path), f"--out={path}"]) == 0
+
+    sm = scoreManager(pack_path=path)
+    assert sm.get_available_levels() == [1, 5]
+    assert sm.load_level(1) is True
+    assert sm.blocks.live == 2
+    assert sm.next_level()[0] is True
+    assert sm.current_level == 5
+    assert sm.is_last_level() is True
+    sm.manifest.close()
+
+
+def test_unreadable_pack_falls_back_to_levels_dir(tmp_path, capsys):
+    write_levels(tmp_path)
+    path = tmp_path / "levels.pack"
+    build_pack(str(tmp_path), str(path))
+    data = bytearray(path.read_bytes())
+
+    old = tmp_path / "old.pack"
+    old.write_bytes(data[:4] + (1).to_bytes(2, "little") + data[6:])
+    corrupt = tmp_path / "corrupt.pack"
+    corrupt.write_bytes(data[:len(data) // 2])
+    for bad in (old, corrupt):
+        sm = scoreManager(levels_dir=str(tmp_path), pack_path=str(bad))
+        assert not isinstance(sm.manifest, LevelPack)
+        assert sm.get_available_levels() == [1, 5]
+        assert sm.load_level(5) is True
+        assert "Warning: ignoring level pack" in capsys.readouterr().out
+
+
+def test_builder_writes_no_pack_without_levels(tmp_path, capsys):
+    path = tmp_path / "levels.pack"
+    assert buildLevelPack.main([str(tmp_path), f"--out={path}"]) == 1
+    assert "No level files found" in capsys.readouterr().out
+    assert not path.exists()
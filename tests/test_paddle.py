@@ -57,3 +57,11 @@ def test_rect_returns_expected_tuple():
     p = Paddle(x=50, y=10, width=20, height=6, speed=10)
     assert p.rect() == (int(50 - 10), int(10 - 3), 20, 6)
 
+
+def test_render_rect_interpolates_between_steps():
+    p = Paddle(x=50, y=10, width=20, height=6, speed=10)
+    p.snapshot()
+    p.move(direction=1, dt=1.0)
+    assert p.render_rect(0.0) == (int(50 - 10), int(10 - 3), 20, 6)
+    assert p.render_rect(0.5) == (int(55 - 10), int(10 - 3), 20, 6)
+    assert p.render_rect(1.0) == p.rect()
@@ -0,0 +1,74 @@
+import sys
+import os
+import pytest
+
+#
+# Allow imports from project root
+#
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+np = pytest.importorskip("numpy")
+
+import pygame
+from Core import config
+from UI.particles import MIN_QUALITY, SPEED, particleSystem
+
+
+def test_burst_fills_slots_and_particles_expire():
+    particles = particleSystem(capacity=64, burst=10)
+    assert particles.burst(100, 50, 0xFF0000) == 10
+    assert particles.head == 10
+    particles.update(1 / 120)
+    assert len(particles) == 10
+    assert np.all(particles.y[:10] != 50) or np.all(particles.x[:10] != 100)
+
+    for _ in range(int(config.PARTICLE_LIFE * 120) + 2):
+        particles.update(1 / 120)
+    assert len(particles) == 0
+
+
+def test_pool_recycles_without_growing():
+    particles = particleSystem(capacity=32, burst=10)
+    arrays = (particles.x, particles.y, particles.life)
+    for _ in range(10):
+        particles.burst(10, 10, 0x00FF00)
+    assert particles.head < 32
+    assert (particles.x, particles.y, particles.life) == arrays
+    assert len(particles.x) == 32
+    assert len(particles.sprites) == 3  # one colour, rendered once per size
+
+
+def test_quality_drops_when_pool_is_saturated():
+    particles = particleSystem(capacity=40, burst=20)
+    particles.burst(0, 0, 0xFFFFFF)
+    particles.update(0.001)
+    assert particles.quality == 1.0
+
+    particles.burst(0, 0, 0xFFFFFF)
+    particles.update(0.001)
+    assert particles.quality == MIN_QUALITY
+    assert particles.burst(0, 0, 0xFFFFFF) == int(20 * MIN_QUALITY)
+
+    particles.clear()
+    assert particles.quality == 1.0 and len(particles) == 0
+
+
+def test_draw_blits_live_particles_and_returns_area():
+    surface = pygame.Surface((200, 200))
+    particles = particleSystem(capacity=64, burst=16)
+    assert particles.draw(surface) is None
+
+    particles.burst(100, 100, 0x0000FF)
+    area = particles.draw(surface)
+    assert area.collidepoint(100, 100)
+    assert surface.get_at((100, 100))[:3] == (0, 0, 255)
+
+
+def test_burst_values_stay_in_range():
+    system = particleSystem(capacity=256, burst=64, seed=3)
+    system.burst(10.0, 20.0, 0x00FF00)
+    speed = np.hypot(system.vx[:64], system.vy[:64])
+    assert speed.min() >= SPEED[0] - 1e-9 and speed.max() <= SPEED[1] + 1e-9
+    life = system.life[:64]
+    assert life.min() >= 0.5 * config.PARTICLE_LIFE and life.max() < config.PARTICLE_LIFE
+    assert len(np.unique(np.round(np.arctan2(system.vy[:64], system.vx[:64]), 6))) == 64
@@ -0,0 +1,61 @@
+import sys
+import os
+
+#
+# Allow imports from project root
+#
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+import pygame
+from UI.presenter import presenter
+
+
+def record_presents(monkeypatch):
+    calls = []
+    monkeypatch.setattr(pygame.display, "flip", lambda: calls.append("flip"))
+    monkeypatch.setattr(pygame.display, "update", lambda rects: calls.append(sorted(tuple(r) for r in rects)))
+    return calls
+
+
+def test_dirty_mode_presents_changed_regions_once(monkeypatch):
+    calls = record_presents(monkeypatch)
+    p = presenter("dirty")
+
+    #
+    # First frame is always a full flip
+    #
+    p.mark((10, 10, 5, 5))
+    p.present()
+    assert calls == ["flip"]
+
+    #
+    # Moved object: old and new position, plus a one-off damaged area
+    #
+    p.mark((20, 10, 5, 5))
+    p.damage((100, 100, 10, 10))
+    p.present()
+    assert calls[-1] == [(10, 10, 5, 5), (20, 10, 5, 5), (100, 100, 10, 10)]
+
+    #
+    # Damage is not repeated; the last mark is presented once more
+    #
+    p.present()
+    assert calls[-1] == [(20, 10, 5, 5)]
+    assert len(calls) == 3
+
+
+def test_full_and_flip_mode_flip_whole_screen(monkeypatch):
+    calls = record_presents(monkeypatch)
+
+    p = presenter("dirty")
+    p.present()
+    p.full()
+    p.mark((0, 0, 1, 1))
+    p.present()
+    assert calls == ["flip", "flip"]
+
+    p = presenter("flip")
+    p.present()
+    p.mark((0, 0, 1, 1))
+    p.present()
+    assert calls == ["flip"] * 4
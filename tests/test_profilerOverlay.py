@@ -0,0 +1,38 @@
+import sys
+import os
+
+#
+# Allow imports from project root
+#
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+import pygame
+from Core.frameTimer import FrameTimer
+from UI.profilerOverlay import TEXT_EVERY, profilerOverlay
+
+
+def record(timer, frames):
+    for _ in range(frames):
+        timer.begin_frame()
+        for phase in timer.phases:
+            timer.mark(phase)
+        timer.end_frame()
+
+
+def test_text_refreshes_after_the_timer_is_cleared():
+    screen = pygame.Surface((800, 600))
+    timer = FrameTimer(capacity=256, enabled=True)
+    overlay = profilerOverlay()
+
+    record(timer, 3 * TEXT_EVERY)
+    overlay.draw(screen, timer)
+    assert overlay.frames_at_text == 3 * TEXT_EVERY
+
+    #
+    # Toggling the profiler clears the timer; the next draw must not keep
+    # showing the old numbers until the counter catches up
+    #
+    timer.clear()
+    record(timer, 2)
+    overlay.draw(screen, timer)
+    assert overlay.frames_at_text == 2
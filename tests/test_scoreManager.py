@@ -1,6 +1,7 @@
 import sys
 import os
 import pytest
+import json
 
 # 
 # Allow imports from project root
@@ -8,6 +9,7 @@ import pytest
 sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
 
 from Managers.scoreManager import scoreManager
+from Objects.blockField import BlockField
 
 
 def get_levels_dir():
@@ -27,7 +29,7 @@ def test_level_exists_and_load():
     loaded = sm.load_level(1)
     assert loaded is True
     assert sm.level is not None
-    assert isinstance(sm.blocks, list)
+    assert isinstance(sm.blocks, BlockField)
 
     info = sm.get_level_info()
     assert info.get('number') == 1
@@ -65,8 +67,8 @@ def test_level_completion_percentage_changes_after_removing_blocks():
     # 
     # simulate destroying one block
     #
-    if sm.blocks:
-        sm.blocks.pop()
+    if sm.blocks.live:
+        sm.blocks.kill(sm.blocks.alive_indices()[-1])
     pct_after = sm.get_level_completion_percentage()
     assert pct_after >= 0.0
     assert pct_after != pct_before
@@ -101,3 +103,55 @@ def test_load_all_available_levels():
             failures.append((n, "failed to load"))
 
     assert failures == [], f"Some levels failed to load: {failures}"
+
+
+def write_levels(tmp_path, count):
+    for n in range(1, count + 1):
+        blocks = [{"x": i, "y": 0} for i in range(n)]
+        (tmp_path / f"level{n}.json").write_text(json.dumps({"blocks": blocks}))
+    return str(tmp_path)
+
+
+def test_parsed_levels_are_cached_and_evicted(tmp_path):
+    sm = scoreManager(levels_dir=write_levels(tmp_path, 3), cache_size=2)
+
+    assert sm.load_level(1) is True
+    first = sm.level
+    assert sm.load_level(1) is True
+    assert sm.level is first
+    assert sm.blocks is not first.field  # still a fresh live copy
+
+    sm.load_level(2)
+    sm.load_level(3)
+    for thread in list(sm.prefetches.values()):
+        thread.join()
+    assert list(sm.cache) == [2, 3]
+    assert sm.get_level(1) is not first
+
+
+def test_edited_level_is_not_served_from_cache(tmp_path):
+    sm = scoreManager(levels_dir=write_levels(tmp_path, 2))
+    assert sm.load_level(2) is True
+    assert sm.blocks.live == 2
+
+    path = tmp_path / "level2.json"
+    path.write_text(json.dumps({"blocks": [{"x": i, "y": 1} for i in range(5)]}))
+    st = os.stat(path)
+    os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000_000))
+    assert sm.load_level(2) is True
+    assert sm.blocks.live == 5
+
+
+def test_next_level_is_prefetched(tmp_path):
+    sm = scoreManager(levels_dir=write_levels(tmp_path, 2))
+    assert sm.load_level(1) is True
+
+    thread = sm.prefetches.get(2)
+    if thread is not None:
+        thread.join()
+    assert 2 in sm.cache
+
+    prefetched = sm.cache[2][1]
+    assert sm.next_level()[0] is True
+    assert sm.level is prefetched
+    assert sm.blocks.live == 2
@@ -0,0 +1,51 @@
+import sys
+import os
+import pstats
+
+#
+# Allow imports from project root
+#
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from Core.sessionProfiler import SessionProfiler
+from Managers.game_state import GameState
+
+
+def menu_work():
+    return sorted(str(i) for i in range(200))
+
+
+def playing_work():
+    return [bytearray(64) for _ in range(200)]
+
+
+def test_profiles_are_split_by_state_and_level(tmp_path):
+    profiler = SessionProfiler(str(tmp_path), memory=True)
+    kept = []
+    for state, level, work in [
+        (GameState.MENU, 1, menu_work),
+        (GameState.LEVEL_SELECT, 1, menu_work),
+        (GameState.PLAYING, 1, playing_work),
+        (GameState.PLAYING, 1, playing_work),
+        (GameState.PLAYING, 2, playing_work),
+        (GameState.MENU, 2, menu_work),
+    ]:
+        profiler.switch(state, level)
+        kept.append(work())
+    written = profiler.close()
+
+    names = sorted(os.path.basename(p) for p in written if p.endswith(".pstats"))
+    assert names == ["LEVEL_SELECT.pstats", "MENU.pstats", "PLAYING_level1.pstats", "PLAYING_level2.pstats"]
+    assert profiler.frames[("PLAYING", 1)] == 2
+    assert profiler.frames[("MENU", None)] == 2
+
+    def functions(name):
+        stats = pstats.Stats(str(tmp_path / name))
+        return {func for _, _, func in stats.stats}
+
+    assert "playing_work" in functions("PLAYING_level1.pstats")
+    assert "playing_work" not in functions("MENU.pstats")
+    assert "menu_work" in functions("MENU.pstats")
+
+    alloc = (tmp_path / "PLAYING_level1.alloc.txt").read_text()
+    assert "test_sessionProfiler.py" in alloc
@@ -0,0 +1,117 @@
+import sys
+import os
+import subprocess
+import pytest
+
+#
+# Allow imports from project root
+#
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from Core import config
+from Core.simulation import Action, NOOP, Simulation, autoplay_action
+from Managers.game_state import GameState
+from Objects.block import Block
+from Objects.level import Level
+
+
+def make_level(blocks):
+    return Level(config.SCREEN_WIDTH, config.SCREEN_HEIGHT, config.TILE_SIZE, blocks)
+
+
+def test_simulation_imports_without_pygame():
+    repo_root = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+    code = "import sys, Core.simulation; sys.exit('pygame' in sys.modules)"
+    result = subprocess.run([sys.executable, "-c", code], cwd=repo_root)
+    assert result.returncode == 0
+
+
+def test_ball_stays_on_paddle_until_launch():
+    sim = Simulation()
+    assert sim.reset(make_level([Block(0, 0, 40, 20)]))
+
+    sim.step(Action(1.0, False), 0.1)
+    assert sim.ball_launched is False
+    assert sim.ball.x == pytest.approx(sim.paddle.x)
+
+    sim.step(Action(0.0, True), 0.1)
+    assert sim.ball_launched is True
+
+
+def test_life_loss_and_game_over():
+    sim = Simulation(lives=2)
+    assert sim.reset(make_level([Block(0, 0, 40, 20)]))
+    sim.ball_launched = True
+
+    #
+    # Drop the ball below the screen twice
+    #
+    for expected_lives in (1, 0):
+        sim.ball_launched = True
+        sim.ball.x = 50.0
+        sim.ball.y = config.SCREEN_HEIGHT + 50
+        sim.ball.vx, sim.ball.vy = 0.0, 1.0
+        state = sim.step(NOOP, 1 / 120)
+        assert sim.lives == expected_lives
+
+    assert state == GameState.GAME_OVER
+    assert sim.step(NOOP, 1 / 120) == GameState.GAME_OVER
+
+
+def test_autoplay_clears_single_block_level():
+    block = Block(config.SCREEN_WIDTH // 2 - 20, 100, 40, 20, score=250)
+    sim = Simulation()
+    assert sim.reset(make_level([block]))
+
+    state = GameState.PLAYING
+    for _ in range(120 * 60):
+        state = sim.step(autoplay_action(sim), 1 / 120)
+        if state != GameState.PLAYING:
+            break
+
+    assert state == GameState.LEVEL_COMPLETE
+    assert sim.score == 250
+    assert sim.lives == 3
+
+
+def test_multiball_launch_fan_and_last_ball_costs_a_life():
+    sim = Simulation(balls=5)
+    assert sim.reset(make_level([Block(0, 0, 40, 20)]))
+    assert len(sim.balls) == 5 and not sim.ball_launched
+    assert len({ball.x for ball in sim.balls}) == 5
+
+    sim.step(Action(0.0, True), 1 / 120)
+    assert sim.ball_launched
+    directions = [ball.vx for ball in sim.balls]
+    assert directions == sorted(directions)
+    assert directions[0] < 0 < directions[-1]
+    assert directions[2] == pytest.approx(0.0)
+
+    #
+    # Dropping four balls keeps the life; the fifth loses it and serves five more
+    #
+    for ball in sim.balls[:4]:
+        ball.y = config.SCREEN_HEIGHT + 50
+        ball.vx, ball.vy = 0.0, 1.0
+    sim.step(NOOP, 1 / 120)
+    assert len(sim.balls) == 1 and sim.lives == 3
+
+    sim.ball.y = config.SCREEN_HEIGHT + 50
+    sim.ball.vx, sim.ball.vy = 0.0, 1.0
+    sim.step(NOOP, 1 / 120)
+    assert sim.lives == 2
+    assert len(sim.balls) == 5 and not sim.ball_launched
+
+
+def test_many_balls_break_blocks_together():
+    blocks = [Block(x * 40, 60 + y * 20, 40, 20) for x in range(20) for y in range(3)]
+    sim = Simulation(balls=50)
+    assert sim.reset(make_level(blocks))
+
+    for _ in range(120 * 10):
+        sim.step(autoplay_action(sim), 1 / 120)
+
+    field = sim.level_manager.blocks
+    assert field.live < len(blocks) // 4
+    assert sim.score == 100 * (len(blocks) - field.live)
+    assert 0 < len(sim.balls) < 50
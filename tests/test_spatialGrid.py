@@ -0,0 +1,79 @@
+import sys
+import os
+
+#
+# Allow imports from project root
+#
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from Objects.block import Block
+from Objects.blockField import BlockField
+from Objects.spatialGrid import SpatialGrid
+
+
+def test_block_spanning_cells_is_indexed_in_each():
+    #
+    # 50px wide block on a 40px grid touches two columns
+    #
+    field = BlockField.from_blocks([Block(x=40, y=40, width=50, height=20)])
+    grid = SpatialGrid.from_field(field, cell_size=40)
+
+    assert (1, 1) in grid.cells
+    assert (2, 1) in grid.cells
+    assert grid.query(85, 45, 2, 2) == [0]
+
+
+def test_query_only_returns_nearby_blocks_once():
+    field = BlockField.from_blocks([
+        Block(x=0, y=0, width=80, height=20),
+        Block(x=400, y=400, width=40, height=20),
+    ])
+    grid = SpatialGrid.from_field(field, cell_size=40)
+
+    found = grid.query(30, 5, 20, 10)
+    assert found == [0]
+
+
+def test_remove_only_drops_that_block():
+    #
+    # Two blocks on the same spot keep separate entries
+    #
+    field = BlockField.from_blocks([
+        Block(x=0, y=0, width=20, height=20),
+        Block(x=0, y=0, width=20, height=20),
+    ])
+    grid = SpatialGrid.from_field(field, cell_size=40)
+
+    grid.remove(0, *field.rect(0))
+    assert grid.query(0, 0, 10, 10) == [1]
+
+    grid.remove(1, *field.rect(1))
+    assert grid.cells == {}
+
+
+def test_copy_is_independent():
+    field = BlockField.from_blocks([Block(x=0, y=0, width=20, height=20)])
+    grid = SpatialGrid.from_field(field, cell_size=40)
+    clone = grid.copy()
+
+    clone.remove(0, *field.rect(0))
+    assert grid.query(0, 0, 10, 10) == [0]
+    assert len(clone.query(0, 0, 10, 10)) == 0
+
+
+def test_copies_share_cells_until_changed():
+    field = BlockField.from_blocks([Block(x=0, y=0, width=40, height=20), Block(x=10, y=0, width=20, height=20)])
+    template = SpatialGrid.from_field(field, cell_size=40)
+    first = template.copy()
+    second = first.copy()
+    assert first.cells[(0, 0)] is template.cells[(0, 0)]
+
+    first.remove(0, *field.rect(0))
+    second.insert(7, 0, 0, 5, 5)
+    assert first.cells[(0, 0)] == [1]
+    assert second.cells[(0, 0)] == [0, 1, 7]
+    assert template.cells[(0, 0)] == [0, 1]
+
+    template.remove(1, *field.rect(1))
+    assert template.cells[(0, 0)] == [0]
+    assert first.cells[(0, 0)] == [1]
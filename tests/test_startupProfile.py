@@ -0,0 +1,39 @@
+import sys
+import os
+import subprocess
+
+#
+# Allow imports from project root
+#
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+sys.path.append(ROOT)
+
+from Core.startupProfile import StartupProfile
+
+
+def test_phases_are_recorded_in_order():
+    profile = StartupProfile()
+    with profile.phase("import", "a"):
+        pass
+    with profile.phase("init", "b"):
+        pass
+    profile.frame_presented()
+
+    assert [(kind, name) for kind, name, _ in profile.phases] == [("import", "a"), ("init", "b")]
+    assert profile.first_frame is not None
+    report = profile.report()
+    assert "import" in report and "init" in report and "first frame" in report
+
+
+def test_disabled_profile_records_nothing():
+    profile = StartupProfile(enabled=False)
+    with profile.phase("init", "a"):
+        pass
+    profile.frame_presented()
+    assert profile.phases == []
+    assert profile.first_frame is None
+
+
+def test_headless_start_does_not_import_pygame():
+    code = "import sys, breakout; sys.exit(int(any(m in sys.modules for m in ('pygame', 'turtle'))))"
+    assert subprocess.run([sys.executable, "-c", code], cwd=ROOT).returncode == 0
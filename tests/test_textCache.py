@@ -0,0 +1,68 @@
+import sys
+import os
+
+#
+# Allow imports from project root
+#
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+import pygame
+from UI.textCache import textCache
+
+WHITE = (255, 255, 255)
+
+
+#
+# Other tests may shut pygame down, so each test starts the font module
+#
+def make_font():
+    pygame.font.init()
+    return pygame.font.Font(None, 24)
+
+
+def test_repeated_text_is_rendered_once():
+    font = make_font()
+    cache = textCache()
+    first = cache.render(font, "Score: 0", True, WHITE)
+    second = cache.render(font, "Score: 0", True, [255, 255, 255])
+    assert first is second
+    assert cache.hits == 1 and cache.misses == 1
+
+    #
+    # Colour and antialias are part of the key
+    #
+    assert cache.render(font, "Score: 0", False, WHITE) is not first
+    assert cache.render(font, "Score: 0", True, (255, 0, 0)) is not first
+    assert len(cache) == 3
+
+
+def test_least_recently_used_entry_is_evicted():
+    font = make_font()
+    cache = textCache(max_entries=2)
+    a = cache.render(font, "a", True, WHITE)
+    cache.render(font, "b", True, WHITE)
+    cache.render(font, "a", True, WHITE)
+    cache.render(font, "c", True, WHITE)
+    assert len(cache) == 2
+    assert cache.render(font, "a", True, WHITE) is a
+    misses = cache.misses
+    cache.render(font, "b", True, WHITE)
+    assert cache.misses == misses + 1
+
+
+def test_memory_cap():
+    font = make_font()
+    probe = font.render("0123456789", True, WHITE)
+    size = textCache.surface_bytes(probe)
+    cache = textCache(max_bytes=size * 2)
+    for text in ("0123456789", "1234567890", "2345678901", "3456789012"):
+        cache.render(font, text, True, WHITE)
+        assert cache.bytes <= size * 2
+    assert len(cache) <= 2
+
+    #
+    # Surfaces larger than the cap are returned but not kept
+    #
+    tiny = textCache(max_bytes=1)
+    assert tiny.render(font, "too big", True, WHITE) is not None
+    assert len(tiny) == 0 and tiny.bytes == 0